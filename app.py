@@ -13,9 +13,6 @@ from pathlib import Path
 from datetime import datetime
 import io
 
-# 🆕 PyMuPDF import 추가
-import fitz  # PyMuPDF
-
 # 프로젝트 루트를 Python 경로에 추가
 current_dir = Path(__file__).parent
 if str(current_dir) not in sys.path:
@@ -24,7 +21,11 @@ if str(current_dir) not in sys.path:
 # 백엔드 모듈 import
 from backend import (
     PDFProcessor,
+    SpooledPDF,
+    SpoolTracker,
+    DataCleaner,
     process_pdf_page,
+    process_pdf_pages,
     ExcelIncrementalSaver,  # 🆕 추가
     STRAINS,
     FallbackManager,
@@ -50,6 +51,17 @@ if "current_page" not in st.session_state:
 
 if "saved_pages" not in st.session_state:
     st.session_state.saved_pages = set()
+
+# 🆕 Excel 저장 여부 (다운로드 버튼 표시용, rerun마다 파일 확인 방지)
+if "excel_has_data" not in st.session_state:
+    st.session_state.excel_has_data = False
+
+# 🆕 전체 현황 집계 (번들 추가/수정 시에만 갱신)
+if "total_records" not in st.session_state:
+    st.session_state.total_records = 0
+
+if "file_stats" not in st.session_state:
+    st.session_state.file_stats = {}
     
 
 # 🆕 마지막 날짜 정보 저장
@@ -65,15 +77,20 @@ if "fallback_manager" not in st.session_state:
 if "current_file_name" not in st.session_state:
     st.session_state.current_file_name = None
 
-if "current_file_bytes" not in st.session_state:
-    st.session_state.current_file_bytes = None
+# 🆕 DRM 처리된 PDF는 디스크에 두고 경로만 보관 (세션 메모리 절약)
+if "current_file_path" not in st.session_state:
+    st.session_state.current_file_path = None
+
+# 🆕 세션이 만든 임시 PDF (파일 전환/초기화/세션 종료 시 삭제)
+if "pdf_spool" not in st.session_state:
+    st.session_state.pdf_spool = SpoolTracker()
 
 if "confirm_reset" not in st.session_state:
     st.session_state.confirm_reset = False
     
 # 세션 초기화에 추가
 if 'processed_files' not in st.session_state:
-    st.session_state.processed_files = {}  # {file_name: processed_bytes}
+    st.session_state.processed_files = {}  # {file_id: {'path', 'hash', ...}}
 
 if "excel_saver" not in st.session_state:
     temp_dir = tempfile.gettempdir()
@@ -83,9 +100,119 @@ if "excel_saver" not in st.session_state:
         template_file=None
     )
     st.session_state.excel_path = excel_path
+
+if "current_file_hash" not in st.session_state:
+    st.session_state.current_file_hash = None
+
+
+# 🆕 PDF 미리보기 렌더링 캐시 (파일 해시 + 페이지 + 배율 기준)
+@st.cache_data(max_entries=64, show_spinner=False)
+def _render_page_cached(pdf_hash, _pdf_path, page_index, zoom):
+    """PDF 페이지 렌더링 캐시 (_pdf_path는 해시하지 않고 pdf_hash로 식별, 미리보기용 JPEG)"""
+    return PDFProcessor.render_page_image(_pdf_path, page_index, zoom=zoom, image_format="jpeg")
+
+
+# 🆕 미리보기 품질 → 렌더링 배율 (배율 제곱에 비례해 렌더링 비용 증가)
+PREVIEW_ZOOM = {'빠름': 1.25, '보통': 1.75, '고화질': 2.5}
+
+
+@st.cache_data(show_spinner=False)
+def _page_count_cached(pdf_hash, _pdf_path):
+    """PDF 페이지 수 캐시 (업로드 파일당 1회만 문서 열기)"""
+    return PDFProcessor.extract_page_count(_pdf_path)
+
+
+# 🆕 전체 OCR 병렬 처리 설정 (API 호출 한도 고려)
+OCR_MAX_WORKERS = 8
+OCR_MAX_RETRIES = 3
+
+
+def _bundle_len(b):
+    """번들의 레코드 수 (DataFrame 또는 {"table": DataFrame} 형식)"""
+    try:
+        if isinstance(b, pd.DataFrame):
+            return len(b)
+        table = b.get("table") if isinstance(b, dict) else None
+        return len(table) if isinstance(table, pd.DataFrame) else 0
+    except Exception:
+        return 0
+
+
+# 🆕 OCR 테이블은 전부 문자열 → Arrow 문자열 dtype으로 보관 (data_editor 전송 시 변환 비용 절감)
+OCR_STRING_DTYPE = "string[pyarrow]"
+
+
+def _to_ocr_frame(data):
+    """OCR 결과(리스트/DataFrame)를 Arrow 문자열 DataFrame으로 변환 (결측은 빈 문자열)"""
+    df = data if isinstance(data, pd.DataFrame) else DataCleaner.rows_to_frame(data)
+    return df.astype(object).where(df.notna(), '').astype(OCR_STRING_DTYPE)
+
+
+def _has_date(df_date):
+    """날짜 DataFrame에 값이 하나라도 있는지 확인"""
+    return not df_date.empty and bool(df_date.iloc[0].notna().any())
+
+
+def _set_bundle(key, df_table, df_date):
+    """OCR 번들 저장 + 전체 현황 집계 증분 갱신"""
+    file_name = key[0]
+    prev = st.session_state.ocr_data_frames.get(key)
+    
+    # 🆕 날짜 유무는 저장 시 1회만 계산 (같은 날짜 DataFrame이면 이전 값 재사용)
+    if isinstance(prev, dict) and prev.get("date") is df_date and "has_date" in prev:
+        has_date = prev["has_date"]
+    else:
+        has_date = _has_date(df_date)
+    
+    delta = len(df_table) - (_bundle_len(prev) if prev is not None else 0)
+    
+    stats = st.session_state.file_stats.setdefault(file_name, {'pages': 0, 'records': 0})
+    if prev is None:
+        stats['pages'] += 1
+    stats['records'] += delta
+    st.session_state.total_records += delta
+    
+    st.session_state.ocr_data_frames[key] = {"table": df_table, "date": df_date, "has_date": has_date}
+
+
+def _resolve_date_frame(date_raw):
+    """OCR 날짜 정보를 DataFrame으로 변환 (없으면 이전 페이지 날짜 재사용)"""
+    if date_raw and any(date_raw.values()):
+        # 새로운 날짜 정보가 있으면 저장
+        st.session_state.last_date_info = date_raw.copy()
+        logger.info(f"📅 새로운 날짜 정보 저장: {date_raw}")
+        return pd.DataFrame([date_raw])
+    elif st.session_state.last_date_info:
+        # 날짜 정보가 없으면 이전 값 재사용
+        logger.info(f"🔄 이전 날짜 정보 재사용: {st.session_state.last_date_info}")
+        return pd.DataFrame([st.session_state.last_date_info])
+    else:
+        # 날짜 정보가 전혀 없는 경우
+        logger.warning("⚠️ 날짜 정보 없음")
+        return pd.DataFrame()
+
+# 🆕 데이터 에디터 컬럼 설정 (프로세스당 1회 생성, rerun마다 재생성 방지)
+@st.cache_resource
+def _build_col_config():
+    """OCR 결과 에디터 column_config"""
+    return {
+        'test_number': st.column_config.TextColumn("시험번호", width="small"),
+        'prescription_number': st.column_config.TextColumn("처방번호", width="small"),
+        'strain': st.column_config.SelectboxColumn("균주", options=STRAINS, width="small"),
+        'cfu_0day': st.column_config.TextColumn("0일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
+        'cfu_7day': st.column_config.TextColumn("7일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
+        'cfu_14day': st.column_config.TextColumn("14일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
+        'cfu_28day': st.column_config.TextColumn("28일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
+        'judgment': st.column_config.SelectboxColumn("판정", options=['적합', '부적합'], width="small"),
+        'final_judgment': st.column_config.SelectboxColumn("최종판정", options=['적합', '부적합'], width="small")
+    }
+
+
+COL_CONFIG = _build_col_config()
+
 # CSS 스타일
 # CSS 스타일 - 최소화 버전
-st.markdown("""
+APP_CSS = """
 <style>
     /* 헤더만 유지 */
     .compact-header {
@@ -125,7 +252,11 @@ st.markdown("""
         border-radius: 4px;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+# 🆕 요소는 rerun마다 다시 출력해야 유지되므로 모듈 상수를 그대로 출력
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # 헤더
 st.markdown("""
@@ -154,12 +285,13 @@ with header_col1:
         
         if uploaded_file:
             # 🆕 파일 식별자 생성 (이름 + 크기)
-            file_id = f"{uploaded_file.name}_{len(uploaded_file.getvalue())}"
+            file_id = f"{uploaded_file.name}_{uploaded_file.size}"
             
             # 🆕 파일이 변경되었는지 확인
             if st.session_state.current_file_name != uploaded_file.name:
                 # 🆕 이미 처리된 파일인지 확인
-                if file_id not in st.session_state.processed_files:
+                cached_info = st.session_state.processed_files.get(file_id)
+                if cached_info is None or not os.path.exists(cached_info['path']):
                     with st.spinner("🔐 파일 확인 중..."):
                         # 원본 파일 bytes
                         original_bytes = uploaded_file.getvalue()
@@ -172,19 +304,20 @@ with header_col1:
                             logger.error(f"DRM 처리 실패: {drm_message}")
                             st.stop()
                         
-                        # 🆕 페이지 수 확인
+                        # 🆕 처리된 파일 디스크 저장 후 페이지 수 확인
+                        pdf_path, pdf_hash = st.session_state.pdf_spool.spool(processed_bytes)
+                        
                         try:
-                            doc = fitz.open(stream=processed_bytes, filetype="pdf")
-                            page_count = doc.page_count
-                            doc.close()
+                            page_count, = PDFProcessor.get_pdf_meta(pdf_path)
                         except Exception as e:
                             st.error(f"❌ PDF 열기 실패: {e}")
                             logger.error(f"PDF 열기 실패: {e}")
                             st.stop()
                         
-                        # 🆕 처리된 파일 캐싱
+                        # 🆕 처리된 파일 캐싱 (경로만 보관)
                         st.session_state.processed_files[file_id] = {
-                            'bytes': processed_bytes,
+                            'path': pdf_path,
+                            'hash': pdf_hash,
                             'message': drm_message,
                             'name': uploaded_file.name,
                             'page_count': page_count
@@ -202,10 +335,19 @@ with header_col1:
                 # 🆕 캐시에서 처리된 파일 가져오기
                 processed_file_info = st.session_state.processed_files[file_id]
                 
+                # 🆕 이전 파일의 임시 PDF 삭제 (파일 전환 시)
+                previous_path = st.session_state.current_file_path
+                if previous_path and previous_path != processed_file_info['path']:
+                    st.session_state.pdf_spool.discard(previous_path)
+                    st.session_state.processed_files = {
+                        k: v for k, v in st.session_state.processed_files.items() if v['path'] != previous_path
+                    }
+                
                 # 세션에 저장
                 st.session_state.current_file_name = uploaded_file.name
-                st.session_state.current_file_bytes = processed_file_info['bytes']  # ← DRM 해제된 bytes
+                st.session_state.current_file_path = processed_file_info['path']  # ← DRM 해제된 파일
                 st.session_state.current_file_id = file_id  # 🆕 파일 ID 저장
+                st.session_state.current_file_hash = processed_file_info['hash']
                 st.session_state.current_page = 1
                 
                 logger.info(f"📁 파일 설정 완료: {uploaded_file.name}")
@@ -218,16 +360,23 @@ with header_col2:
             if st.session_state.get('confirm_reset', False):
                 # 전체 초기화
                 st.session_state.ocr_data_frames = {}
+                st.session_state.total_records = 0
+                st.session_state.file_stats = {}
+                for hash_key in [k for k in st.session_state.keys() if str(k).startswith('_df_hash_')]:
+                    del st.session_state[hash_key]
                 st.session_state.saved_pages = set()
+                st.session_state.excel_has_data = False
                 st.session_state.current_page = 1
                 st.session_state.last_date_info = {}
                 st.session_state.fallback_manager.reset()
                 st.session_state.current_file_name = None
-                st.session_state.current_file_bytes = None
+                st.session_state.current_file_path = None
                 st.session_state.current_file_id = None  # 🆕 추가
+                st.session_state.current_file_hash = None
                 st.session_state.confirm_reset = False
-                # 🆕 캐시는 유지 (같은 파일 다시 업로드 시 빠르게)
-                # st.session_state.processed_files = {}  # 필요시 주석 해제
+                # 🆕 임시 PDF 삭제 (처리 결과 캐시도 함께 비움)
+                st.session_state.pdf_spool.clear()
+                st.session_state.processed_files = {}
                 
                 # Excel 초기화
                 temp_dir = tempfile.gettempdir()
@@ -248,17 +397,16 @@ with header_col2:
 
 # 🆕 현재 파일 설정
 current_file = None
+pdf_path = None
 page_count = 0
 
-if st.session_state.get('current_file_bytes'):
+if st.session_state.get('current_file_path'):
     # 세션에서 파일 로드
-    import io
-    current_file = type('obj', (object,), {
-        'name': st.session_state.current_file_name,
-        'getvalue': lambda self: st.session_state.current_file_bytes  # self 추가!
-    })()
+    current_file = SpooledPDF(st.session_state.current_file_name, st.session_state.current_file_path)
     
-    page_count = PDFProcessor.extract_page_count(st.session_state.current_file_bytes)
+    # 🆕 PDF는 경로로 전달 (PyMuPDF가 파일에서 직접 읽음)
+    pdf_path = st.session_state.current_file_path
+    page_count = _page_count_cached(st.session_state.current_file_hash, pdf_path)
     
     if st.session_state.current_page > page_count:
         st.session_state.current_page = page_count
@@ -273,13 +421,14 @@ def validate_data(df):
     if df.empty:
         return issues
     
-    missing_test = df[df['test_number'].isna() | (df['test_number'] == '')]
-    if not missing_test.empty:
-        issues.append(f"시험번호 누락: {len(missing_test)}건")
+    # 🆕 중간 DataFrame 생성 없이 누락 건수만 집계
+    missing_test = int((df['test_number'].isna() | df['test_number'].eq('')).sum())
+    if missing_test:
+        issues.append(f"시험번호 누락: {missing_test}건")
     
-    missing_prescription = df[df['prescription_number'].isna() | (df['prescription_number'] == '')]
-    if not missing_prescription.empty:
-        issues.append(f"처방번호 누락: {len(missing_prescription)}건")
+    missing_prescription = int((df['prescription_number'].isna() | df['prescription_number'].eq('')).sum())
+    if missing_prescription:
+        issues.append(f"처방번호 누락: {missing_prescription}건")
     
     return issues
 
@@ -296,39 +445,80 @@ if current_file:
                 # drm_placeholder.info("🔐 DRM 확인 중...")
                 
                 result = process_pdf_page(
-                    current_file.getvalue(), 
+                    pdf_path, 
                     st.session_state.current_page - 1,
                     st.session_state.fallback_manager  # 🎯 추가
                 )
                 
                 drm_placeholder.empty()  # DRM 메시지 제거
                 
-                if result['success']:
+                if result.success:
                     key = (current_file.name, st.session_state.current_page)
-                    df_table = pd.DataFrame(result['data'])
-                    df_date_raw = result['date_info']  # 딕셔너리
+                    df_table = _to_ocr_frame(result.data)
                     
                     # 🆕 날짜 정보 처리
-                    if df_date_raw and any(df_date_raw.values()):
-                        # 새로운 날짜 정보가 있으면 저장
-                        st.session_state.last_date_info = df_date_raw.copy()
-                        df_date = pd.DataFrame([df_date_raw])
-                        logger.info(f"📅 새로운 날짜 정보 저장: {df_date_raw}")
-                    elif st.session_state.last_date_info:
-                        # 날짜 정보가 없으면 이전 값 재사용
-                        df_date = pd.DataFrame([st.session_state.last_date_info])
-                        logger.info(f"🔄 이전 날짜 정보 재사용: {st.session_state.last_date_info}")
-                    else:
-                        # 날짜 정보가 전혀 없는 경우
-                        df_date = pd.DataFrame()
-                        logger.warning("⚠️ 날짜 정보 없음")
+                    df_date = _resolve_date_frame(result.date_info)
                     
-                    st.session_state.ocr_data_frames[key] = {"table": df_table, "date": df_date}
+                    _set_bundle(key, df_table, df_date)
                     
-                    st.success(result['message'])
+                    st.success(result.message)
                     st.rerun()
                 else:
-                    st.error(f"처리 실패: {result['message']}")
+                    st.error(f"처리 실패: {result.message}")
+        
+        # 🆕 전체 OCR (미처리 페이지 병렬 처리)
+        if st.button("전체 OCR", use_container_width=True):
+            pending_pages = [
+                p for p in range(page_count)
+                if (current_file.name, p + 1) not in st.session_state.ocr_data_frames
+            ]
+            
+            if pending_pages:
+                results = {}
+                failed_pages = []
+                
+                with st.status(f"전체 OCR 처리 중... ({len(pending_pages)} 페이지)", expanded=False) as status:
+                    progress = st.progress(0.0)
+                    
+                    page_results = process_pdf_pages(
+                        pdf_path, pending_pages,
+                        max_workers=OCR_MAX_WORKERS, max_retries=OCR_MAX_RETRIES
+                    )
+                    for done, (p, result) in enumerate(page_results, start=1):
+                        if result.success:
+                            results[p] = result
+                            # 도착 즉시 테이블 저장 (날짜는 페이지 순서대로 아래에서 보정)
+                            _set_bundle(
+                                (current_file.name, p + 1),
+                                _to_ocr_frame(result.data),
+                                pd.DataFrame()
+                            )
+                        else:
+                            failed_pages.append(p + 1)
+                            logger.error(f"❌ 페이지 {p + 1} OCR 실패: {result.message}")
+                        
+                        progress.progress(done / len(pending_pages), text=f"{done}/{len(pending_pages)} 페이지 완료")
+                    
+                    # 날짜 정보는 이전 페이지 값을 이어받으므로 페이지 순서대로 적용
+                    for p in sorted(results):
+                        key = (current_file.name, p + 1)
+                        _set_bundle(
+                            key,
+                            st.session_state.ocr_data_frames[key]["table"],
+                            _resolve_date_frame(results[p].date_info)
+                        )
+                    
+                    status.update(
+                        label=f"전체 OCR 완료: {len(results)}/{len(pending_pages)} 페이지",
+                        state="error" if failed_pages else "complete"
+                    )
+                
+                if failed_pages:
+                    st.error(f"처리 실패 페이지: {sorted(failed_pages)}")
+                else:
+                    st.rerun()
+            else:
+                st.info("모든 페이지가 이미 처리되었습니다")
     
     with action_col2:
         key = (current_file.name, st.session_state.current_page)
@@ -353,6 +543,7 @@ if current_file:
                 if success:
                     # 🆕 저장 완료 기록
                     st.session_state.saved_pages.add(key)
+                    st.session_state.excel_has_data = True
                     
                     if not df_table.empty and 'test_number' in df_table.columns:
                         test_count = df_table['test_number'].nunique()
@@ -360,9 +551,10 @@ if current_file:
                     else:
                         st.success("저장되었습니다")
                     
-                    sheet_list = st.session_state.excel_saver.get_sheet_list()
-                    if sheet_list:
-                        st.info(f"총 저장된 시트: {len(sheet_list)}개")
+                    # 🆕 대기열 반영 없이 시트 수만 조회
+                    sheet_count = st.session_state.excel_saver.get_sheet_counts()['test_sheets']
+                    if sheet_count:
+                        st.info(f"총 저장된 시트: {sheet_count}개")
                 else:
                     st.error("Excel 저장 실패")
                 
@@ -374,8 +566,7 @@ if current_file:
     with action_col3:
         # 비활성 버튼으로 통계 표시 (평행 정렬)
         if st.session_state.excel_saver:
-            stats = st.session_state.excel_saver.get_statistics()
-            sheet_count = stats['test_sheets']
+            sheet_count = st.session_state.excel_saver.get_sheet_counts()['test_sheets']
         else:
             sheet_count = 0
         
@@ -405,12 +596,21 @@ if current_file:
     
     with action_col5:
         # 증분 저장된 Excel 다운로드
-        if os.path.exists(st.session_state.excel_path):
-            excel_bytes = st.session_state.excel_saver.get_excel_bytes()
-            if excel_bytes:
-                # 🆕 파일 크기 표시
-                stats = st.session_state.excel_saver.get_statistics()
-                file_size_mb = stats.get('file_size_mb', 0)
+        if st.session_state.excel_has_data:
+            # 🆕 rerun마다 직렬화하지 않음 - 저장 후에는 '다운로드 준비'를 눌렀을 때만 생성
+            #    (매번 flush하면 대기열 일괄 반영(flush_threshold)이 적용되지 않음)
+            excel_bytes = st.session_state.excel_saver.get_ready_excel_bytes()
+            if excel_bytes is None:
+                if st.button("Excel 다운로드 준비", use_container_width=True):
+                    with st.spinner("Excel 생성 중..."):
+                        excel_bytes = st.session_state.excel_saver.get_excel_bytes()
+                    if excel_bytes is None:
+                        st.error("Excel 생성 실패")
+                    else:
+                        st.rerun()
+            elif excel_bytes:
+                # 🆕 파일 크기 표시 (os.stat만 사용)
+                file_size_mb = st.session_state.excel_saver.get_file_size()['file_size_mb']
                 
                 st.download_button(
                     label=f"Excel 다운로드 ({file_size_mb}MB)",
@@ -459,10 +659,20 @@ if current_file:
         with st.container(border=True):
             st.markdown("#### PDF 미리보기")
             
-            img_bytes = PDFProcessor.render_page_image(
-                current_file.getvalue(), 
-                st.session_state.current_page - 1, 
-                zoom=2.5
+            preview_quality = st.radio(
+                "품질",
+                list(PREVIEW_ZOOM.keys()),
+                index=1,
+                horizontal=True,
+                key="preview_quality",
+                label_visibility="collapsed"
+            )
+            
+            img_bytes = _render_page_cached(
+                st.session_state.current_file_hash,
+                pdf_path,
+                st.session_state.current_page - 1,
+                PREVIEW_ZOOM[preview_quality]
             )
             
             if img_bytes:
@@ -475,7 +685,9 @@ if current_file:
                 st.error("이미지 렌더링 실패")
 
     # 우측: OCR 결과
-    with right_col:
+    # 🆕 fragment로 분리 → 데이터 에디터 수정 시 우측 패널만 재실행 (미리보기/상단 액션바 유지)
+    @st.fragment
+    def _ocr_result_panel():
             # 🆕 네이티브 컨테이너 사용
             with st.container(border=True, height=1100):
                 st.markdown("#### OCR 결과 데이터")
@@ -488,12 +700,17 @@ if current_file:
                     if isinstance(bundle, pd.DataFrame):
                         df_table = bundle
                         df_date = pd.DataFrame(columns=['date_0', 'date_7', 'date_14', 'date_28'])
+                        has_date = False
                     else:
                         df_table = bundle.get("table", pd.DataFrame())
                         df_date = bundle.get("date", pd.DataFrame())
+                        # 🆕 저장 시 계산된 플래그 사용 (없으면 직접 계산)
+                        has_date = bundle.get("has_date")
+                        if has_date is None:
+                            has_date = _has_date(df_date)
                     
                     # 🆕 날짜 정보 항상 표시
-                    if not df_date.empty and any(df_date.iloc[0].notna()):
+                    if has_date:
                         st.markdown("**날짜 정보**")
                         date_display = df_date.copy()
                         date_display.columns = ['0일', '7일', '14일', '28일']
@@ -617,21 +834,9 @@ if current_file:
                         # ========================================
                         # 데이터 에디터
                         # ========================================
-                        col_config = {
-                            'test_number': st.column_config.TextColumn("시험번호", width="small"),
-                            'prescription_number': st.column_config.TextColumn("처방번호", width="small"),
-                            'strain': st.column_config.SelectboxColumn("균주", options=STRAINS, width="small"),
-                            'cfu_0day': st.column_config.TextColumn("0일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
-                            'cfu_7day': st.column_config.TextColumn("7일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
-                            'cfu_14day': st.column_config.TextColumn("14일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
-                            'cfu_28day': st.column_config.TextColumn("28일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
-                            'judgment': st.column_config.SelectboxColumn("판정", options=['적합', '부적합'], width="small"),
-                            'final_judgment': st.column_config.SelectboxColumn("최종판정", options=['적합', '부적합'], width="small")
-                        }
-                        
                         edited_df = st.data_editor(
                             df_display,
-                            column_config=col_config,
+                            column_config=COL_CONFIG,
                             num_rows="dynamic",
                             hide_index=True,
                             key=f"editor_{current_file.name}_{st.session_state.current_page}",
@@ -640,65 +845,60 @@ if current_file:
                         )
                         
                         
-                        # ========================================
-                        # 편집 데이터 정제 (❌, ⚠️ 제거)
-                        # ========================================
-                        edited_restored = edited_df.copy()
+                        # 🆕 편집 내용이 바뀐 경우에만 정제/저장 (변경 없는 rerun은 건너뜀)
+                        df_hash = int(pd.util.hash_pandas_object(edited_df, index=False).sum())
+                        hash_key = f'_df_hash_{key}'
                         
-                        # 모든 컬럼에서 이모지 제거
-                        for col in ['test_number', 'prescription_number', 'cfu_0day', 'cfu_7day', 'cfu_14day', 'cfu_28day']:
-                            if col in edited_restored.columns:
-                                edited_restored[col] = edited_restored[col].apply(remove_emoji)
+                        if st.session_state.get(hash_key) != df_hash:
+                            # ========================================
+                            # 편집 데이터 정제 (❌, ⚠️ 제거)
+                            # ========================================
+                            # 새로 추가된 행의 결측값은 빈 문자열로 통일 (<NA> 비교 오류 방지)
+                            edited_restored = edited_df.astype(object).where(edited_df.notna(), '')
                         
-                        # 빈 값 복원
-                        prev_test = None
-                        for i in range(len(edited_restored)):
-                            curr = edited_restored.iloc[i]['test_number']
-                            if curr == '' or pd.isna(curr):
-                                edited_restored.at[edited_restored.index[i], 'test_number'] = prev_test
-                            else:
-                                prev_test = curr
+                            # 모든 컬럼에서 이모지 제거
+                            for col in ['test_number', 'prescription_number', 'cfu_0day', 'cfu_7day', 'cfu_14day', 'cfu_28day']:
+                                if col in edited_restored.columns:
+                                    edited_restored[col] = edited_restored[col].apply(remove_emoji)
                         
-                        if 'prescription_number' in edited_restored.columns:
-                            prev_presc = None
+                            # 빈 값 복원
+                            prev_test = None
                             for i in range(len(edited_restored)):
-                                curr = edited_restored.iloc[i]['prescription_number']
+                                curr = edited_restored.iloc[i]['test_number']
                                 if curr == '' or pd.isna(curr):
-                                    edited_restored.at[edited_restored.index[i], 'prescription_number'] = prev_presc
+                                    edited_restored.at[edited_restored.index[i], 'test_number'] = prev_test
                                 else:
-                                    prev_presc = curr
+                                    prev_test = curr
                         
-                        # 편집된 데이터 저장
-                        st.session_state.ocr_data_frames[key] = {"table": edited_restored, "date": df_date}
+                            if 'prescription_number' in edited_restored.columns:
+                                prev_presc = None
+                                for i in range(len(edited_restored)):
+                                    curr = edited_restored.iloc[i]['prescription_number']
+                                    if curr == '' or pd.isna(curr):
+                                        edited_restored.at[edited_restored.index[i], 'prescription_number'] = prev_presc
+                                    else:
+                                        prev_presc = curr
+                        
+                            # 편집된 데이터 저장
+                            _set_bundle(key, _to_ocr_frame(edited_restored), df_date)
+                            st.session_state[hash_key] = df_hash
                         
                     else:
                         st.info("OCR 결과 데이터가 없습니다. OCR 시작 버튼을 클릭하세요.")
                 
                 else:
                     st.info("OCR 결과 데이터가 없습니다. OCR 시작 버튼을 클릭하세요.")
-        
+    
+    with right_col:
+        _ocr_result_panel()
         
     # 하단 통계
     st.markdown("---")
     st.markdown("### 전체 현황")
     
-    def _bundle_len(b):
-        try:
-            if isinstance(b, pd.DataFrame):
-                return len(b)
-            table = b.get("table") if isinstance(b, dict) else None
-            return len(table) if isinstance(table, pd.DataFrame) else 0
-        except Exception:
-            return 0
-    
-    total_records = sum(_bundle_len(b) for b in st.session_state.ocr_data_frames.values())
-    
-    file_stats = {}
-    for (file_name, page_num), bundle in st.session_state.ocr_data_frames.items():
-        if file_name not in file_stats:
-            file_stats[file_name] = {'pages': 0, 'records': 0}
-        file_stats[file_name]['pages'] += 1
-        file_stats[file_name]['records'] += _bundle_len(bundle)
+    # 🆕 _set_bundle에서 증분 갱신된 집계값 사용 (rerun마다 전체 순회 없음)
+    total_records = st.session_state.total_records
+    file_stats = st.session_state.file_stats
     
     stats_col1, stats_col2, stats_col3, stats_col4 = st.columns(4)
     
@@ -6,6 +6,7 @@ app_preservation.py - 보존력 시험 OCR (Azure 기반)
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import os
 import sys
 import tempfile
@@ -13,7 +14,11 @@ import uuid
 from pathlib import Path
 from datetime import datetime
 import io
-import fitz
+import base64
+import hashlib
+import re
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import copy
 import logging
 import plotly.graph_objects as go
@@ -27,8 +32,9 @@ if str(current_dir) not in sys.path:
 # ========================================
 # 로그 설정 (Streamlit 앱용)
 # ========================================
+@st.cache_resource(show_spinner=False)
 def setup_app_logging():
-    """Streamlit 앱 로그 설정"""
+    """Streamlit 앱 로그 설정 (🆕 서버 프로세스당 1회 - rerun마다 로그 파일/디렉토리 확인 방지)"""
     
     # 로그 디렉토리 생성
     log_dir = "logs"
@@ -81,9 +87,11 @@ def setup_app_logging():
 app_logger = setup_app_logging()
 
 # 🆕 Azure 기반 백엔드 import
-from backend import PDFProcessor
+from backend import PDFProcessor, SpooledPDF, SpoolTracker
 from backend_preservation import (
-    process_preservation_page,
+    process_preservation_pages_batch,
+    get_worker_log_queue,
+    init_worker_logging,
     PreservationExcelSaver,
     STRAINS
 )
@@ -109,17 +117,34 @@ if "session_id" not in st.session_state:
 if "ocr_data_frames" not in st.session_state:
     st.session_state.ocr_data_frames = {}
 
+# 🆕 파일별 OCR 처리 페이지 수 (상태 표시줄용, ocr_data_frames 변경 시 함께 갱신)
+if "processed_counts" not in st.session_state:
+    st.session_state.processed_counts = {}
+
 if "current_page" not in st.session_state:
     st.session_state.current_page = 1
 
 if "saved_pages" not in st.session_state:
     st.session_state.saved_pages = set()
 
+# 🆕 Excel 저장 여부 (다운로드 버튼 표시용, rerun마다 파일 확인 방지)
+if "excel_has_data" not in st.session_state:
+    st.session_state.excel_has_data = False
+
+# 🆕 다운로드용 Excel bytes 캐시: (저장 페이지 수, bytes) - 저장 시 무효화
+if "excel_bytes_cache" not in st.session_state:
+    st.session_state.excel_bytes_cache = None
+
 if "current_file_name" not in st.session_state:
     st.session_state.current_file_name = None
 
-if "current_file_bytes" not in st.session_state:
-    st.session_state.current_file_bytes = None
+# DRM 처리된 PDF는 디스크에 두고 경로만 보관 (세션 메모리 절약)
+if "current_file_path" not in st.session_state:
+    st.session_state.current_file_path = None
+
+# 🆕 세션이 만든 임시 PDF (파일 전환/초기화/세션 종료 시 삭제)
+if "pdf_spool" not in st.session_state:
+    st.session_state.pdf_spool = SpoolTracker()
 
 if "confirm_reset" not in st.session_state:
     st.session_state.confirm_reset = False
@@ -127,6 +152,20 @@ if "confirm_reset" not in st.session_state:
 if 'processed_files' not in st.session_state:
     st.session_state.processed_files = {}
 
+if "current_file_hash" not in st.session_state:
+    st.session_state.current_file_hash = None
+
+# 🆕 현재 파일 페이지 수 (업로드 시 1회 계산)
+if "current_page_count" not in st.session_state:
+    st.session_state.current_page_count = 0
+
+# 🆕 전체 페이지 사전 OCR: {(file_name, page): Future}
+if "ocr_futures" not in st.session_state:
+    st.session_state.ocr_futures = {}
+
+if "prefetch_file_id" not in st.session_state:
+    st.session_state.prefetch_file_id = None
+
 # 🆕 Excel Saver 초기화
 if "excel_saver" not in st.session_state:
     temp_dir = tempfile.gettempdir()
@@ -134,6 +173,288 @@ if "excel_saver" not in st.session_state:
     st.session_state.excel_saver = PreservationExcelSaver(excel_path)
     st.session_state.excel_path = excel_path
 
+# ========================================
+# 렌더링 캐시
+# ========================================
+@st.cache_data(max_entries=64, show_spinner=False)
+def _render_page_cached(pdf_hash, _pdf_path, page_index, zoom):
+    """PDF 페이지 렌더링 캐시 (_pdf_path는 해시하지 않고 pdf_hash로 식별, 미리보기용 JPEG)"""
+    return PDFProcessor.render_page_image(_pdf_path, page_index, zoom=zoom, image_format="jpeg")
+
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _preview_source_cached(pdf_hash, page_index, zoom, _img_bytes, mime="image/jpeg"):
+    """
+    미리보기용 Plotly 이미지 소스 캐시
+    
+    PIL 디코딩 + base64 인코딩을 rerun마다 반복하지 않도록 data URI와 크기를 보관
+    
+    Returns:
+        tuple: (data_uri, width, height)
+    """
+    with Image.open(io.BytesIO(_img_bytes)) as pil_img:
+        width, height = pil_img.size
+    data_uri = f"data:{mime};base64,{base64.b64encode(_img_bytes).decode('ascii')}"
+    return data_uri, width, height
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _preview_figure_cached(pdf_hash, page_index, zoom, page_count, _img_bytes):
+    """
+    미리보기 Plotly Figure 캐시 (페이지 이동/rerun마다 Figure 재구성 방지)
+    
+    캐시된 Figure는 세션 간 공유되므로 수정하지 않고 표시에만 사용
+    """
+    img_source, img_width, img_height = _preview_source_cached(pdf_hash, page_index, zoom, _img_bytes)
+    
+    # Plotly Figure 생성
+    fig = go.Figure()
+    
+    # 이미지 추가
+    fig.add_layout_image(
+        dict(
+            source=img_source,
+            xref="x",
+            yref="y",
+            x=0,
+            y=img_height,
+            sizex=img_width,
+            sizey=img_height,
+            sizing="stretch",
+            layer="below"
+        )
+    )
+    
+    # 축 설정
+    fig.update_xaxes(
+        showgrid=False,
+        range=[0, img_width],
+        showticklabels=False
+    )
+    
+    fig.update_yaxes(
+        showgrid=False,
+        range=[0, img_height],
+        showticklabels=False,
+        scaleanchor="x",
+        scaleratio=1
+    )
+    
+    # 레이아웃 설정
+    fig.update_layout(
+        title=f"페이지 {page_index + 1}/{page_count}",
+        width=None,
+        height=800,
+        margin=dict(l=0, r=0, t=40, b=0),
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False),
+        hovermode=False,
+        dragmode="pan"  # 드래그로 이동
+    )
+    
+    return fig
+
+
+# 미리보기 렌더링 배율 (확대는 Plotly 휠 줌으로 처리)
+PREVIEW_ZOOM = 2.0
+
+# ========================================
+# 🆕 데이터 에디터 컬럼 설정 (프로세스당 1회 생성, rerun마다 재생성 방지)
+# ========================================
+@st.cache_resource
+def _build_col_config():
+    """균주 데이터 에디터 column_config"""
+    return {
+        'test_number': st.column_config.TextColumn("시험번호", width="small"),
+        'prescription_number': st.column_config.TextColumn("처방번호", width="small"),
+        'strain': st.column_config.SelectboxColumn("균주", options=STRAINS, width="small"),
+        'cfu_0day': st.column_config.TextColumn("0일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
+        'cfu_7day': st.column_config.TextColumn("7일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
+        'cfu_14day': st.column_config.TextColumn("14일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
+        'cfu_28day': st.column_config.TextColumn("28일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
+        'judgment': st.column_config.SelectboxColumn("판정", options=['적합', '부적합'], width="small"),
+        'final_judgment': st.column_config.TextColumn("최종판정", width="small", help="시험번호당 첫 번째만")
+    }
+
+
+@st.cache_resource
+def _build_date_col_config():
+    """날짜 에디터 column_config"""
+    return {
+        '0일': st.column_config.TextColumn("0일", help="날짜 형식: MM/DD"),
+        '7일': st.column_config.TextColumn("7일", help="날짜 형식: MM/DD"),
+        '14일': st.column_config.TextColumn("14일", help="날짜 형식: MM/DD"),
+        '28일': st.column_config.TextColumn("28일", help="날짜 형식: MM/DD")
+    }
+
+
+COL_CONFIG = _build_col_config()
+DATE_COL_CONFIG = _build_date_col_config()
+
+# 🆕 표시용 이모지 제거 패턴 (❌ 단독 값 → 빈 값, ⚠️ 접두어 제거)
+_EMOJI_RE = re.compile(r'^\s*❌\s*$|⚠️')
+
+# ========================================
+# 전체 페이지 사전 OCR (프로세스 풀)
+# ========================================
+@st.cache_resource
+def _get_ocr_process_pool():
+    """
+    페이지 OCR용 프로세스 풀 (서버 프로세스당 1개, 스레드가 있는 서버에서 fork 방지를 위해 spawn)
+    
+    🆕 워커 로그는 큐로 받아 앱 프로세스의 보존력 OCR 로그 파일 하나에 기록
+    """
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker_logging,
+        initargs=(get_worker_log_queue(),)
+    )
+
+
+def store_ocr_result(key, result):
+    """OCR 결과를 세션에 저장 (실패 시 _error 기록)"""
+    if key not in st.session_state.ocr_data_frames:
+        counts = st.session_state.processed_counts
+        counts[key[0]] = counts.get(key[0], 0) + 1
+    
+    if result['success']:
+        st.session_state.ocr_data_frames[key] = {
+            "data": result['data'],
+            "date_info": result['date_info'],
+            "_df": pd.DataFrame(result['data'])  # 🆕 표시용 DataFrame (rerun마다 재생성 방지)
+        }
+    else:
+        st.session_state.ocr_data_frames[key] = {
+            "data": [],
+            "date_info": {},
+            "_error": result['message']
+        }
+
+
+# 🆕 Azure 분석 요청 1회에 묶을 페이지 수
+OCR_BATCH_SIZE = 8
+
+
+def prefetch_all_pages(pdf_path, page_count):
+    """
+    새 PDF 로드 시 아직 결과가 없는 전체 페이지를 프로세스 풀에 제출
+    
+    OCR_BATCH_SIZE 페이지씩 묶어 일괄 처리 (같은 배치의 페이지는 같은 future 공유)
+    """
+    pool = _get_ocr_process_pool()
+    futures = st.session_state.ocr_futures
+    file_name = st.session_state.current_file_name
+    
+    pending = [
+        page_index for page_index in range(page_count)
+        if (file_name, page_index + 1) not in st.session_state.ocr_data_frames
+        and (file_name, page_index + 1) not in futures
+    ]
+    
+    for start in range(0, len(pending), OCR_BATCH_SIZE):
+        batch = pending[start:start + OCR_BATCH_SIZE]
+        future = pool.submit(process_preservation_pages_batch, pdf_path, batch)
+        for page_index in batch:
+            futures[(file_name, page_index + 1)] = future
+    
+    app_logger.info(f"🚀 전체 페이지 사전 OCR 제출: {len(pending)}페이지 / 배치 {-(-len(pending) // OCR_BATCH_SIZE)}건")
+
+
+def submit_page_ocr(pdf_path, page_index):
+    """
+    단일 페이지 OCR을 프로세스 풀에 제출 (대기하지 않음)
+    
+    이전 실패 결과가 있으면 지우고 다시 제출, 결과는 collect_prefetched_pages가 수거
+    """
+    key = (st.session_state.current_file_name, page_index + 1)
+    if key in st.session_state.ocr_futures:
+        return
+    
+    if st.session_state.ocr_data_frames.pop(key, None) is not None:
+        st.session_state.processed_counts[key[0]] -= 1
+    
+    st.session_state.ocr_futures[key] = _get_ocr_process_pool().submit(
+        process_preservation_pages_batch, pdf_path, [page_index]
+    )
+    app_logger.info(f"🔍 OCR 제출: 페이지 {page_index + 1}")
+
+
+# 🆕 현재 페이지 이후 미리 OCR할 페이지 수 (사전 OCR 취소/실패 시에도 다음 페이지 준비)
+OCR_LOOKAHEAD = 2
+
+# 🆕 OCR 진행 상태 확인 주기
+OCR_POLL_INTERVAL = "2s"
+
+
+@st.fragment(run_every=OCR_POLL_INTERVAL)
+def _ocr_progress_watcher():
+    """진행 중인 OCR 현황 표시 후 완료분이 생기면 전체 rerun (진행 중일 때만 호출)"""
+    futures = st.session_state.ocr_futures
+    if any(future.done() for future in futures.values()):
+        st.rerun()
+    
+    st.caption(f"⏳ OCR 진행 중: {len(futures)}페이지")
+
+
+def collect_prefetched_pages():
+    """완료된 OCR 결과를 ocr_data_frames로 옮김 (rerun마다 호출, 대기 없음)"""
+    futures = st.session_state.ocr_futures
+    
+    for key, future in list(futures.items()):
+        if not future.done():
+            continue
+        
+        try:
+            result = future.result()[key[1] - 1]
+        except Exception as e:
+            result = {'success': False, 'data': [], 'date_info': {}, 'message': str(e)}
+        
+        del futures[key]
+        
+        # 수동 OCR 결과가 먼저 저장된 경우 덮어쓰지 않음
+        if key not in st.session_state.ocr_data_frames:
+            store_ocr_result(key, result)
+            app_logger.info(f"📥 OCR 수거: 페이지 {key[1]} ({'성공' if result['success'] else '실패'})")
+
+
+# ========================================
+# 🆕 버튼 콜백 (스크립트 실행 전에 상태 변경 → 클릭당 rerun 1회)
+# ========================================
+def _shift_page(delta):
+    """이전/다음 페이지 이동"""
+    st.session_state.current_page += delta
+
+
+def _set_reset_confirm(value):
+    """새로 시작하기 확인 상태 전환"""
+    st.session_state.reset_confirm = value
+
+
+# ========================================
+# 업로드 파일 준비 (내용 해시 기준 캐시)
+# ========================================
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _prepare_pdf(file_id, _raw_bytes):
+    """
+    DRM 처리 + 페이지 수 확인 (file_id = 원본 bytes의 sha1)
+    
+    실패는 캐시하지 않도록 예외로 전달
+    🆕 세션 간 공유 캐시이므로 디스크 저장은 세션별로 호출 측에서 수행 (SpoolTracker)
+    
+    Returns:
+        tuple: (processed_bytes, drm_message, page_count)
+    """
+    drm_success, processed_bytes, drm_message = PDFProcessor.process_drm_if_needed(_raw_bytes)
+    if not drm_success:
+        raise RuntimeError(drm_message)
+    
+    page_count, = PDFProcessor.get_pdf_meta(processed_bytes)
+    
+    return processed_bytes, drm_message, page_count
+
+
 # ========================================
 # 저장 함수
 # ========================================
@@ -154,10 +475,15 @@ def save_current_page():
     # 🆕 임시 저장소에서 edited_df 가져오기
     temp_df = st.session_state.get(f'_temp_edited_df_{key}')
     
+    # 🆕 Excel에는 편집된 DataFrame을 그대로 전달 (리스트 → DataFrame 재변환 방지)
+    test_data = bundle.get('_df', bundle['data'])
+    
     if temp_df is not None and len(temp_df) > 0:
-        # DataFrame을 딕셔너리 리스트로 변환
+        # 번들에는 딕셔너리 리스트로 보관
         edited_data = temp_df.to_dict('records')
         bundle['data'] = edited_data
+        bundle['_df'] = temp_df
+        test_data = temp_df
     
     # 🆕 편집된 날짜 정보 가져오기
     temp_date = st.session_state.get(f'_temp_edited_date_{key}')
@@ -169,12 +495,14 @@ def save_current_page():
     # Excel 저장
     with st.spinner('저장 중...'):
         success = st.session_state.excel_saver.add_test_data(
-            test_data=bundle['data'],
+            test_data=test_data,
             date_info=date_info
         )
     
     if success:
         st.session_state.saved_pages.add(key)
+        st.session_state.excel_has_data = True
+        st.session_state.excel_bytes_cache = None
         return True
     else:
         st.error('저장 실패. 다시 시도해주세요.')
@@ -183,7 +511,7 @@ def save_current_page():
 # ========================================
 # CSS 스타일
 # ========================================
-st.markdown("""
+APP_CSS = """
 <style>
     .compact-header {
         background: linear-gradient(90deg, #0066cc 0%, #0099ff 100%) !important;
@@ -205,7 +533,11 @@ st.markdown("""
         color: white !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+# 🆕 요소는 rerun마다 다시 출력해야 유지되므로 모듈 상수를 그대로 출력
+st.markdown(APP_CSS, unsafe_allow_html=True)
 
 # ========================================
 # 헤더
@@ -235,15 +567,16 @@ with header_col1:
         )
         
         if uploaded_file:
-            file_id = f"{uploaded_file.name}_{len(uploaded_file.getvalue())}"
-            
             if st.session_state.current_file_name != uploaded_file.name:
-                if file_id not in st.session_state.processed_files:
+                original_bytes = uploaded_file.getvalue()
+                # 🆕 내용 기반 ID (같은 파일 재업로드 시 DRM/페이지 확인 생략)
+                file_id = hashlib.sha1(original_bytes).hexdigest()
+                
+                cached_info = st.session_state.processed_files.get(file_id)
+                if cached_info is None or not os.path.exists(cached_info['path']):
                     app_logger.info(f"📁 새 파일 업로드: {uploaded_file.name}")
                     
                     with st.spinner("🔐 파일 확인 중..."):
-                        original_bytes = uploaded_file.getvalue()
-                        
                         # 파일 크기 체크
                         file_size_mb = len(original_bytes) / (1024 * 1024)
                         app_logger.info(f"📊 파일 크기: {file_size_mb:.2f}MB")
@@ -253,34 +586,32 @@ with header_col1:
                             st.error(f"파일 크기가 제한을 초과했습니다. ({file_size_mb:.1f}MB / {MAX_FILE_SIZE_MB}MB)")
                             st.stop()
                         
-                        # DRM 처리
-                        drm_success, processed_bytes, drm_message = PDFProcessor.process_drm_if_needed(original_bytes)
-                        if not drm_success:
-                            app_logger.error(f"❌ DRM 처리 실패: {drm_message}")
-                            st.error(f"파일 처리 실패: {drm_message}")
-                            st.stop()
-                        
-                        # 페이지 수 체크
+                        # DRM 처리 + 페이지 수 확인
                         try:
-                            doc = fitz.open(stream=processed_bytes, filetype="pdf")
-                            page_count = doc.page_count
-                            doc.close()
-                            
-                            app_logger.info(f"📄 페이지 수: {page_count}")
-                            
-                            if page_count > MAX_PDF_PAGES:
-                                app_logger.error(f"❌ 페이지 수 초과: {page_count}")
-                                st.error(f"PDF 페이지 수가 제한을 초과했습니다. (최대 {MAX_PDF_PAGES}페이지)")
-                                st.info(f"현재 PDF: {page_count}페이지")
-                                st.stop()
-                            
+                            processed_bytes, drm_message, page_count = _prepare_pdf(file_id, original_bytes)
+                        except RuntimeError as e:
+                            app_logger.error(f"❌ DRM 처리 실패: {e}")
+                            st.error(f"파일 처리 실패: {e}")
+                            st.stop()
                         except Exception as e:
                             app_logger.error(f"❌ PDF 열기 실패: {e}")
                             st.error(f"❌ PDF 열기 실패: {e}")
                             st.stop()
                         
+                        app_logger.info(f"📄 페이지 수: {page_count}")
+                        
+                        # 페이지 수 체크
+                        if page_count > MAX_PDF_PAGES:
+                            app_logger.error(f"❌ 페이지 수 초과: {page_count}")
+                            st.error(f"PDF 페이지 수가 제한을 초과했습니다. (최대 {MAX_PDF_PAGES}페이지)")
+                            st.info(f"현재 PDF: {page_count}페이지")
+                            st.stop()
+                        
+                        # 🆕 세션 전용 임시 파일에 저장 (경로만 보관)
+                        pdf_path, pdf_hash = st.session_state.pdf_spool.spool(processed_bytes)
                         st.session_state.processed_files[file_id] = {
-                            'bytes': processed_bytes,
+                            'path': pdf_path,
+                            'hash': pdf_hash,
                             'message': drm_message,
                             'name': uploaded_file.name,
                             'page_count': page_count
@@ -294,9 +625,20 @@ with header_col1:
                             st.success(f"파일 로드 완료 | 총 {page_count} 페이지")
                 
                 processed_file_info = st.session_state.processed_files[file_id]
+                
+                # 🆕 이전 파일의 임시 PDF 삭제 (파일 전환 시)
+                previous_path = st.session_state.current_file_path
+                if previous_path and previous_path != processed_file_info['path']:
+                    st.session_state.pdf_spool.discard(previous_path)
+                    st.session_state.processed_files = {
+                        k: v for k, v in st.session_state.processed_files.items() if v['path'] != previous_path
+                    }
+                
                 st.session_state.current_file_name = uploaded_file.name
-                st.session_state.current_file_bytes = processed_file_info['bytes']
+                st.session_state.current_file_path = processed_file_info['path']
                 st.session_state.current_file_id = file_id
+                st.session_state.current_file_hash = processed_file_info['hash']
+                st.session_state.current_page_count = processed_file_info['page_count']
                 st.session_state.current_page = 1
                 st.rerun()
 
@@ -306,15 +648,13 @@ with header_col1:
 with header_col2:
     if has_work:
         if not st.session_state.get('reset_confirm', False):
-            if st.button("🔄 새로 시작하기", use_container_width=True, type="secondary"):
-                st.session_state.reset_confirm = True
-                st.rerun()
+            st.button("🔄 새로 시작하기", use_container_width=True, type="secondary",
+                      on_click=_set_reset_confirm, args=(True,))
         else:
             col1, col2 = st.columns(2)
             with col1:
-                if st.button("취소", use_container_width=True, type="secondary"):
-                    st.session_state.reset_confirm = False
-                    st.rerun()
+                st.button("취소", use_container_width=True, type="secondary",
+                          on_click=_set_reset_confirm, args=(False,))
             with col2:
                 if st.button("모두 삭제", use_container_width=True, type="primary"):
                     # Excel 파일 삭제
@@ -323,14 +663,26 @@ with header_col2:
                     
                     # 초기화
                     st.session_state.ocr_data_frames = {}
+                    st.session_state.processed_counts = {}
                     st.session_state.saved_pages = set()
+                    st.session_state.excel_has_data = False
+                    st.session_state.excel_bytes_cache = None
                     st.session_state.current_page = 1
                     st.session_state.current_file_name = None
-                    st.session_state.current_file_bytes = None
+                    st.session_state.current_file_path = None
                     st.session_state.current_file_id = None
+                    st.session_state.current_file_hash = None
+                    st.session_state.current_page_count = 0
+                    st.session_state.pdf_spool.clear()
                     st.session_state.processed_files = {}
                     st.session_state.reset_confirm = False
                     
+                    # 사전 OCR 중단 (실행 전인 작업만 취소됨)
+                    for future in st.session_state.ocr_futures.values():
+                        future.cancel()
+                    st.session_state.ocr_futures = {}
+                    st.session_state.prefetch_file_id = None
+                    
                     # 새 Excel 생성
                     new_session_id = str(uuid.uuid4())
                     excel_path = os.path.join(tempfile.gettempdir(), f"보존력시험_{new_session_id}.xlsx")
@@ -348,20 +700,38 @@ with header_col2:
 # 현재 파일 설정
 # ========================================
 current_file = None
+pdf_path = None
 page_count = 0
 
-if st.session_state.get('current_file_bytes'):
-    current_file = type('obj', (object,), {
-        'name': st.session_state.current_file_name,
-        'getvalue': lambda self: st.session_state.current_file_bytes
-    })()
+if st.session_state.get('current_file_path'):
+    current_file = SpooledPDF(st.session_state.current_file_name, st.session_state.current_file_path)
     
-    page_count = PDFProcessor.extract_page_count(st.session_state.current_file_bytes)
+    # PDF는 경로로 전달 (PyMuPDF가 파일에서 직접 읽음)
+    pdf_path = st.session_state.current_file_path
+    # 🆕 업로드 시 계산한 페이지 수 사용 (없을 때만 1회 계산)
+    if not st.session_state.current_page_count:
+        st.session_state.current_page_count = PDFProcessor.extract_page_count(pdf_path)
+    page_count = st.session_state.current_page_count
     
     if st.session_state.current_page > page_count:
         st.session_state.current_page = page_count
     if st.session_state.current_page < 1:
         st.session_state.current_page = 1
+    
+    # 🆕 새 파일이면 전체 페이지 사전 OCR 제출, 이후 rerun마다 완료분 수거
+    if st.session_state.prefetch_file_id != st.session_state.current_file_id:
+        prefetch_all_pages(pdf_path, page_count)
+        st.session_state.prefetch_file_id = st.session_state.current_file_id
+    
+    collect_prefetched_pages()
+    
+    # 🆕 자동 OCR - 현재 페이지와 다음 OCR_LOOKAHEAD 페이지 중 결과/진행 중 작업이 없는 페이지를 백그라운드 제출
+    last_page = min(st.session_state.current_page + OCR_LOOKAHEAD, page_count)
+    for page_number in range(st.session_state.current_page, last_page + 1):
+        page_key = (st.session_state.current_file_name, page_number)
+        if (page_key not in st.session_state.ocr_data_frames
+                and page_key not in st.session_state.ocr_futures):
+            submit_page_ocr(pdf_path, page_number - 1)
 
 # ========================================
 # 메인 컨텐츠
@@ -369,6 +739,10 @@ if st.session_state.get('current_file_bytes'):
 if current_file:
     st.info("OCR 시작 → 데이터 수정 → 저장 → 다음 페이지 이동 순서로 진행하세요")
     
+    # 🆕 백그라운드 OCR 진행 현황 (완료 시 자동 갱신)
+    if st.session_state.ocr_futures:
+        _ocr_progress_watcher()
+    
     # ========================================
     # 상단 액션바 (6개 버튼)
     # ========================================
@@ -380,7 +754,10 @@ if current_file:
         ocr_completed = key in st.session_state.ocr_data_frames
         has_data = len(st.session_state.ocr_data_frames.get(key, {}).get('data', [])) > 0
         
-        if ocr_completed and has_data:
+        if key in st.session_state.ocr_futures:
+            button_label = "OCR 진행 중"
+            disabled = True
+        elif ocr_completed and has_data:
             button_label = "OCR 완료"
             disabled = True
         elif ocr_completed and not has_data:
@@ -390,40 +767,15 @@ if current_file:
             button_label = "OCR 시작"
             disabled = False
         
-        if st.button(button_label, type="primary", use_container_width=True, disabled=disabled):
-            app_logger.info(f"🔍 OCR 시작: {current_file.name} - 페이지 {st.session_state.current_page}")
-            
-            with st.spinner(f"페이지 {st.session_state.current_page} 처리 중..."):
-                result = process_preservation_page(
-                    current_file.getvalue(), 
-                    st.session_state.current_page - 1
-                )
-                
-                if result['success']:
-                    st.session_state.ocr_data_frames[key] = {
-                        "data": result['data'],
-                        "date_info": result['date_info']
-                    }
-                    app_logger.info(f"✅ OCR 성공: {len(result['data'])}개 균주 추출")
-                    st.success(f"{len(result['data'])}개 균주 데이터 추출 완료")
-                    st.rerun()
-                else:
-                    st.session_state.ocr_data_frames[key] = {
-                        "data": [],
-                        "date_info": {},
-                        "_error": result['message']
-                    }
-                    app_logger.error(f"❌ OCR 실패: {result['message']}")
-                    st.error(f"OCR 실패: {result['message']}")
-                    st.info("'OCR 재시도' 버튼을 클릭하여 다시 시도하세요")
-                    st.rerun()
+        # 🆕 콜백으로 제출 (스크립트 실행 전에 처리되어 추가 rerun 불필요)
+        st.button(button_label, type="primary", use_container_width=True, disabled=disabled,
+                  on_click=submit_page_ocr, args=(pdf_path, st.session_state.current_page - 1))
     
     # 버튼 2: 이전
     with action_col2:
-        if st.button("이전", use_container_width=True, 
-                    disabled=(st.session_state.current_page <= 1)):
-            st.session_state.current_page -= 1
-            st.rerun()
+        st.button("이전", use_container_width=True, 
+                  disabled=(st.session_state.current_page <= 1),
+                  on_click=_shift_page, args=(-1,))
     
     # 버튼 3: 저장
     with action_col3:
@@ -438,7 +790,14 @@ if current_file:
         else:
             disabled = not (ocr_completed and has_data)
         
-        if st.button("저장", type="primary", use_container_width=True, disabled=disabled):
+        # 🆕 데이터가 있는 페이지는 편집 폼의 '저장'으로 저장 (폼 밖 버튼에는 미적용 편집이 전달되지 않음)
+        if has_data:
+            disabled = True
+        
+        save_notice = st.session_state.pop('_save_notice', None)
+        
+        if st.button("저장", type="primary", use_container_width=True, disabled=disabled,
+                     help="표 아래 '저장' 버튼으로 저장하세요" if has_data else None):
             app_logger.info(f"💾 저장 시도: {current_file.name} - 페이지 {st.session_state.current_page}")
             
             if save_current_page():
@@ -448,6 +807,8 @@ if current_file:
                 else:
                     app_logger.info("✅ 저장 완료!")
                     st.success("저장 완료!")
+        elif save_notice:
+            st.success(save_notice)
     
     # 버튼 4: 다음
     with action_col4:
@@ -457,10 +818,8 @@ if current_file:
         
         disabled = not is_saved or is_last_page
         
-        if st.button("다음", type="primary", use_container_width=True, disabled=disabled):
-            if not is_last_page:
-                st.session_state.current_page += 1
-                st.rerun()
+        st.button("다음", type="primary", use_container_width=True, disabled=disabled,
+                  on_click=_shift_page, args=(1,))
     
     # 버튼 5: N/M
     with action_col5:
@@ -470,12 +829,17 @@ if current_file:
     
     # 버튼 6: Excel 다운로드
     with action_col6:
-        if len(st.session_state.saved_pages) > 0 and os.path.exists(st.session_state.excel_path):
-            excel_bytes = st.session_state.excel_saver.get_excel_bytes()
+        if st.session_state.excel_has_data:
+            # 🆕 저장 페이지 수가 그대로면 캐시된 bytes 재사용
+            cache = st.session_state.excel_bytes_cache
+            if cache is not None and cache[0] == saved_count:
+                excel_bytes = cache[1]
+            else:
+                excel_bytes = st.session_state.excel_saver.get_excel_bytes()
+                st.session_state.excel_bytes_cache = (saved_count, excel_bytes)
             
             if excel_bytes:
-                stats = st.session_state.excel_saver.get_statistics()
-                file_size_mb = stats.get('file_size_mb', 0)
+                file_size_mb = len(excel_bytes) / (1024 * 1024)
                 
                 st.download_button(
                     label=f"Excel 다운로드 ({file_size_mb:.1f}MB)",
@@ -491,15 +855,13 @@ if current_file:
     # 상태 표시줄
     # ========================================
     key = (current_file.name, st.session_state.current_page)
-    processed_pages = len(st.session_state.ocr_data_frames)
+    processed_pages = st.session_state.processed_counts.get(current_file.name, 0)
     
-    status_html = f"""
-    <div class="status-bar">
-        <strong>페이지:</strong> {st.session_state.current_page}/{page_count} | 
-        <strong>처리 완료:</strong> {processed_pages}/{page_count}
-    </div>
-    """
-    st.markdown(status_html, unsafe_allow_html=True)
+    st.markdown(
+        f'<div class="status-bar"><strong>페이지:</strong> {st.session_state.current_page}/{page_count} | '
+        f'<strong>처리 완료:</strong> {processed_pages}/{page_count}</div>',
+        unsafe_allow_html=True
+    )
     
     # ========================================
     # 메인 컨텐츠 영역 (2단 레이아웃)
@@ -511,60 +873,21 @@ if current_file:
         st.markdown("### PDF 미리보기 (마우스 휠/드래그로 조작)")
         
         # PDF 렌더링 (고해상도)
-        img_bytes = PDFProcessor.render_page_image(
-            current_file.getvalue(), 
-            st.session_state.current_page - 1, 
-            zoom=3.5  # 고해상도
+        img_bytes = _render_page_cached(
+            st.session_state.current_file_hash,
+            pdf_path,
+            st.session_state.current_page - 1,
+            PREVIEW_ZOOM
         )
         
         if img_bytes:
-            # Plotly를 이용한 인터랙티브 이미지
-            # 이미지 로드
-            pil_img = Image.open(io.BytesIO(img_bytes))
-            
-            # Plotly Figure 생성
-            fig = go.Figure()
-            
-            # 이미지 추가
-            fig.add_layout_image(
-                dict(
-                    source=pil_img,
-                    xref="x",
-                    yref="y",
-                    x=0,
-                    y=pil_img.height,
-                    sizex=pil_img.width,
-                    sizey=pil_img.height,
-                    sizing="stretch",
-                    layer="below"
-                )
-            )
-            
-            # 축 설정
-            fig.update_xaxes(
-                showgrid=False,
-                range=[0, pil_img.width],
-                showticklabels=False
-            )
-            
-            fig.update_yaxes(
-                showgrid=False,
-                range=[0, pil_img.height],
-                showticklabels=False,
-                scaleanchor="x",
-                scaleratio=1
-            )
-            
-            # 레이아웃 설정
-            fig.update_layout(
-                title=f"페이지 {st.session_state.current_page}/{page_count}",
-                width=None,
-                height=800,
-                margin=dict(l=0, r=0, t=40, b=0),
-                xaxis=dict(visible=False),
-                yaxis=dict(visible=False),
-                hovermode=False,
-                dragmode="pan"  # 드래그로 이동
+            # Plotly를 이용한 인터랙티브 이미지 (🆕 페이지별 Figure 캐시)
+            fig = _preview_figure_cached(
+                st.session_state.current_file_hash,
+                st.session_state.current_page - 1,
+                PREVIEW_ZOOM,
+                page_count,
+                img_bytes
             )
             
             # Plotly 차트 표시
@@ -591,33 +914,13 @@ if current_file:
         
         key = (current_file.name, st.session_state.current_page)
         
-        # 🆕 자동 OCR (2페이지 이상)
-        if key not in st.session_state.ocr_data_frames and st.session_state.current_page > 1:
-            with st.spinner("페이지 분석 중... (약 5초 소요)"):
-                result = process_preservation_page(
-                    current_file.getvalue(), 
-                    st.session_state.current_page - 1
-                )
-                
-                if result['success']:
-                    st.session_state.ocr_data_frames[key] = {
-                        "data": result['data'],
-                        "date_info": result['date_info']
-                    }
-                    st.success(f"자동 OCR 완료: {len(result['data'])}개 균주")
-                    st.rerun()
-                else:
-                    st.session_state.ocr_data_frames[key] = {
-                        "data": [],
-                        "date_info": {},
-                        "_error": result['message']
-                    }
-                    st.error(f"자동 OCR 실패: {result['message']}")
-                    st.info("상단 'OCR 재시도' 버튼으로 다시 시도하세요")
-                    st.rerun()
+        # 🆕 OCR 진행 중 (백그라운드 처리, 완료 시 _ocr_progress_watcher가 rerun)
+        if key in st.session_state.ocr_futures:
+            with st.status(f"페이지 {st.session_state.current_page} 분석 중...", state="running"):
+                st.write("다른 페이지로 이동해도 처리는 계속됩니다")
         
         # OCR 결과 표시
-        if key in st.session_state.ocr_data_frames:
+        elif key in st.session_state.ocr_data_frames:
             bundle = st.session_state.ocr_data_frames[key]
             
             # 에러가 있으면 표시
@@ -649,204 +952,164 @@ if current_file:
                         'date_28': ''
                     }
                 
-                st.markdown("**📅 날짜 정보 (편집 가능)**")
-                date_df = pd.DataFrame([{
-                    '0일': date_info.get('date_0', ''),
-                    '7일': date_info.get('date_7', ''),
-                    '14일': date_info.get('date_14', ''),
-                    '28일': date_info.get('date_28', '')
-                }])
-                
-                # 날짜 에디터 (항상 표시)
-                edited_date_df = st.data_editor(
-                    date_df,
-                    use_container_width=True,
-                    height=80,
-                    hide_index=True,
-                    key=f"date_editor_{current_file.name}_{st.session_state.current_page}",
-                    column_config={
-                        '0일': st.column_config.TextColumn("0일", help="날짜 형식: MM/DD"),
-                        '7일': st.column_config.TextColumn("7일", help="날짜 형식: MM/DD"),
-                        '14일': st.column_config.TextColumn("14일", help="날짜 형식: MM/DD"),
-                        '28일': st.column_config.TextColumn("28일", help="날짜 형식: MM/DD")
-                    }
-                )
-                
-                # 편집된 날짜를 딕셔너리로 변환하여 저장
-                if len(edited_date_df) > 0:
-                    edited_date_dict = {
-                        'date_0': str(edited_date_df.iloc[0]['0일']).strip(),
-                        'date_7': str(edited_date_df.iloc[0]['7일']).strip(),
-                        'date_14': str(edited_date_df.iloc[0]['14일']).strip(),
-                        'date_28': str(edited_date_df.iloc[0]['28일']).strip()
-                    }
-                    st.session_state[f'_temp_edited_date_{key}'] = edited_date_dict
-                
-                st.markdown("---")
-                
-                # ========================================
-                # 균주 데이터 테이블
-                # ========================================
-                st.markdown("**균주 데이터**")
-                
-                # 🔧 편집된 데이터가 있으면 우선 사용!
-                temp_df = st.session_state.get(f'_temp_edited_df_{key}')
-                
-                if temp_df is not None and len(temp_df) > 0:
-                    # 편집된 데이터 사용
-                    df = temp_df.copy()
-                else:
-                    # 원본 데이터 사용
-                    data = bundle.get('data', [])
-                    if data:
-                        df = pd.DataFrame(data)
-                    else:
-                        df = None
-                
-                if df is not None and len(df) > 0:
+                # 🆕 편집 내용은 '수정 적용' 시 한 번에 반영 (셀 입력마다 rerun 방지)
+                edited_df = None
+                with st.form(f"edit_form_{current_file.name}_{st.session_state.current_page}", border=False):
+                    st.markdown("**📅 날짜 정보 (편집 가능)**")
+                    date_df = pd.DataFrame([{
+                        '0일': date_info.get('date_0', ''),
+                        '7일': date_info.get('date_7', ''),
+                        '14일': date_info.get('date_14', ''),
+                        '28일': date_info.get('date_28', '')
+                    }])
+                    
+                    # 날짜 에디터 (항상 표시)
+                    edited_date_df = st.data_editor(
+                        date_df,
+                        use_container_width=True,
+                        height=80,
+                        hide_index=True,
+                        key=f"date_editor_{current_file.name}_{st.session_state.current_page}",
+                        column_config=DATE_COL_CONFIG
+                    )
+                    
+                    st.markdown("---")
                     
                     # ========================================
-                    # 표시용 DataFrame 생성 (검증 이모지 추가)
+                    # 균주 데이터 테이블
                     # ========================================
-                    df_display = df.copy()
+                    st.markdown("**균주 데이터**")
                     
-                    # A.brasiliensis 확인 요청 표시
-                    def mark_brasiliensis(value, strain):
-                        """A.brasiliensis CFU 값에 ⚠️ 추가"""
-                        value_str = str(value).strip()
-                        
-                        if not value_str or value_str == '' or pd.isna(value):
-                            return "❌"
+                    # 🔧 편집된 데이터가 있으면 우선 사용!
+                    temp_df = st.session_state.get(f'_temp_edited_df_{key}')
+                    
+                    if temp_df is not None and len(temp_df) > 0:
+                        # 편집된 데이터 사용
+                        df = temp_df.copy()
+                    else:
+                        # 원본 데이터 사용 (OCR 시 만들어 둔 DataFrame)
+                        df = bundle.get('_df')
+                        if df is None and bundle.get('data'):
+                            df = pd.DataFrame(bundle['data'])
+                            bundle['_df'] = df
+                    
+                    if df is not None and len(df) > 0:
                         
-                        if 'brasiliensis' in strain.lower():
-                            return f"⚠️ {value_str}"
+                        # ========================================
+                        # 표시용 DataFrame 생성 (검증 이모지 추가)
+                        # ========================================
+                        df_display = df.copy()
                         
-                        return value_str
-                    
-                    # CFU 컬럼 검증 적용 (❌ 표시)
-                    for idx, row in df_display.iterrows():
-                        strain = row.get('strain', '')
+                        # A.brasiliensis 행 (CFU 값에 ⚠️ 확인 요청 표시)
+                        if 'strain' in df_display.columns:
+                            is_bras = df_display['strain'].astype(str).str.lower().str.contains('brasiliensis', na=False)
+                        else:
+                            is_bras = pd.Series(False, index=df_display.index)
                         
-                        # CFU 컬럼 검증
+                        # CFU 컬럼 검증 적용 (누락 ❌, A.brasiliensis ⚠️)
                         for col in ['cfu_0day', 'cfu_7day', 'cfu_14day', 'cfu_28day']:
                             if col in df_display.columns:
-                                df_display.at[idx, col] = mark_brasiliensis(row[col], strain)
+                                values = df_display[col].astype(str).str.strip()
+                                empty = values.eq('') | df_display[col].isna()
+                                df_display[col] = np.where(empty, '❌', np.where(is_bras, '⚠️ ' + values, values))
                         
                         # 판정 컬럼 검증 (❌ 표시)
                         if 'judgment' in df_display.columns:
-                            judgment_val = str(row.get('judgment', '')).strip()
-                            if not judgment_val or judgment_val == '' or pd.isna(row.get('judgment')):
-                                df_display.at[idx, 'judgment'] = '❌'
-                    
-                    # ========================================
-                    # 중복 제거 (표시용 - 항상 실행!)
-                    # ========================================
-                    prev_test = None
-                    prev_presc = None
-                    prev_final = None
-                    
-                    for i in range(len(df_display)):
-                        curr_test = df_display.iloc[i]['test_number']
-                        curr_presc = df_display.iloc[i].get('prescription_number', '')
-                        curr_final = df_display.iloc[i].get('final_judgment', '')
-                        
-                        # 시험번호 중복 제거 (❌ 체크 안 함!)
-                        if curr_test == prev_test:
-                            df_display.at[df_display.index[i], 'test_number'] = ''
-                        else:
-                            prev_test = curr_test
+                            values = df_display['judgment']
+                            empty = values.isna() | values.astype(str).str.strip().eq('')
+                            df_display['judgment'] = values.mask(empty, '❌')
                         
-                        # 처방번호 중복 제거 (❌ 체크 안 함!)
-                        if 'prescription_number' in df_display.columns:
-                            if curr_presc == prev_presc:
-                                df_display.at[df_display.index[i], 'prescription_number'] = ''
-                            else:
-                                prev_presc = curr_presc
+                        # ========================================
+                        # 중복 제거 (표시용 - 항상 실행!)
+                        # ========================================
+                        # 시험번호/처방번호 중복 제거 (❌ 체크 안 함!)
+                        for col in ['test_number', 'prescription_number']:
+                            if col in df_display.columns:
+                                values = df_display[col]
+                                df_display[col] = values.mask(values.eq(values.shift()), '')
                         
                         # 최종판정 중복 제거 (첫 번째만 표시)
                         if 'final_judgment' in df_display.columns:
-                            if curr_final == prev_final and prev_final:
-                                df_display.at[df_display.index[i], 'final_judgment'] = ''
-                            else:
-                                prev_final = curr_final
-                    
-                    # ========================================
-                    # 데이터 에디터
-                    # ========================================
-                    col_config = {
-                        'test_number': st.column_config.TextColumn("시험번호", width="small"),
-                        'prescription_number': st.column_config.TextColumn("처방번호", width="small"),
-                        'strain': st.column_config.SelectboxColumn("균주", options=STRAINS, width="small"),
-                        'cfu_0day': st.column_config.TextColumn("0일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
-                        'cfu_7day': st.column_config.TextColumn("7일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
-                        'cfu_14day': st.column_config.TextColumn("14일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
-                        'cfu_28day': st.column_config.TextColumn("28일 CFU", width="small", help="❌=누락, ⚠️=확인필요"),
-                        'judgment': st.column_config.SelectboxColumn("판정", options=['적합', '부적합'], width="small"),
-                        'final_judgment': st.column_config.TextColumn("최종판정", width="small", help="시험번호당 첫 번째만")
-                    }
-                    
-                    edited_df = st.data_editor(
-                        df_display,
-                        column_config=col_config,
-                        num_rows="dynamic",
-                        hide_index=True,
-                        key=f"editor_{current_file.name}_{st.session_state.current_page}",
-                        use_container_width=True,
-                        height=700
-                    )
-                    
+                            values = df_display['final_judgment']
+                            prev_values = values.shift()
+                            is_repeat = values.eq(prev_values) & prev_values.notna() & prev_values.ne('')
+                            df_display['final_judgment'] = values.mask(is_repeat, '')
+                        
+                        # ========================================
+                        # 데이터 에디터
+                        # ========================================
+                        edited_df = st.data_editor(
+                            df_display,
+                            column_config=COL_CONFIG,
+                            num_rows="dynamic",
+                            hide_index=True,
+                            key=f"editor_{current_file.name}_{st.session_state.current_page}",
+                            use_container_width=True,
+                            height=700
+                        )
+                        
+                        
+                    else:
+                        st.info("균주 데이터가 없습니다.")
+                        
+                    st.caption("💡 셀 수정 후 '수정 적용' 또는 '저장'을 눌러야 반영됩니다")
+                    apply_col, save_col = st.columns(2)
+                    with apply_col:
+                        submitted = st.form_submit_button("수정 적용", use_container_width=True)
+                    with save_col:
+                        # 🆕 저장도 폼 제출로 처리 (편집 내용 반영 후 Excel 저장)
+                        save_submitted = st.form_submit_button("저장", type="primary", use_container_width=True)
+                    submitted = submitted or save_submitted
+                
+                if submitted:
+                    # 편집된 날짜를 딕셔너리로 변환하여 저장
+                    if len(edited_date_df) > 0:
+                        edited_date_dict = {
+                            'date_0': str(edited_date_df.iloc[0]['0일']).strip(),
+                            'date_7': str(edited_date_df.iloc[0]['7일']).strip(),
+                            'date_14': str(edited_date_df.iloc[0]['14일']).strip(),
+                            'date_28': str(edited_date_df.iloc[0]['28일']).strip()
+                        }
+                        st.session_state[f'_temp_edited_date_{key}'] = edited_date_dict
+                
+                if submitted and edited_df is not None:
                     # ========================================
                     # 편집 데이터 정제 (❌, ⚠️ 제거)
                     # ========================================
                     edited_restored = edited_df.copy()
                     
-                    # 이모지 제거
-                    def remove_emoji(value):
-                        value_str = str(value).strip()
-                        if value_str == '❌':
-                            return ''
-                        if '⚠️' in value_str:
-                            return value_str.replace('⚠️', '').strip()
-                        return value_str
-                    
+                    # 이모지 제거 (❌ → 빈 값, ⚠️ 접두어 제거)
                     for col in ['test_number', 'prescription_number', 'cfu_0day', 'cfu_7day', 'cfu_14day', 'cfu_28day']:
                         if col in edited_restored.columns:
-                            edited_restored[col] = edited_restored[col].apply(remove_emoji)
+                            edited_restored[col] = (
+                                edited_restored[col].astype(str)
+                                .str.replace(_EMOJI_RE, '', regex=True)
+                                .str.strip()
+                            )
                     
                     # 🔧 빈 값 복원은 원본 데이터일 때만 (temp_df가 없을 때만)
                     if temp_df is None:
                         # 빈 값 복원 (중복 제거된 빈 값을 이전 값으로 채움)
-                        prev_test = None
-                        for i in range(len(edited_restored)):
-                            curr = edited_restored.iloc[i]['test_number']
-                            if curr == '' or pd.isna(curr):
-                                edited_restored.at[edited_restored.index[i], 'test_number'] = prev_test
-                            else:
-                                prev_test = curr
-                        
-                        if 'prescription_number' in edited_restored.columns:
-                            prev_presc = None
-                            for i in range(len(edited_restored)):
-                                curr = edited_restored.iloc[i]['prescription_number']
-                                if curr == '' or pd.isna(curr):
-                                    edited_restored.at[edited_restored.index[i], 'prescription_number'] = prev_presc
-                                else:
-                                    prev_presc = curr
-                        
-                        if 'final_judgment' in edited_restored.columns:
-                            prev_final = None
-                            for i in range(len(edited_restored)):
-                                curr = edited_restored.iloc[i]['final_judgment']
-                                if curr == '' or pd.isna(curr):
-                                    edited_restored.at[edited_restored.index[i], 'final_judgment'] = prev_final
-                                else:
-                                    prev_final = curr
+                        for col in ['test_number', 'prescription_number', 'final_judgment']:
+                            if col in edited_restored.columns:
+                                values = edited_restored[col]
+                                edited_restored[col] = values.mask(values.isna() | values.eq('')).ffill()
                     
                     # 임시 저장소에 저장
                     st.session_state[f'_temp_edited_df_{key}'] = edited_restored
+                
+                if save_submitted:
+                    app_logger.info(f"💾 저장 시도: {current_file.name} - 페이지 {st.session_state.current_page}")
                     
-                else:
-                    st.info("균주 데이터가 없습니다.")
+                    if save_current_page():
+                        if st.session_state.current_page >= page_count:
+                            app_logger.info("✅ 마지막 페이지 저장 완료!")
+                            st.session_state['_save_notice'] = "마지막 페이지 저장 완료!"
+                        else:
+                            app_logger.info("✅ 저장 완료!")
+                            st.session_state['_save_notice'] = "저장 완료!"
+                        # 상단 버튼(다음/저장 수/다운로드)을 저장 상태로 다시 그림
+                        st.rerun()
             else:
                 st.info("📋 OCR 데이터가 없습니다")
         
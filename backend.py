@@ -5,16 +5,29 @@ Streamlit에서 직접 import하여 사용
 
 import io
 import re
+import hashlib
 import fitz
 import requests
 import pandas as pd
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-from openpyxl import Workbook
 import os
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import unescape as xml_unescape
 import logging
 import math
-from typing import List, Dict, Tuple, Optional
+import time
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Tuple, Optional, Union
 
 
 
@@ -34,29 +47,149 @@ except ImportError:
     DRM_AVAILABLE = False
     logger.warning("⚠️ drm_utils.py 없음 - DRM 처리 비활성화")
 
+# 🆕 HTML 파서: lxml(C 구현)이 있으면 사용, 없으면 내장 html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+    logger.warning("⚠️ lxml 없음 - html.parser 사용 (테이블 파싱 속도 저하)")
+
 from dotenv import load_dotenv
 load_dotenv()
 # 설정
 UPSTAGE_API_KEY = os.getenv("UPSTAGE_API_KEY")
 UPSTAGE_URL = "https://api.upstage.ai/v1/document-ai/document-parse"
+# 🆕 OCR 업로드 이미지: 렌더링 DPI / 긴 변 최대 픽셀 / JPEG 품질 (PNG 대비 전송량 절감)
+#    144 DPI(zoom 2.0)에서 표 인식 품질이 충분하고, 전송량은 DPI²에 비례
+OCR_RENDER_DPI = 144
+OCR_MAX_LONG_EDGE = 2048
+OCR_JPEG_QUALITY = 85
 STRAINS = ['E.coli', 'P.aeruginosa', 'S.aureus', 'C.albicans', 'A.brasiliensis']
 
 
+@dataclass(slots=True)
+class SpooledPDF:
+    """디스크에 저장된 업로드 PDF (UploadedFile처럼 name/getvalue 제공, 내용은 경로에서 읽음)"""
+    name: str
+    path: str
+    
+    def getvalue(self) -> bytes:
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+
+@dataclass(slots=True)
+class PageResult:
+    """🆕 페이지 처리 결과 (process_pdf_page / process_pdf_pages 반환 형식)"""
+    success: bool = False
+    data: list = field(default_factory=list)
+    date_info: dict = field(default_factory=dict)
+    message: str = ''
+
+
 class PDFProcessor:
     """PDF 처리 클래스"""
     
+    # 🆕 PDF 메타 정보 캐시 (sha1 → (page_count,), 최근 16개)
+    _META_CACHE_SIZE = 16
+    _meta_cache = OrderedDict()
+    
+    # 🆕 열린 fitz 문서 캐시 (경로/sha1 → Document, 최근 4개): 페이지마다 PDF 재파싱 방지
+    #    PyMuPDF 문서는 스레드 안전하지 않으므로 접근은 _doc_lock으로 직렬화
+    _DOC_CACHE_SIZE = 4
+    _doc_cache = OrderedDict()
+    _doc_lock = threading.RLock()
+    
+    # 🆕 처리된 PDF 디스크 저장 (세션 메모리에 bytes 보관 방지)
+    @staticmethod
+    def spool_to_disk(pdf_bytes: bytes) -> Tuple[str, str]:
+        """
+        DRM 처리된 PDF를 임시 파일로 저장 (mkstemp: 호출마다 새 파일, 소유자만 읽기/쓰기 0600)
+        
+        사용이 끝나면 discard_spooled로 삭제 (세션 단위 관리는 SpoolTracker 사용)
+        
+        Returns:
+            Tuple[str, str]: (파일 경로, sha1)
+        """
+        pdf_hash = hashlib.sha1(pdf_bytes).hexdigest()
+        fd, pdf_path = tempfile.mkstemp(prefix="micro_lab_ocr_", suffix=".pdf")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(pdf_bytes)
+        except BaseException:
+            os.unlink(pdf_path)
+            raise
+        
+        logger.info(f"💾 PDF 디스크 저장: {pdf_path} ({len(pdf_bytes):,} bytes)")
+        return pdf_path, pdf_hash
+    
+    @classmethod
+    def discard_spooled(cls, pdf_path: str):
+        """🆕 spool_to_disk 파일 삭제 (열린 문서/메타 캐시도 함께 정리, 이미 없으면 무시)"""
+        with cls._doc_lock:
+            doc = cls._doc_cache.pop(pdf_path, None)
+            if doc is not None and not doc.is_closed:
+                doc.close()
+        cls._meta_cache.pop(pdf_path, None)
+        
+        try:
+            os.unlink(pdf_path)
+            logger.info(f"🗑️ PDF 임시 파일 삭제: {pdf_path}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"⚠️ PDF 임시 파일 삭제 실패: {pdf_path} ({e})")
+    
+    @staticmethod
+    def _open_document(pdf_source: Union[bytes, str]):
+        """PDF 열기 (경로면 파일에서 직접, bytes면 스트림으로)"""
+        if isinstance(pdf_source, str):
+            return fitz.open(pdf_source)
+        return fitz.open(stream=pdf_source, filetype="pdf")
+    
+    @classmethod
+    @contextmanager
+    def _borrow_document(cls, pdf_source: Union[bytes, str]):
+        """
+        🆕 캐시된 fitz 문서 빌려쓰기 (with 블록 동안 잠금 유지, 닫지 않음)
+        
+        spool_to_disk 경로는 경로 자체를, bytes는 sha1을 키로 사용 (경로는 파일마다 고유)
+        """
+        if isinstance(pdf_source, str):
+            key = pdf_source
+        else:
+            key = hashlib.sha1(pdf_source).hexdigest()
+        
+        with cls._doc_lock:
+            doc = cls._doc_cache.get(key)
+            if doc is None or doc.is_closed:
+                doc = cls._open_document(pdf_source)
+                cls._doc_cache[key] = doc
+            
+            cls._doc_cache.move_to_end(key)
+            while len(cls._doc_cache) > cls._DOC_CACHE_SIZE:
+                _, old_doc = cls._doc_cache.popitem(last=False)
+                old_doc.close()
+            
+            yield doc
+    
     # 🆕 DRM 처리 추가
     @staticmethod
-    def process_drm_if_needed(pdf_bytes: bytes) -> Tuple[bool, bytes, str]:
+    def process_drm_if_needed(pdf_bytes: Union[bytes, str]) -> Tuple[bool, Union[bytes, str], str]:
         """
         DRM 자동 판별 및 해제
         
         Args:
-            pdf_bytes: PDF 바이트 데이터
+            pdf_bytes: PDF 바이트 데이터 (경로면 spool_to_disk로 저장된 처리 완료 파일)
             
         Returns:
             Tuple[bool, bytes, str]: (성공여부, 처리된PDF바이트, 메시지)
         """
+        if isinstance(pdf_bytes, str):
+            # spool_to_disk 파일은 업로드 시 이미 DRM 처리됨
+            return True, pdf_bytes, "DRM 처리된 파일"
+        
         if not DRM_AVAILABLE:
             logger.warning("DRM 모듈 없음 - 원본 사용")
             return True, pdf_bytes, "DRM 모듈 없음 (원본 사용)"
@@ -88,28 +221,141 @@ class PDFProcessor:
             logger.error(error_msg)
             return False, pdf_bytes, error_msg
     
+    @classmethod
+    def get_pdf_meta(cls, pdf_bytes: Union[bytes, str]) -> Tuple[int]:
+        """
+        PDF 메타 정보 (문서는 내용 해시당 1회만 열기)
+        
+        Returns:
+            Tuple[int]: (page_count,)
+            
+        Raises:
+            PDF를 열 수 없으면 fitz 예외 그대로 전달 (캐시하지 않음)
+        """
+        # spool_to_disk 경로는 파일마다 고유하므로 경로 자체를 키로 사용
+        if isinstance(pdf_bytes, str):
+            pdf_hash = pdf_bytes
+        else:
+            pdf_hash = hashlib.sha1(pdf_bytes).hexdigest()
+        
+        meta = cls._meta_cache.get(pdf_hash)
+        if meta is None:
+            with cls._borrow_document(pdf_bytes) as doc:
+                meta = (doc.page_count,)
+            cls._meta_cache[pdf_hash] = meta
+        
+        cls._meta_cache.move_to_end(pdf_hash)
+        while len(cls._meta_cache) > cls._META_CACHE_SIZE:
+            cls._meta_cache.popitem(last=False)
+        
+        return meta
+    
     @staticmethod
-    def extract_page_count(pdf_bytes: bytes) -> int:
+    def extract_page_count(pdf_bytes: Union[bytes, str]) -> int:
         """PDF 페이지 수 추출"""
         try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            return doc.page_count
+            return PDFProcessor.get_pdf_meta(pdf_bytes)[0]
         except Exception as e:
             logger.error(f"페이지 수 추출 실패: {e}")
             return 0
     
     @staticmethod
-    def render_page_image(pdf_bytes: bytes, page_index: int, zoom: float = 2.0) -> bytes:
-        """PDF 페이지를 이미지로 렌더링"""
+    def render_page_image(pdf_bytes: Union[bytes, str], page_index: int, zoom: float = 2.0,
+                          image_format: str = "png", jpg_quality: int = 85,
+                          max_long_edge: Optional[int] = None, dpi: Optional[int] = None) -> bytes:
+        """
+        PDF 페이지를 이미지로 렌더링 (bytes 또는 파일 경로)
+        
+        image_format="jpeg"로 인코딩 비용/전송량 절감
+        🆕 max_long_edge 지정 시 긴 변이 그 이하가 되도록 zoom을 낮춰 렌더링 (리샘플링 없음)
+        🆕 dpi 지정 시 zoom 대신 사용 (PDF 기본 72 DPI 기준)
+        """
+        if dpi:
+            zoom = dpi / 72
         try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            page = doc.load_page(page_index)
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat, alpha=False)
+            with PDFProcessor._borrow_document(pdf_bytes) as doc:
+                page = doc.load_page(page_index)
+                if max_long_edge:
+                    long_edge = max(page.rect.width, page.rect.height)
+                    zoom = min(zoom, max_long_edge / long_edge)
+                mat = fitz.Matrix(zoom, zoom)
+                pix = page.get_pixmap(matrix=mat, alpha=False)
+            if image_format == "jpeg":
+                return pix.tobytes("jpeg", jpg_quality=jpg_quality)
             return pix.tobytes("png")
         except Exception as e:
             logger.error(f"이미지 렌더링 실패: {e}")
             return None
+    
+    @staticmethod
+    def is_blank_page(pdf_bytes: Union[bytes, str], page_index: int) -> bool:
+        """
+        🆕 내용이 전혀 없는 페이지인지 확인 (텍스트/이미지/벡터 도형 모두 없음)
+        
+        렌더링 없이 페이지 객체 목록만 확인 - 빈 페이지는 OCR 요청 생략용
+        """
+        try:
+            with PDFProcessor._borrow_document(pdf_bytes) as doc:
+                page = doc.load_page(page_index)
+                return not (page.get_text("words") or page.get_images() or page.get_drawings())
+        except Exception as e:
+            logger.debug(f"빈 페이지 확인 실패: {e}")
+            return False
+    
+    @staticmethod
+    def render_page_rgb(pdf_bytes: Union[bytes, str], page_index: int,
+                        zoom: float = 2.0) -> Optional[Tuple[int, int, bytes]]:
+        """
+        🆕 PDF 페이지를 인코딩 없이 RGB 픽셀로 렌더링
+        
+        PNG 인코딩 → 디코딩 왕복 없이 픽셀을 바로 쓰는 경우용 (예: 일괄 OCR용 TIFF 결합)
+        
+        Returns:
+            Tuple[int, int, bytes]: (width, height, RGB samples), 실패 시 None
+        """
+        try:
+            with PDFProcessor._borrow_document(pdf_bytes) as doc:
+                page = doc.load_page(page_index)
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+            return pix.width, pix.height, pix.samples
+        except Exception as e:
+            logger.error(f"이미지 렌더링 실패: {e}")
+            return None
+
+
+class SpoolTracker:
+    """
+    🆕 세션이 만든 spool 파일 추적
+    
+    파일 전환/초기화 시 discard/clear로 삭제하고, 남은 파일은 세션 상태가 해제되거나
+    프로세스가 종료될 때(weakref.finalize) 삭제
+    """
+    
+    def __init__(self):
+        self._paths = set()
+        weakref.finalize(self, SpoolTracker._discard_all, self._paths)
+    
+    @staticmethod
+    def _discard_all(paths):
+        for pdf_path in list(paths):
+            PDFProcessor.discard_spooled(pdf_path)
+        paths.clear()
+    
+    def spool(self, pdf_bytes: bytes) -> Tuple[str, str]:
+        """PDFProcessor.spool_to_disk 후 경로 등록"""
+        pdf_path, pdf_hash = PDFProcessor.spool_to_disk(pdf_bytes)
+        self._paths.add(pdf_path)
+        return pdf_path, pdf_hash
+    
+    def discard(self, pdf_path: Optional[str]):
+        """등록된 파일 삭제 (None/미등록 경로는 무시)"""
+        if pdf_path in self._paths:
+            self._paths.discard(pdf_path)
+            PDFProcessor.discard_spooled(pdf_path)
+    
+    def clear(self):
+        """등록된 파일 모두 삭제"""
+        self._discard_all(self._paths)
 
 
 class FallbackManager:
@@ -174,9 +420,48 @@ class FallbackManager:
 class OCRProcessor:
     """OCR 처리 클래스"""
     
+    # 🆕 HTTP 연결 재사용 (keep-alive, 병렬 요청 수만큼 커넥션 풀 유지)
+    HTTP_POOL_SIZE = 8
+    _session = None
+    _session_lock = threading.Lock()
+    
+    # 🆕 OCR 결과 캐시 (이미지 blake2b → 응답 JSON, 최근 128개): 같은 페이지 재처리 시 API 호출 생략
+    _OCR_CACHE_SIZE = 128
+    _ocr_cache = OrderedDict()
+    _ocr_cache_lock = threading.Lock()
+    
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """프로세스 공용 requests.Session (최초 1회 생성)"""
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(
+                        pool_connections=cls.HTTP_POOL_SIZE,
+                        pool_maxsize=cls.HTTP_POOL_SIZE,
+                        max_retries=0  # 재시도는 페이지 단위 재시도(_process_pdf_page_with_retry)에서만 수행
+                    )
+                    session.mount("https://", adapter)
+                    cls._session = session
+        return cls._session
+    
     @staticmethod
     def request_ocr(image_bytes: bytes) -> Optional[dict]:
-        """업스테이지 OCR API 호출"""
+        """
+        업스테이지 OCR API 호출 (🆕 동일 이미지는 캐시된 결과 반환)
+        
+        이미지는 bytes로 받음: 캐시 키(해시) 계산에 전체 바이트가 필요하고,
+        API가 model/ocr 필드와 함께 multipart 업로드를 요구하므로 렌더러 → 업로드 스트리밍은 하지 않음
+        """
+        cache_key = hashlib.blake2b(image_bytes, digest_size=16).digest()
+        with OCRProcessor._ocr_cache_lock:
+            cached = OCRProcessor._ocr_cache.get(cache_key)
+            if cached is not None:
+                OCRProcessor._ocr_cache.move_to_end(cache_key)
+                logger.info("♻️ OCR 캐시 사용")
+                return cached
+        
         try:
             headers = {"Authorization": f"Bearer {UPSTAGE_API_KEY}"}
             files = {"document": ("image.jpg", image_bytes, "image/jpeg")}
@@ -186,7 +471,7 @@ class OCRProcessor:
                 "base64_encoding": "['table']"
             }
             
-            response = requests.post(
+            response = OCRProcessor._get_session().post(
                 UPSTAGE_URL, 
                 headers=headers, 
                 files=files, 
@@ -195,7 +480,13 @@ class OCRProcessor:
             )
             
             if response.status_code == 200:
-                return response.json()
+                ocr_result = response.json()
+                # 성공한 결과만 캐시
+                with OCRProcessor._ocr_cache_lock:
+                    OCRProcessor._ocr_cache[cache_key] = ocr_result
+                    while len(OCRProcessor._ocr_cache) > OCRProcessor._OCR_CACHE_SIZE:
+                        OCRProcessor._ocr_cache.popitem(last=False)
+                return ocr_result
             else:
                 logger.error(f"OCR API 오류: {response.status_code}")
                 return None
@@ -204,6 +495,20 @@ class OCRProcessor:
             logger.error(f"OCR 요청 실패: {e}")
             return None
     
+    @staticmethod
+    def request_ocr_batch(image_bytes_list: List[bytes], max_workers: int = 8) -> List[Optional[dict]]:
+        """
+        🆕 여러 이미지 OCR 병렬 요청 (네트워크 대기 중첩)
+        
+        Returns:
+            입력 순서대로 request_ocr 결과 리스트 (실패는 None)
+        """
+        if not image_bytes_list:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(image_bytes_list))) as ex:
+            return list(ex.map(OCRProcessor.request_ocr, image_bytes_list))
+    
     @staticmethod
     def parse_table_from_ocr(ocr_result: dict, fallback_manager: FallbackManager = None) -> Tuple[List[dict], dict]:
         """OCR 결과에서 테이블 파싱 (fallback 지원)"""
@@ -224,8 +529,13 @@ class OCRProcessor:
                 logger.warning("HTML 파트 없음")
                 return [], {}
             
-            html_content = "<html><body>\n" + "\n".join(html_parts) + "\n</body></html>"
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # 🆕 첫 번째 테이블이 들어 있는 요소만 파싱 (문단/머리글 등 나머지 HTML은 건너뜀)
+            table_html = next((html for html in html_parts if _TABLE_TAG_RE.search(html)), None)
+            if table_html is None:
+                logger.warning("테이블 없음")
+                return [], {}
+            
+            soup = BeautifulSoup(table_html, HTML_PARSER)
             table = soup.find('table')
             
             if not table:
@@ -249,6 +559,73 @@ class OCRProcessor:
             logger.error(f"테이블 파싱 오류: {e}")
             return [], {}
 
+# ========================================
+# 🆕 정규식 사전 컴파일 (모듈 로드 시 1회)
+# ========================================
+_TABLE_TAG_RE = re.compile(r'<table\b', re.IGNORECASE)
+_DASH_SPACE_RE = re.compile(r'-\s+')
+_MULTI_SPACE_RE = re.compile(r'\s+')
+
+# 처방번호 패턴 (15개)
+_PRESCRIPTION_RES = [re.compile(p) for p in (
+    r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,4}\d?\b',
+    r'\b[A-Z]{3}\d{5}-[A-Z]{2,4}\b',
+    r'\bM-[A-Z]{2,4}\d{4,5}-[A-Z]{1,4}\d?\b',
+    r'\b[A-Z]{2,4}\d{4,5}[A-Z]-[A-Z]{1,4}[A-Z]?\b',
+    r'\b[A-Z]{3,6}\d{2,4}-[A-Z]{1,4}\b',
+    r'\b[A-Z]{2,4}\d{3,6}-[A-Z]{1,5}\b',
+    r'\b[A-Z]{2,5}\d{4}-[A-Z]{1,3}\d{0,2}\b',
+    r'\b[A-Z]{1,3}\d{4,5}-[A-Z]{2,4}[A-Z]?\b',
+    r'\b[A-Z]{2,4}\d{4}-[A-Z]\d[A-Z]{1,3}\b',
+    r'\b[A-Z]{2,4}\d{3,4}[A-Z]?-[A-Z]{1,4}\d*\b',
+    r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d?\b',
+    r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-\s*[A-Z]{1,5}\d?\b',
+    r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d[A-Z]+\b',
+    r'\b[A-Z]{2,4}\d{3,5}-[A-Z]{1,4}\d{1,2}\b',  # 🎯 AZLY1 타입
+    r'\b[A-Z]{2,5}\d{3,5}-[A-Z]{2,5}[A-Z\d]*\b',  # 🎯 VAZAA 타입
+)]
+# 🆕 15개 패턴 결합본: 후보 유무만 1회 스캔으로 확인
+#    (결과 순서는 패턴 우선순위를 따라야 하므로 실제 추출은 개별 패턴으로 수행)
+_PRESCRIPTION_ANY_RE = re.compile('|'.join(f'(?:{p.pattern})' for p in _PRESCRIPTION_RES))
+
+# 시험번호 패턴
+# 🆕 정상(I) / I→1 오인 / I 누락 형태를 한 번에 스캔한 뒤 6번째 글자(m[5])로 분류
+_TEST_NUMBER_ANY_RE = re.compile(r'\b(\d{2}[A-L]\d{2}[I\d]\d{2,3})\b')
+_TEST_SPACED_RE = re.compile(r'(\d{2})([A-L])(\d)\s+(\d)(\d{2,3})')     # 공백 포함
+
+# 🆕 유효 균주 키워드 (약어 + 속명) - 행마다 목록 생성/순차 비교 대신 1회 스캔
+_VALID_STRAIN_RE = re.compile('|'.join(
+    re.escape(s) for s in STRAINS + ['Escherichia', 'Pseudomonas', 'Staphylococcus', 'Candida', 'Aspergillus']
+))
+
+# 🆕 CFU/판정 열 위치 (Bulk Name 있는 행은 한 칸씩 밀림) - 행마다 dict 생성 방지
+_CFU_INDICES_BULK = {'0일': 3, '7일': 4, '14일': 5, '28일': 6, '판정': 7, '최종판정': 8}
+_CFU_INDICES_CONT = {'0일': 2, '7일': 3, '14일': 4, '28일': 5, '판정': 6, '최종판정': 7}
+_CFU_DAY_COLUMNS = (('cfu_0day', '0일'), ('cfu_7day', '7일'), ('cfu_14day', '14일'), ('cfu_28day', '28일'))
+
+# 🆕 판정 셀의 부적합 표시 문자
+_NG_JUDGMENT_CHARS = frozenset('X×vV')
+
+# CFU 값 정리
+_JP_CHARS_RE = re.compile(r'[ぁ-んァ-ン一-龯]+')
+# 🆕 단일 문자 OCR 오인식 보정 (한 번의 translate로 처리)
+#    'C'가 먼저 '<'로 바뀌므로 'Co'/'CIO'/'C10' 다중 문자 보정은 별도로 필요 없음
+_CFU_TRANS = str.maketrans({'く': '<', 'C': '<', 'O': '0'})
+_TIMES_RE = re.compile(r'[×xX]')
+_CFU_EXP_RE = re.compile(r'([0-9.]+)\s*[×xX]\s*10\s*\^?([0-9]+)')
+_CFU_LT_EXP_RE = re.compile(r'<\s*10\s*\^?\s*([0-9]+)')
+_CFU_LT_NUM_RE = re.compile(r'<\s*([0-9]+)')
+_CFU_LE_NUM_RE = re.compile(r'≤\s*([0-9]+)')
+_CFU_PRESERVE_RES = [re.compile(r'^≤\d+[°⁰]?$', re.IGNORECASE)]
+
+# 날짜 / Log 변환
+# 🆕 '01 15' / '01-15' / '01/15' / '01.15' (구분자 포함), '1월 15일'
+_DATE_SEP_RE = re.compile(r'( ?[0-9]{1,2})(\s+|-|/|\.)( ?[0-9]{1,2})')
+_DATE_KO_RE = re.compile(r'([0-9]{1,2})월\s*([0-9]{1,2})일')
+_LOG_LT_EXP_RE = re.compile(r'<10\^(\d+)')
+_LOG_LE_RE = re.compile(r'≤(\d+)')
+_LOG_EXP_RE = re.compile(r'([0-9.]+)×10\^(\d+)')
+
 
 class DataCleaner:
     """데이터 정제 클래스"""
@@ -256,6 +633,19 @@ class DataCleaner:
     # 🆕 클래스 변수: 마지막 날짜 정보 저장
     last_date_info = []
     
+    # 🆕 균주명 정규화 테이블 (소문자 키로 1회 생성)
+    _STRAIN_LOWER = {
+        full_name.lower(): short_name
+        for full_name, short_name in {
+            'E.coli': 'E.coli', 'Escherichia coli': 'E.coli', 'E. coli': 'E.coli',
+            'P.aeruginosa': 'P.aeruginosa', 'Pseudomonas aeruginosa': 'P.aeruginosa', 'P. aeruginosa': 'P.aeruginosa',
+            'S.aureus': 'S.aureus', 'Staphylococcus aureus': 'S.aureus', 'S. aureus': 'S.aureus',
+            'C.albicans': 'C.albicans', 'Candida albicans': 'C.albicans', 'C. albicans': 'C.albicans',
+            'A.brasiliensis': 'A.brasiliensis', 'Aspergillus brasiliensis': 'A.brasiliensis', 'A. brasiliensis': 'A.brasiliensis'
+        }.items()
+    }
+    _STRAIN_LOWER_ITEMS = tuple(_STRAIN_LOWER.items())
+    
     @staticmethod
     def extract_date_info(rows) -> dict:
         """
@@ -318,18 +708,19 @@ class DataCleaner:
         if fallback_manager is None:
             fallback_manager = FallbackManager()
         
+        # 🆕 행별 셀은 한 번만 수집 (시작점 탐색/데이터 처리 공용)
+        row_cells = [row.find_all('td') for row in rows]
+        
         # 동적 시작점 찾기
         data_start_row = 2
-        for i, row in enumerate(rows):
-            cells = row.find_all('td')
+        for i, cells in enumerate(row_cells):
             if cells and cells[0].get('rowspan') and len(cells[0].text.strip()) > 10:
                 data_start_row = i
                 logger.info(f"🔍 데이터 시작점 감지: Row {i}")
                 break
         
         # 데이터 행 처리
-        for i, row in enumerate(rows[data_start_row:], start=data_start_row+1):
-            cells = row.find_all('td')
+        for i, cells in enumerate(islice(row_cells, data_start_row, None), start=data_start_row+1):
             if len(cells) < 1:
                 continue
             
@@ -368,13 +759,13 @@ class DataCleaner:
                 
                 if len(cells) > 1:
                     strain = cells[1].text.strip()
-                    cfu_indices = {'0일': 3, '7일': 4, '14일': 5, '28일': 6, '판정': 7, '최종판정': 8}
+                    cfu_indices = _CFU_INDICES_BULK
                 else:
                     continue
             else:
                 # ==================== Bulk Name 없는 행 ====================
                 strain = cells[0].text.strip()
-                cfu_indices = {'0일': 2, '7일': 3, '14일': 4, '28일': 5, '판정': 6, '최종판정': 7}
+                cfu_indices = _CFU_INDICES_CONT
                 
                 # 🆕 E.coli 감지 시 fallback 적용
                 if 'E.coli' in strain or 'Escherichia' in strain:
@@ -389,43 +780,50 @@ class DataCleaner:
                         logger.info(f"🔄 E.coli #{ecoli_count} Fallback 적용: {new_test}, {new_prescription}")
             
             # 유효한 균주 확인
-            valid_strains = STRAINS + ['Escherichia', 'Pseudomonas', 'Staphylococcus', 'Candida', 'Aspergillus']
-            if not strain or not any(valid_strain in strain for valid_strain in valid_strains):
+            if not strain or not _VALID_STRAIN_RE.search(strain):
                 continue
             
             strain_normalized = DataCleaner.normalize_strain_name(strain)
             
-            # CFU 데이터 추출
-            row_data = {
+            # CFU 데이터 추출 (🆕 값 유무는 추출하면서 판단, 빈 행은 dict 생성 없이 건너뜀)
+            cfu_values = {}
+            has_cfu = False
+            for key, day_column in _CFU_DAY_COLUMNS:
+                idx = cfu_indices[day_column]
+                value = DataCleaner.clean_cfu_value(
+                    cells[idx].text.strip() if len(cells) > idx else "",
+                    strain_normalized, day_column
+                )
+                cfu_values[key] = value
+                has_cfu = has_cfu or bool(value.strip())
+            
+            if not has_cfu:
+                continue
+            
+            table_data.append({
                 'test_number': fallback_manager.current_test_number or '',
                 'prescription_number': fallback_manager.current_prescription_number or '',
                 'strain': strain_normalized,
-                'cfu_0day': DataCleaner.clean_cfu_value(
-                    cells[cfu_indices['0일']].text.strip() if len(cells) > cfu_indices['0일'] else "", 
-                    strain_normalized, '0일'
-                ),
-                'cfu_7day': DataCleaner.clean_cfu_value(
-                    cells[cfu_indices['7일']].text.strip() if len(cells) > cfu_indices['7일'] else "", 
-                    strain_normalized, '7일'
-                ),
-                'cfu_14day': DataCleaner.clean_cfu_value(
-                    cells[cfu_indices['14일']].text.strip() if len(cells) > cfu_indices['14일'] else "", 
-                    strain_normalized, '14일'
-                ),
-                'cfu_28day': DataCleaner.clean_cfu_value(
-                    cells[cfu_indices['28일']].text.strip() if len(cells) > cfu_indices['28일'] else "", 
-                    strain_normalized, '28일'
-                ),
+                **cfu_values,
                 'judgment': DataCleaner.get_judgment_value(cells, cfu_indices),
                 'final_judgment': DataCleaner.get_final_judgment_value(cells, cfu_indices)
-            }
-            
-            if any(v for k, v in row_data.items() if k.startswith('cfu_') and v.strip()):
-                table_data.append(row_data)
+            })
         
         return table_data
     
     @staticmethod
+    def rows_to_frame(rows: List[dict]) -> pd.DataFrame:
+        """
+        🆕 parse_table_rows 결과(행 dict 리스트)를 DataFrame으로 변환
+        
+        모든 행이 같은 키를 가지므로 첫 행 키 기준 열 리스트로 묶어 생성 (행별 키 추론 생략)
+        """
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame({col: [row.get(col) for row in rows] for col in rows[0]})
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)  # 🆕 같은 Bulk Name 반복 시 재계산 없음
     def extract_numbers(bulk_name: str) -> Tuple[Optional[str], Optional[str]]:
         """
         시험번호와 처방번호 추출 (개선 버전)
@@ -443,48 +841,24 @@ class DataCleaner:
             # 전처리
             bulk_name = bulk_name.upper()
             bulk_name = bulk_name.replace('!', 'I')  # OCR 오류 보정
-            bulk_name = re.sub(r'-\s+', '-', bulk_name)  # '- ' → '-'
-            bulk_name = re.sub(r'\s+', ' ', bulk_name)   # 연속 공백 제거
-            
-            # ======== 처방번호 패턴 (확장) ========
-            prescription_patterns = [
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,4}\d?\b',
-                r'\b[A-Z]{3}\d{5}-[A-Z]{2,4}\b',
-                r'\bM-[A-Z]{2,4}\d{4,5}-[A-Z]{1,4}\d?\b',
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]-[A-Z]{1,4}[A-Z]?\b',
-                r'\b[A-Z]{3,6}\d{2,4}-[A-Z]{1,4}\b',
-                r'\b[A-Z]{2,4}\d{3,6}-[A-Z]{1,5}\b',
-                r'\b[A-Z]{2,5}\d{4}-[A-Z]{1,3}\d{0,2}\b',
-                r'\b[A-Z]{1,3}\d{4,5}-[A-Z]{2,4}[A-Z]?\b',
-                r'\b[A-Z]{2,4}\d{4}-[A-Z]\d[A-Z]{1,3}\b',
-                r'\b[A-Z]{2,4}\d{3,4}[A-Z]?-[A-Z]{1,4}\d*\b',
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d?\b',
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-\s*[A-Z]{1,5}\d?\b',
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d[A-Z]+\b',
-                r'\b[A-Z]{2,4}\d{3,5}-[A-Z]{1,4}\d{1,2}\b',  # 🎯 AZLY1 타입
-                r'\b[A-Z]{2,5}\d{3,5}-[A-Z]{2,5}[A-Z\d]*\b',  # 🎯 VAZAA 타입
-            ]
+            bulk_name = _DASH_SPACE_RE.sub('-', bulk_name)  # '- ' → '-'
+            bulk_name = _MULTI_SPACE_RE.sub(' ', bulk_name)  # 연속 공백 제거
             
             all_prescription_matches = []
-            for pattern in prescription_patterns:
-                matches = re.findall(pattern, bulk_name)
-                all_prescription_matches.extend(matches)
+            if _PRESCRIPTION_ANY_RE.search(bulk_name):
+                for pattern in _PRESCRIPTION_RES:
+                    all_prescription_matches.extend(pattern.findall(bulk_name))
             
             # ======== 시험번호 패턴 (A-L 확장 + OCR 보정) ========
             all_test_matches = []
+            candidates = _TEST_NUMBER_ANY_RE.findall(bulk_name)
             
             # 정상 형태 (I가 정확히 인식된 경우)
-            correct_matches = re.findall(r'\b(\d{2}[A-L]\d{2}I\d{2,3})\b', bulk_name)
-            all_test_matches.extend(correct_matches)
+            all_test_matches.extend(m for m in candidates if m[5] == 'I')
             
-            # OCR 오류 형태 (I를 1로 잘못 인식)
-            ocr_error_patterns = [
-                r'\b(\d{2}[A-L]\d{2}1\d{2,3})\b',   # I가 1로
-                r'\b(\d{2}[A-L]\d{5,6})\b',         # I 누락
-            ]
-            
-            for pattern in ocr_error_patterns:
-                matches = re.findall(pattern, bulk_name)
+            # OCR 오류 형태: I를 1로 잘못 인식 → I 누락 (I 누락은 1 오인 형태도 포함)
+            digit_matches = [m for m in candidates if m[5] != 'I']
+            for matches in ([m for m in digit_matches if m[5] == '1'], digit_matches):
                 for match in matches:
                     if len(match) == 7:  # 25A2012 → 25A20I2
                         corrected = match[:5] + 'I' + match[6:]
@@ -496,7 +870,7 @@ class DataCleaner:
                         logger.info(f"OCR I 삽입 보정: '{match}' → '{corrected}'")
             
             # 공백이 있는 형태 (A-L 확장)
-            raw_matches = re.findall(r'(\d{2})([A-L])(\d)\s+(\d)(\d{2,3})', bulk_name)
+            raw_matches = _TEST_SPACED_RE.findall(bulk_name)
             for year_prefix, letter, d1, d2, last_digits in raw_matches:
                 converted = f"{year_prefix}{letter}{d1}{d2}I{last_digits[:2]}"
                 all_test_matches.append(converted)
@@ -520,49 +894,34 @@ class DataCleaner:
         """
         Bulk Name에서 다중 시험번호와 처방번호 추출
         
+        🆕 결과는 Bulk Name별로 캐시 (호출마다 새 리스트 반환)
+        
         Returns:
             (시험번호 리스트, 처방번호 리스트)
         """
+        test_numbers, prescription_numbers = DataCleaner._extract_multiple_numbers_cached(bulk_name)
+        return list(test_numbers), list(prescription_numbers)
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _extract_multiple_numbers_cached(bulk_name: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """extract_multiple_numbers 본체 (캐시 공유를 위해 불변 tuple 반환)"""
         try:
             # 전처리
             bulk_name = bulk_name.upper()
             bulk_name = bulk_name.replace('!', 'I')
-            bulk_name = re.sub(r'-\s+', '-', bulk_name)
-            bulk_name = re.sub(r'\s+', ' ', bulk_name)
-            
-            # 처방번호 패턴 (15개)
-            prescription_patterns = [
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,4}\d?\b',
-                r'\b[A-Z]{3}\d{5}-[A-Z]{2,4}\b',
-                r'\bM-[A-Z]{2,4}\d{4,5}-[A-Z]{1,4}\d?\b',
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]-[A-Z]{1,4}[A-Z]?\b',
-                r'\b[A-Z]{3,6}\d{2,4}-[A-Z]{1,4}\b',
-                r'\b[A-Z]{2,4}\d{3,6}-[A-Z]{1,5}\b',
-                r'\b[A-Z]{2,5}\d{4}-[A-Z]{1,3}\d{0,2}\b',
-                r'\b[A-Z]{1,3}\d{4,5}-[A-Z]{2,4}[A-Z]?\b',
-                r'\b[A-Z]{2,4}\d{4}-[A-Z]\d[A-Z]{1,3}\b',
-                r'\b[A-Z]{2,4}\d{3,4}[A-Z]?-[A-Z]{1,4}\d*\b',
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d?\b',
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-\s*[A-Z]{1,5}\d?\b',
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d[A-Z]+\b',
-                r'\b[A-Z]{2,4}\d{3,5}-[A-Z]{1,4}\d{1,2}\b',
-                r'\b[A-Z]{2,5}\d{3,5}-[A-Z]{2,5}[A-Z\d]*\b',
-            ]
+            bulk_name = _DASH_SPACE_RE.sub('-', bulk_name)
+            bulk_name = _MULTI_SPACE_RE.sub(' ', bulk_name)
             
             all_prescription_matches = []
-            for pattern in prescription_patterns:
-                matches = re.findall(pattern, bulk_name)
-                all_prescription_matches.extend(matches)
-            
-            # 시험번호 패턴
-            test_patterns = [
-                r'\b(\d{2}[A-L]\d{2}I\d{2,3})\b',  # 정상
-                r'\b(\d{2}[A-L]\d{2}1\d{2,3})\b',  # I→1 오인
-            ]
+            if _PRESCRIPTION_ANY_RE.search(bulk_name):
+                for pattern in _PRESCRIPTION_RES:
+                    all_prescription_matches.extend(pattern.findall(bulk_name))
             
+            # 시험번호 패턴: 정상(I) → I→1 오인 순
+            candidates = _TEST_NUMBER_ANY_RE.findall(bulk_name)
             all_test_matches = []
-            for pattern in test_patterns:
-                matches = re.findall(pattern, bulk_name)
+            for matches in ([m for m in candidates if m[5] == 'I'], [m for m in candidates if m[5] == '1']):
                 for match in matches:
                     if '1' in match[5:7]:
                         corrected = match[:5] + 'I' + match[6:]
@@ -575,11 +934,11 @@ class DataCleaner:
             all_test_matches = list(dict.fromkeys(all_test_matches))
             all_prescription_matches = list(dict.fromkeys(all_prescription_matches))
             
-            return all_test_matches, all_prescription_matches
+            return tuple(all_test_matches), tuple(all_prescription_matches)
             
         except Exception as e:
             logger.error(f"다중 번호 추출 오류: {e}")
-            return [], []
+            return (), ()
 
     @staticmethod
     def create_matched_pairs(test_numbers: List[str], prescription_numbers: List[str], bulk_name: str) -> List[Tuple[str, str]]:
@@ -625,22 +984,19 @@ class DataCleaner:
             return []
     
     @staticmethod
+    @lru_cache(maxsize=2048)  # 🆕 행마다 반복되는 균주명 재계산 없음
     def normalize_strain_name(strain: str) -> str:
         """균주명 정규화"""
-        strain_mapping = {
-            'E.coli': 'E.coli', 'Escherichia coli': 'E.coli', 'E. coli': 'E.coli',
-            'P.aeruginosa': 'P.aeruginosa', 'Pseudomonas aeruginosa': 'P.aeruginosa', 'P. aeruginosa': 'P.aeruginosa',
-            'S.aureus': 'S.aureus', 'Staphylococcus aureus': 'S.aureus', 'S. aureus': 'S.aureus',
-            'C.albicans': 'C.albicans', 'Candida albicans': 'C.albicans', 'C. albicans': 'C.albicans',
-            'A.brasiliensis': 'A.brasiliensis', 'Aspergillus brasiliensis': 'A.brasiliensis', 'A. brasiliensis': 'A.brasiliensis'
-        }
+        strain_lower = strain.lower()
         
-        for full_name, short_name in strain_mapping.items():
-            if full_name.lower() == strain.lower():
-                return short_name
+        # 정확히 일치 (O(1))
+        short_name = DataCleaner._STRAIN_LOWER.get(strain_lower)
+        if short_name is not None:
+            return short_name
         
-        for full_name, short_name in strain_mapping.items():
-            if full_name.lower() in strain.lower():
+        # 부분 일치
+        for full_name, short_name in DataCleaner._STRAIN_LOWER_ITEMS:
+            if full_name in strain_lower:
                 return short_name
         
         return strain
@@ -654,14 +1010,13 @@ class DataCleaner:
         original_value = value
         
         # OCR 오류 제거
-        value = re.sub(r'[ぁ-んァ-ン一-龯]+', '', value)
-        value = value.replace('く', '<').replace('C', '<').replace('O', '0')
-        value = value.replace('Co', '0').replace('CIO', '<10').replace('C10', '<10')
-        value = value.strip()
+        if not value.isascii():  # 🆕 숫자/기호뿐인 일반 값은 유니코드 범위 스캔 생략
+            value = _JP_CHARS_RE.sub('', value)
+        value = value.translate(_CFU_TRANS).strip()
         
         # 지수 형태 처리
-        if re.search(r'[×xX]', value):
-            exp_match = re.match(r'([0-9.]+)\s*[×xX]\s*10\s*\^?([0-9]+)', value)
+        if _TIMES_RE.search(value):
+            exp_match = _CFU_EXP_RE.match(value)
             if exp_match:
                 base = exp_match.group(1)
                 exp = exp_match.group(2)
@@ -669,26 +1024,26 @@ class DataCleaner:
         
         # <10 형태 처리
         if '<' in value:
-            if re.search(r'<\s*10\s*\^?\s*([0-9]+)', value):
-                exp = re.search(r'<\s*10\s*\^?\s*([0-9]+)', value).group(1)
-                return f"<10^{exp}"
-            elif re.search(r'<\s*([0-9]+)', value):
-                return f"<{re.search(r'<\s*([0-9]+)', value).group(1)}"
+            lt_exp = _CFU_LT_EXP_RE.search(value)
+            if lt_exp:
+                return f"<10^{lt_exp.group(1)}"
+            lt_num = _CFU_LT_NUM_RE.search(value)
+            if lt_num:
+                return f"<{lt_num.group(1)}"
             return "<10"
         
         # ≤ 형태 처리
         if '≤' in value:
-            if re.search(r'≤\s*([0-9]+)', value):
-                num = re.search(r'≤\s*([0-9]+)', value).group(1)
-                return f"≤{num}"
+            le_num = _CFU_LE_NUM_RE.search(value)
+            if le_num:
+                return f"≤{le_num.group(1)}"
         
         # 균주별 보정
         target_strains = ['E.coli', 'P.aeruginosa', 'S.aureus', 'C.albicans']
         is_target_strain = strain and any(s in strain for s in target_strains)
         
         if day_column in ['7일', '14일', '28일'] and is_target_strain:
-            preserve_patterns = [r'^≤\d+[°⁰]?$']
-            should_preserve = any(re.match(pattern, value, re.IGNORECASE) for pattern in preserve_patterns)
+            should_preserve = any(pattern.match(value) for pattern in _CFU_PRESERVE_RES)
             if should_preserve:
                 return value
             
@@ -718,7 +1073,7 @@ class DataCleaner:
         try:
             if len(cells) > cfu_indices['판정']:
                 raw_value = cells[cfu_indices['판정']].text.strip()
-                if any(char in raw_value for char in ['X', '×', 'v', 'V']):
+                if not _NG_JUDGMENT_CHARS.isdisjoint(raw_value):
                     return '부적합'
                 return '적합'
             return "적합"
@@ -731,7 +1086,7 @@ class DataCleaner:
         try:
             if len(cells) > cfu_indices['최종판정']:
                 raw_value = cells[cfu_indices['최종판정']].text.strip()
-                if any(char in raw_value for char in ['X', '×', 'v', 'V']):
+                if not _NG_JUDGMENT_CHARS.isdisjoint(raw_value):
                     return '부적합'
                 return '적합'
             return "적합"
@@ -773,25 +1128,31 @@ class DataCleaner:
         
     @staticmethod
     def parse_date(date_str: str) -> Optional[datetime]:
-        """날짜 문자열을 datetime 객체로 변환"""
+        """
+        날짜 문자열을 datetime 객체로 변환
+        
+        🆕 strptime 형식 9개를 예외로 순차 시도하는 대신 정규식 1회 매칭 후 직접 생성
+        (월/일 순서 우선, 공백/-// 구분자는 실패 시 일/월 순서로 재시도)
+        """
         try:
-            date_formats = [
-                '%m %d', '%m-%d', '%m/%d', '%m.%d',
-                '%m월%d일', '%m월 %d일',
-                '%d/%m', '%d-%m', '%d %m'
-            ]
+            match = _DATE_SEP_RE.fullmatch(date_str)
+            if match:
+                first, sep, second = match.groups()
+                candidates = [(first, second)]
+                if sep != '.':
+                    candidates.append((second, first))
+            else:
+                match = _DATE_KO_RE.fullmatch(date_str)
+                candidates = [match.groups()] if match else []
             
-            for date_format in date_formats:
-                try:
-                    return datetime.strptime(date_str, date_format)
-                except ValueError:
+            for month, day in candidates:
+                # strptime과 동일: 월은 공백 불가, 일은 ' 5'처럼 한 자리만 공백 패딩 허용
+                if month.startswith(' ') or (day.startswith(' ') and len(day) != 2):
                     continue
-            
-            if re.match(r'^\d+\s+\d+$', date_str):
                 try:
-                    return datetime.strptime(date_str, '%m %d')
+                    return datetime(1900, int(month), int(day))
                 except ValueError:
-                    pass
+                    continue
             
             return None
         except:
@@ -806,16 +1167,16 @@ class DataCleaner:
         try:
             if '<' in cfu_value:
                 if '10^' in cfu_value:
-                    exp_match = re.search(r'<10\^(\d+)', cfu_value)
+                    exp_match = _LOG_LT_EXP_RE.search(cfu_value)
                     if exp_match:
                         return f"<{exp_match.group(1)}.0"
                 elif '≤' in cfu_value:
-                    num_match = re.search(r'≤(\d+)', cfu_value)
+                    num_match = _LOG_LE_RE.search(cfu_value)
                     if num_match:
                         return f"<{num_match.group(1)}.0"
                 return "<1.0"
             
-            exp_match = re.match(r'([0-9.]+)×10\^(\d+)', cfu_value)
+            exp_match = _LOG_EXP_RE.match(cfu_value)
             if exp_match:
                 base = float(exp_match.group(1))
                 exp = int(exp_match.group(2))
@@ -833,14 +1194,88 @@ class DataCleaner:
         except Exception as e:
             logger.warning(f"Log 변환 실패: {cfu_value}, 오류: {e}")
             return cfu_value
+    
+    @staticmethod
+    def convert_to_log_series(cfu_values: pd.Series) -> pd.Series:
+        """
+        🆕 CFU → Log 변환 (Series 단위)
         
+        값마다 convert_to_log를 그대로 적용 (시트당 5행 내외라 벡터화 이득이 없고, 결과가 항상 동일)
+        """
+        return cfu_values.map(DataCleaner.convert_to_log)
+
+
+def _open_readonly(path: str):
+    """
+    🆕 통계/시트 목록 조회용 워크북 열기
+    
+    읽기 전용 + 캐시된 값만(data_only) + 외부 링크 미로드. 워크시트는 접근 전까지 파싱되지 않음
+    셀 값은 iter_sheet_rows로만 읽을 것 (ws.cell / ws['A1'] 금지)
+    """
+    from openpyxl import load_workbook
+    return load_workbook(path, read_only=True, data_only=True, keep_links=False)
+
+
+def iter_sheet_rows(worksheet, min_row: int = 1):
+    """
+    🆕 읽기 전용 워크시트의 행 값 순회 (값 튜플)
+    
+    read_only 모드에서 ws.cell(r, c) / ws['A1']은 호출마다 시트 XML을 처음부터 다시 파싱하므로
+    (셀 수에 비례해 수백 배 느림) 읽기 전용 시트는 이 함수로 한 번에 순회
+    """
+    return worksheet.iter_rows(min_row=min_row, values_only=True)
+
+
+# 🆕 xl/workbook.xml의 <sheet ... name="..."> 속성 (네임스페이스 접두사 허용)
+_SHEET_NAME_ATTR_RE = re.compile(r'<(?:\w+:)?sheet\b[^>]*?\sname="([^"]*)"')
+
+
+def _read_sheet_names(path: str) -> List[str]:
+    """
+    🆕 파일의 시트 목록 (파일 수정 시각/크기가 같으면 워크북을 다시 열지 않음)
+    """
+    stat = os.stat(path)
+    return list(_read_sheet_names_cached(path, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=32)
+def _read_sheet_names_cached(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """
+    🆕 (경로, 수정 시각, 크기)별 시트 목록 캐시 (세션마다 새 파일이 생기므로 최근 32개만 유지)
+    """
+    try:
+        # 🆕 xlsx(zip)의 xl/workbook.xml에서 <sheet name=...>만 읽기 (스타일/공유 문자열 파싱 없음)
+        with zipfile.ZipFile(path) as zf:
+            workbook_xml = zf.read("xl/workbook.xml")
+        sheet_names = [
+            xml_unescape(name, {"&quot;": '"', "&apos;": "'"})
+            for name in _SHEET_NAME_ATTR_RE.findall(workbook_xml.decode("utf-8"))
+        ]
+        if not sheet_names:
+            # 속성 형식이 예상과 다르면 XML 파서로 재시도
+            sheet_names = [
+                elem.get("name")
+                for elem in ET.fromstring(workbook_xml).iter()
+                if elem.tag.rsplit("}", 1)[-1] == "sheet"
+            ]
+    except (KeyError, zipfile.BadZipFile, ET.ParseError, UnicodeDecodeError) as e:
+        logger.debug(f"workbook.xml 직접 읽기 실패 - openpyxl 사용: {e}")
+        workbook = _open_readonly(path)
+        try:
+            sheet_names = workbook.sheetnames
+        finally:
+            workbook.close()
+    
+    return tuple(sheet_names)
+
 
 class ExcelIncrementalSaver:
     """
     Excel 증분 저장 관리 클래스
     
     기능:
-    - 페이지 처리할 때마다 즉시 Excel 파일에 저장
+    - 페이지 데이터를 대기열(pending)에 쌓고 일괄 반영 (load/save 반복 없음)
+    - 다운로드 요청 시 또는 대기열이 flush_threshold에 도달하면 한 번에 직렬화하여 저장
     - 템플릿 기반 시트 생성 (copy_worksheet 사용)
     - 중복 시트명 자동 처리
     """
@@ -848,14 +1283,62 @@ class ExcelIncrementalSaver:
     # 🆕 기본 템플릿 파일 경로
     DEFAULT_TEMPLATE = "TestResult_OCR_v1.xlsx"
     
-    def __init__(self, output_path="보존력시험_최종.xlsx", template_file=None):
+    # 🆕 시트 매핑 셀 좌표 (row, column) - 좌표 문자열 파싱 없이 worksheet.cell로 접근
+    #    열 번호: E=5, I=9, J=10, L=12, M=13, O=15, P=16, R=18, S=19, U=21, AA=27
+    _TEST_NUMBER_CELLS = [(3, 27), (33, 27)]      # AA3(원본), AA33(Log)
+    _PRESCRIPTION_CELLS = [(4, 5), (34, 5)]       # E4(원본), E34(Log)
+    _DATE_CELLS_ORIGINAL = [(19, 9), (19, 12), (19, 15), (19, 18)]  # I19, L19, O19, R19
+    _DATE_CELLS_LOG = [(49, 9), (49, 12), (49, 15), (49, 18)]       # I49, L49, O49, R49
+    
+    _STRAIN_ALIASES = {
+        'E.coli': 'E.coli',
+        'Escherichia coli': 'E.coli',
+        'P.aeruginosa': 'P.aeruginosa',
+        'Pseudomonas aeruginosa': 'P.aeruginosa',
+        'S.aureus': 'S.aureus',
+        'Staphylococcus aureus': 'S.aureus',
+        'C.albicans': 'C.albicans',
+        'Candida albicans': 'C.albicans',
+        'A.brasiliensis': 'A.brasiliensis',
+        'Aspergillus brasiliensis': 'A.brasiliensis'
+    }
+    
+    # 원본 CFU (J/M/P/S) + 판정(U), 20~24행
+    _ORIGINAL_CELLS = {
+        'E.coli': [(20, 10), (20, 13), (20, 16), (20, 19), (20, 21)],
+        'P.aeruginosa': [(21, 10), (21, 13), (21, 16), (21, 19), (21, 21)],
+        'S.aureus': [(22, 10), (22, 13), (22, 16), (22, 19), (22, 21)],
+        'C.albicans': [(23, 10), (23, 13), (23, 16), (23, 19), (23, 21)],
+        'A.brasiliensis': [(24, 10), (24, 13), (24, 16), (24, 19), (24, 21)]
+    }
+    
+    # Log CFU (J/M/P/S), 50~54행
+    _LOG_CELLS = {
+        'E.coli': [(50, 10), (50, 13), (50, 16), (50, 19)],
+        'P.aeruginosa': [(51, 10), (51, 13), (51, 16), (51, 19)],
+        'S.aureus': [(52, 10), (52, 13), (52, 16), (52, 19)],
+        'C.albicans': [(53, 10), (53, 13), (53, 16), (53, 19)],
+        'A.brasiliensis': [(54, 10), (54, 13), (54, 16), (54, 19)]
+    }
+    
+    def __init__(self, output_path="보존력시험_최종.xlsx", template_file=None, flush_threshold=10):
         """
         Args:
             output_path (str): 저장할 Excel 파일 경로
             template_file (str): 템플릿 Excel 파일 경로 (None이면 기본값 사용)
+            flush_threshold (int): 대기열이 이 개수에 도달하면 파일에 자동 기록
         """
         self.output_path = output_path
         
+        # 🆕 시트 반영 대기열: [(df, date_info, test_numbers), ...]
+        self.pending = []
+        self.flush_threshold = flush_threshold
+        
+        # 🆕 메모리 상주 워크북 (최초 1회만 로드)
+        self._workbook = None
+        self._dirty = False
+        self._cached_bytes = None  # 🆕 다운로드용 직렬화 결과 캐시
+        
         # 🆕 template_file이 None이면 기본 템플릿 사용
         if template_file is None:
             self.template_file = self.DEFAULT_TEMPLATE
@@ -878,29 +1361,27 @@ class ExcelIncrementalSaver:
         """Excel 파일 초기화"""
         try:
             if self.template_file and os.path.exists(self.template_file):
-                # 🆕 템플릿 파일 전체 복사
-                import shutil
-                shutil.copy2(self.template_file, self.output_path)
-                
-                # 🆕 첫 번째 시트를 TEMPLATE_BASE로 이름 변경
+                # 🆕 템플릿을 메모리로 1회 로드 (파일 복사 후 재로드 없음)
                 from openpyxl import load_workbook
-                workbook = load_workbook(self.output_path)
+                workbook = load_workbook(self.template_file)
                 
+                # 🆕 첫 번째 시트를 TEMPLATE_BASE로 이름 변경
                 if len(workbook.sheetnames) > 0:
                     first_sheet = workbook[workbook.sheetnames[0]]
                     first_sheet.title = "TEMPLATE_BASE"
                     logger.info(f"✅ 템플릿 시트 '{workbook.sheetnames[0]}' → 'TEMPLATE_BASE'로 변경")
                 
                 workbook.save(self.output_path)
-                workbook.close()
+                self._workbook = workbook
                 
                 logger.info(f"✅ 템플릿 기반 Excel 초기화 완료: {self.output_path}")
             else:
                 # 빈 Excel 생성
+                from openpyxl import Workbook
                 wb = Workbook()
                 wb.remove(wb.active)
                 wb.save(self.output_path)
-                wb.close()
+                self._workbook = wb
                 
                 logger.warning(f"⚠️ 템플릿 없이 빈 Excel 파일 생성: {self.output_path}")
             
@@ -911,6 +1392,58 @@ class ExcelIncrementalSaver:
             traceback.print_exc()
             return False
     
+    def _get_workbook(self):
+        """메모리 상주 워크북 반환 (없으면 파일에서 1회 로드)"""
+        if self._workbook is None:
+            from openpyxl import load_workbook
+            self._workbook = load_workbook(self.output_path)
+        return self._workbook
+    
+    def _flush(self):
+        """
+        변경된 워크북을 한 번만 직렬화하여 파일에 기록
+        
+        Returns:
+            bytes: 직렬화된 Excel 바이트 (변경 없으면 None)
+        """
+        self._apply_pending()
+        
+        if not self._dirty or self._workbook is None:
+            return None
+        
+        buffer = io.BytesIO()
+        self._workbook.save(buffer)
+        excel_bytes = buffer.getvalue()
+        
+        with open(self.output_path, 'wb') as f:
+            f.write(excel_bytes)
+        
+        self._dirty = False
+        self._cached_bytes = excel_bytes
+        logger.info(f"💾 Excel 파일 기록 완료: {len(excel_bytes)} bytes")
+        return excel_bytes
+    
+    def flush(self):
+        """
+        🆕 대기열/변경분을 즉시 파일에 기록 (종료 시점 등 명시적 저장용)
+        
+        Returns:
+            bool: 성공 여부 (기록할 변경이 없어도 True)
+        """
+        try:
+            self._flush()
+            return True
+        except Exception as e:
+            logger.error(f"❌ Excel 기록 실패: {e}")
+            return False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+        return False
+    
     def add_test_data(self, test_data, date_info=None):
         """
         테스트 데이터를 Excel에 추가
@@ -923,13 +1456,11 @@ class ExcelIncrementalSaver:
             bool: 성공 여부
         """
         try:
-            from openpyxl import load_workbook
-            
             # DataFrame으로 변환
             if isinstance(test_data, pd.DataFrame):
                 df = test_data
             elif isinstance(test_data, list):
-                df = pd.DataFrame(test_data)
+                df = DataCleaner.rows_to_frame(test_data)
             else:
                 logger.error("❌ 지원하지 않는 데이터 형식")
                 return False
@@ -950,63 +1481,109 @@ class ExcelIncrementalSaver:
                 logger.warning("⚠️ 유효한 시험번호가 없습니다")
                 return False
             
-            logger.info(f"📋 {len(test_numbers)}개 시험번호 발견: {list(test_numbers)}")
-            
-            # Excel 파일 로드
-            workbook = load_workbook(self.output_path)
+            # 빈 시험번호 제외
+            test_numbers = [t for t in test_numbers if t and str(t).strip() != '']
             
-            success_count = 0
+            if len(test_numbers) == 0:
+                logger.warning("⚠️ 유효한 시험번호가 없습니다")
+                return False
             
-            # 🆕 각 시험번호별로 처리
-            for test_number in test_numbers:
-                if not test_number or str(test_number).strip() == '':
-                    continue
-                
-                # 해당 시험번호의 데이터만 추출
-                df_subset = df[df['test_number'] == test_number].copy()
-                
-                if df_subset.empty:
-                    logger.warning(f"⚠️ {test_number}: 데이터 없음")
-                    continue
-                
-                logger.info(f"🔄 {test_number} 처리 중... ({len(df_subset)}개 행)")
-                
-                # 중복 시트명 처리
-                sheet_name = str(test_number)
-                counter = 1
-                original_name = sheet_name
-                while sheet_name in workbook.sheetnames:
-                    sheet_name = f"{original_name}_{counter}"
-                    counter += 1
-                
-                # 🆕 템플릿 시트 복사하여 새 시트 생성
-                if "TEMPLATE_BASE" in workbook.sheetnames:
-                    template_sheet = workbook["TEMPLATE_BASE"]
-                    new_sheet = workbook.copy_worksheet(template_sheet)
-                    new_sheet.title = sheet_name
-                    logger.info(f"✅ 템플릿 시트 복사 완료: {sheet_name}")
-                else:
-                    # 템플릿이 없으면 빈 시트 생성
-                    new_sheet = workbook.create_sheet(title=sheet_name)
-                    logger.warning(f"⚠️ 템플릿 없이 빈 시트 생성: {sheet_name}")
-                
-                # 데이터 매핑 (해당 시험번호의 데이터만)
-                self._map_data_to_sheet(new_sheet, df_subset, date_info)
-                
-                success_count += 1
+            logger.info(f"📋 {len(test_numbers)}개 시험번호 발견: {test_numbers}")
             
-            # 즉시 저장
-            workbook.save(self.output_path)
-            workbook.close()
+            # 🆕 대기열에 추가 (시트 생성/직렬화는 flush 시 일괄 처리)
+            self.pending.append((df.copy(), date_info, test_numbers))
+            self._dirty = True
+            self._cached_bytes = None
             
-            logger.info(f"💾 Excel 저장 완료: {success_count}개 시트 추가")
-            return success_count > 0
+            logger.info(f"📥 Excel 대기열 추가: {len(test_numbers)}개 시험 (대기 {len(self.pending)}건)")
             
         except Exception as e:
             logger.error(f"❌ Excel 저장 실패: {e}")
             import traceback
             traceback.print_exc()
             return False
+        
+        # 🆕 대기열 추가는 이미 성공 - 자동 기록 실패는 대기열/워크북에 남아 다음 기록 시 재시도
+        #    (False를 반환하면 사용자가 같은 페이지를 다시 저장해 중복 시트가 생김)
+        if len(self.pending) >= self.flush_threshold and not self.flush():
+            logger.warning("⚠️ 자동 기록 실패 - 다음 저장/다운로드 시 다시 기록합니다")
+        
+        return True
+    
+    def _apply_pending(self):
+        """🆕 대기열의 페이지 데이터를 워크북 시트로 반영"""
+        if not self.pending:
+            return
+        
+        # 메모리 상주 워크북 사용 (파일 재로드 없음)
+        workbook = self._get_workbook()
+        # 🆕 템플릿 시트는 한 번만 조회
+        template_sheet = workbook["TEMPLATE_BASE"] if "TEMPLATE_BASE" in workbook.sheetnames else None
+        
+        success_count = 0
+        
+        # 🆕 항목을 꺼내면서 반영 - 도중에 실패해도 이미 반영된 시트가 다음 flush에서 중복 생성되지 않음
+        while self.pending:
+            df, date_info, test_numbers = self.pending.pop(0)
+            
+            # 🆕 각 시험번호별로 처리
+            for index, test_number in enumerate(test_numbers):
+                try:
+                    if self._apply_test_sheet(workbook, template_sheet, df, date_info, test_number):
+                        success_count += 1
+                except Exception:
+                    # 반영하지 못한 시험번호만 대기열 앞에 되돌림
+                    self.pending.insert(0, (df, date_info, test_numbers[index:]))
+                    raise
+        
+        logger.info(f"💾 Excel 반영 완료: {success_count}개 시트 추가")
+    
+    def _apply_test_sheet(self, workbook, template_sheet, df, date_info, test_number):
+        """
+        🆕 시험번호 1개를 새 시트로 반영
+        
+        시트 생성 후 실패하면 만든 시트를 제거하고 예외 전달 (재시도 시 _1 시트가 남지 않음)
+        
+        Returns:
+            bool: 시트 추가 여부 (해당 시험번호 데이터가 없으면 False)
+        """
+        # 해당 시험번호의 데이터만 추출
+        df_subset = df[df['test_number'] == test_number]
+        
+        if df_subset.empty:
+            logger.warning(f"⚠️ {test_number}: 데이터 없음")
+            return False
+        
+        logger.info(f"🔄 {test_number} 처리 중... ({len(df_subset)}개 행)")
+        
+        # 중복 시트명 처리
+        sheet_name = str(test_number)
+        counter = 1
+        original_name = sheet_name
+        while sheet_name in workbook.sheetnames:
+            sheet_name = f"{original_name}_{counter}"
+            counter += 1
+        
+        new_sheet = None
+        try:
+            # 🆕 템플릿 시트 복사하여 새 시트 생성
+            if template_sheet is not None:
+                new_sheet = workbook.copy_worksheet(template_sheet)
+                new_sheet.title = sheet_name
+                logger.info(f"✅ 템플릿 시트 복사 완료: {sheet_name}")
+            else:
+                # 템플릿이 없으면 빈 시트 생성
+                new_sheet = workbook.create_sheet(title=sheet_name)
+                logger.warning(f"⚠️ 템플릿 없이 빈 시트 생성: {sheet_name}")
+            
+            # 데이터 매핑 (해당 시험번호의 데이터만)
+            self._map_data_to_sheet(new_sheet, df_subset, date_info)
+        except Exception:
+            if new_sheet is not None:
+                workbook.remove(new_sheet)
+            raise
+        
+        return True
     
     def _map_data_to_sheet(self, worksheet, df, date_info):
         """데이터를 시트에 매핑"""
@@ -1017,16 +1594,16 @@ class ExcelIncrementalSaver:
             
             # 시험번호 매핑
             test_number = df.iloc[0].get('test_number', '')
-            worksheet['AA3'] = test_number  # 원본 보고서
-            worksheet['AA33'] = test_number  # Log 보고서
+            for r, c in self._TEST_NUMBER_CELLS:
+                worksheet.cell(row=r, column=c).value = test_number
             logger.info(f"📝 시험번호 매핑: AA3, AA33 = {test_number}")
             
             # 처방번호 매핑
             if 'prescription_number' in df.columns:
                 prescription_number = df.iloc[0].get('prescription_number', '')
                 if prescription_number:
-                    worksheet['E4'] = prescription_number  # 원본
-                    worksheet['E34'] = prescription_number  # Log
+                    for r, c in self._PRESCRIPTION_CELLS:
+                        worksheet.cell(row=r, column=c).value = prescription_number
                     logger.info(f"📝 처방번호 매핑: E4, E34 = {prescription_number}")
             
             # 날짜 정보 매핑
@@ -1046,69 +1623,40 @@ class ExcelIncrementalSaver:
                     date_list = []
                 
                 if len(date_list) >= 4:
-                    date_positions_original = ['I19', 'L19', 'O19', 'R19']
-                    date_positions_log = ['I49', 'L49', 'O49', 'R49']
-                    
-                    for i, date_val in enumerate(date_list[:4]):
+                    for (r, c), (log_r, log_c), date_val in zip(
+                        self._DATE_CELLS_ORIGINAL, self._DATE_CELLS_LOG, date_list[:4]
+                    ):
                         if date_val:  # 빈 값이 아닌 경우만 매핑
-                            worksheet[date_positions_original[i]] = date_val
-                            worksheet[date_positions_log[i]] = date_val
+                            worksheet.cell(row=r, column=c).value = date_val
+                            worksheet.cell(row=log_r, column=log_c).value = date_val
                     
                     logger.info(f"📅 날짜 정보 매핑: {date_list}")
             
-            # 균주별 CFU 데이터 매핑
-            strain_mapping = {
-                'E.coli': 'E.coli',
-                'Escherichia coli': 'E.coli',
-                'P.aeruginosa': 'P.aeruginosa',
-                'Pseudomonas aeruginosa': 'P.aeruginosa',
-                'S.aureus': 'S.aureus',
-                'Staphylococcus aureus': 'S.aureus',
-                'C.albicans': 'C.albicans',
-                'Candida albicans': 'C.albicans',
-                'A.brasiliensis': 'A.brasiliensis',
-                'Aspergillus brasiliensis': 'A.brasiliensis'
-            }
-            
-            original_positions = {
-                'E.coli': ['J20', 'M20', 'P20', 'S20', 'U20'],
-                'P.aeruginosa': ['J21', 'M21', 'P21', 'S21', 'U21'],
-                'S.aureus': ['J22', 'M22', 'P22', 'S22', 'U22'],
-                'C.albicans': ['J23', 'M23', 'P23', 'S23', 'U23'],
-                'A.brasiliensis': ['J24', 'M24', 'P24', 'S24', 'U24']
-            }
-            
-            log_positions = {
-                'E.coli': ['J50', 'M50', 'P50', 'S50'],
-                'P.aeruginosa': ['J51', 'M51', 'P51', 'S51'],
-                'S.aureus': ['J52', 'M52', 'P52', 'S52'],
-                'C.albicans': ['J53', 'M53', 'P53', 'S53'],
-                'A.brasiliensis': ['J54', 'M54', 'P54', 'S54']
-            }
+            # 🆕 Log 값은 루프 전에 열 단위로 한 번에 변환
+            cfu_cols = ['cfu_0day', 'cfu_7day', 'cfu_14day', 'cfu_28day']
+            log_df = pd.DataFrame({
+                col: DataCleaner.convert_to_log_series(df[col]) if col in df.columns else ''
+                for col in cfu_cols
+            }, index=df.index)
             
+            # 균주별 CFU 데이터 매핑
             mapped_count = 0
-            for _, row in df.iterrows():
+            for i, (_, row) in enumerate(df.iterrows()):
                 strain = row.get('strain', '')
                 if not strain:
                     continue
                 
-                mapped_strain = strain_mapping.get(strain, strain)
+                mapped_strain = self._STRAIN_ALIASES.get(strain, strain)
                 
-                if mapped_strain in original_positions:
-                    # 원본 CFU 값
-                    positions = original_positions[mapped_strain]
-                    worksheet[positions[0]] = row.get('cfu_0day', '')
-                    worksheet[positions[1]] = row.get('cfu_7day', '')
-                    worksheet[positions[2]] = row.get('cfu_14day', '')
-                    worksheet[positions[3]] = row.get('cfu_28day', '')
-                    worksheet[positions[4]] = row.get('judgment', '')
+                if mapped_strain in self._ORIGINAL_CELLS:
+                    # 원본 CFU 값 + 판정
+                    original_values = [row.get(col, '') for col in cfu_cols] + [row.get('judgment', '')]
+                    for (r, c), value in zip(self._ORIGINAL_CELLS[mapped_strain], original_values):
+                        worksheet.cell(row=r, column=c).value = value
                     
                     # Log 값
-                    log_pos = log_positions[mapped_strain]
-                    worksheet[log_pos[0]] = DataCleaner.convert_to_log(row.get('cfu_0day', ''))
-                    worksheet[log_pos[1]] = DataCleaner.convert_to_log(row.get('cfu_7day', ''))
-                    worksheet[log_pos[2]] = DataCleaner.convert_to_log(row.get('cfu_14day', ''))
-                    worksheet[log_pos[3]] = DataCleaner.convert_to_log(row.get('cfu_28day', ''))
+                    for (r, c), log_value in zip(self._LOG_CELLS[mapped_strain], log_df.iloc[i]):
+                        worksheet.cell(row=r, column=c).value = log_value
                     
                     mapped_count += 1
                     logger.info(f"🦠 {mapped_strain} 데이터 매핑 완료")
@@ -1123,12 +1671,18 @@ class ExcelIncrementalSaver:
     def get_sheet_list(self):
         """현재 Excel 파일의 시트 목록 반환"""
         try:
-            from openpyxl import load_workbook
+            # 🆕 대기열 반영 (메모리 내 시트 생성만, 직렬화 없음)
+            self._apply_pending()
             
-            if os.path.exists(self.output_path):
-                workbook = load_workbook(self.output_path, read_only=True)
-                sheet_names = workbook.sheetnames
-                workbook.close()
+            if self._workbook is not None:
+                sheet_names = self._workbook.sheetnames
+                
+                # TEMPLATE_BASE 제외
+                filtered_names = [name for name in sheet_names if name != "TEMPLATE_BASE"]
+                logger.info(f"📋 시트 목록: {filtered_names}")
+                return filtered_names
+            elif os.path.exists(self.output_path):
+                sheet_names = _read_sheet_names(self.output_path)
                 
                 # TEMPLATE_BASE 제외
                 filtered_names = [name for name in sheet_names if name != "TEMPLATE_BASE"]
@@ -1142,11 +1696,26 @@ class ExcelIncrementalSaver:
             return []
     
     def get_excel_bytes(self):
-        """Excel 파일을 바이트로 읽어서 반환 (다운로드용)"""
+        """
+        Excel 파일을 바이트로 읽어서 반환 (다운로드용)
+        
+        직렬화 결과(bytes)를 복사 없이 그대로 반환. memoryview/mmap은 사용하지 않음:
+        Streamlit download_button은 memoryview를 받지 않고, mmap은 다음 기록 시 파일이 덮어써짐
+        """
         try:
+            # 🆕 변경이 없으면 캐시된 바이트 재사용 (rerun마다 재생성 방지)
+            if not self._dirty and self._cached_bytes is not None:
+                return self._cached_bytes
+            
+            # 변경분이 있으면 한 번 직렬화한 결과를 그대로 반환
+            excel_bytes = self._flush()
+            if excel_bytes is not None:
+                return excel_bytes
+            
             if os.path.exists(self.output_path):
                 with open(self.output_path, 'rb') as f:
                     excel_bytes = f.read()
+                self._cached_bytes = excel_bytes
                 logger.info(f"✅ Excel 파일 읽기 완료: {len(excel_bytes)} bytes")
                 return excel_bytes
             else:
@@ -1156,59 +1725,118 @@ class ExcelIncrementalSaver:
             logger.error(f"❌ Excel 읽기 실패: {e}")
             return None
     
-    def get_statistics(self):
-        """Excel 파일 통계 정보 반환"""
-        try:
-            from openpyxl import load_workbook
-            
+    def get_ready_excel_bytes(self):
+        """
+        🆕 직렬화 없이 바로 반환할 수 있는 Excel 바이트 (대기열/변경분이 있으면 None)
+        
+        화면 갱신마다 호출해도 flush하지 않음 - 필요하면 get_excel_bytes로 생성
+        """
+        if self._dirty:
+            return None
+        return self._cached_bytes
+    
+    def iter_excel_bytes(self, chunk_size: int = 1 << 20):
+        """
+        🆕 Excel 파일을 청크 단위로 반환 (HTTP 응답 등 스트리밍 소비자용)
+        
+        파일 전체를 하나의 bytes로 만들지 않음. 직렬화 캐시가 있으면 복사 없이 memoryview 조각으로 반환
+        (Streamlit download_button은 전체 bytes가 필요하므로 get_excel_bytes 사용)
+        """
+        self._flush()
+        
+        if self._cached_bytes is not None:
+            view = memoryview(self._cached_bytes)
+            for start in range(0, len(view), chunk_size):
+                yield view[start:start + chunk_size]
+            return
+        
+        if not os.path.exists(self.output_path):
+            logger.warning(f"⚠️ Excel 파일이 존재하지 않음: {self.output_path}")
+            return
+        
+        with open(self.output_path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    
+    def has_data(self):
+        """
+        🆕 저장된 시험 시트가 있는지 확인 (파일 시스템 접근 없음)
+        
+        Returns:
+            bool: TEMPLATE_BASE 외 시트가 1개 이상이면 True
+        """
+        if self.pending:
+            return True
+        
+        if self._workbook is None:
+            # 기존 파일로 생성된 경우에만 1회 로드
             if not os.path.exists(self.output_path):
-                return {
-                    'total_sheets': 0,
-                    'test_sheets': 0,
-                    'file_size': 0
-                }
-            
-            workbook = load_workbook(self.output_path, read_only=True)
-            total_sheets = len(workbook.sheetnames)
-            test_sheets = len([name for name in workbook.sheetnames if name != "TEMPLATE_BASE"])
-            workbook.close()
-            
-            file_size = os.path.getsize(self.output_path)
-            
-            stats = {
-                'total_sheets': total_sheets,
-                'test_sheets': test_sheets,
-                'file_size': file_size,
-                'file_size_mb': round(file_size / (1024 * 1024), 2)
-            }
+                return False
+            self._get_workbook()
+        return any(name != "TEMPLATE_BASE" for name in self._workbook.sheetnames)
+    
+    def get_file_size(self):
+        """
+        🆕 Excel 파일 크기만 반환 (os.stat만 사용, 워크북 열지 않음)
+        
+        Returns:
+            dict: {'file_size', 'file_size_mb'}
+        """
+        try:
+            file_size = os.stat(self.output_path).st_size
+        except OSError:
+            file_size = 0
+        return {
+            'file_size': file_size,
+            'file_size_mb': round(file_size / (1024 * 1024), 2)
+        }
+    
+    def get_sheet_counts(self):
+        """
+        🆕 시트 수만 반환 (메모리 워크북 또는 파일의 시트 목록 + 대기열)
+        
+        Returns:
+            dict: {'total_sheets', 'test_sheets'}
+        """
+        try:
+            if self._workbook is not None:
+                sheet_names = self._workbook.sheetnames
+            elif os.path.exists(self.output_path):
+                sheet_names = _read_sheet_names(self.output_path)
+            else:
+                return {'total_sheets': 0, 'test_sheets': 0}
             
-            logger.info(f"📊 통계: {stats}")
-            return stats
+            # 🆕 대기열은 시험번호당 1개 시트로 집계 (반영 없이 계산)
+            pending_sheets = sum(len(test_numbers) for _, _, test_numbers in self.pending)
             
-        except Exception as e:
-            logger.error(f"❌ 통계 조회 실패: {e}")
             return {
-                'total_sheets': 0,
-                'test_sheets': 0,
-                'file_size': 0
+                'total_sheets': len(sheet_names) + pending_sheets,
+                'test_sheets': len([name for name in sheet_names if name != "TEMPLATE_BASE"]) + pending_sheets
             }
+        except Exception as e:
+            logger.error(f"❌ 시트 수 조회 실패: {e}")
+            return {'total_sheets': 0, 'test_sheets': 0}
+    
+    def get_statistics(self):
+        """Excel 파일 통계 정보 반환 (시트 수 + 파일 크기)"""
+        stats = {**self.get_sheet_counts(), **self.get_file_size()}
+        logger.info(f"📊 통계: {stats}")
+        return stats
 
 # 편의 함수
-def process_pdf_page(pdf_bytes: bytes, page_index: int, fallback_manager=None) -> dict:
+def process_pdf_page(pdf_bytes: Union[bytes, str], page_index: int, fallback_manager=None) -> PageResult:
     """PDF 페이지 전체 처리 파이프라인 (fallback 지원)"""
-    result = {
-        'success': False,
-        'data': [],
-        'date_info': {},
-        'message': ''
-    }
+    result = PageResult()
     
     try:
                 # 🆕 0단계: DRM 처리
         drm_success, processed_pdf_bytes, drm_message = PDFProcessor.process_drm_if_needed(pdf_bytes)
         
         if not drm_success:
-            result['message'] = drm_message
+            result.message = drm_message
             return result
         
         logger.info(f"📄 DRM 처리 결과: {drm_message}")
@@ -1216,30 +1844,102 @@ def process_pdf_page(pdf_bytes: bytes, page_index: int, fallback_manager=None) -
         # 🆕 fallback_manager가 없으면 새로 생성
         if fallback_manager is None:
             fallback_manager = FallbackManager()
+        
+        # 🆕 내용이 없는 페이지는 렌더링/OCR 요청 없이 빈 결과
+        if PDFProcessor.is_blank_page(processed_pdf_bytes, page_index):
+            result.success = True
+            result.message = "빈 페이지 - OCR 생략"
+            logger.info(f"📄 페이지 {page_index + 1}: 빈 페이지 - OCR 생략")
+            return result
             
         # 1. 이미지 렌더링
-        img_bytes = PDFProcessor.render_page_image(processed_pdf_bytes, page_index)
+        img_bytes = PDFProcessor.render_page_image(
+            processed_pdf_bytes, page_index,
+            image_format="jpeg", jpg_quality=OCR_JPEG_QUALITY,
+            max_long_edge=OCR_MAX_LONG_EDGE, dpi=OCR_RENDER_DPI
+        )
         if not img_bytes:
-            result['message'] = "이미지 렌더링 실패"
+            result.message = "이미지 렌더링 실패"
             return result
         
         # 2. OCR 처리
         ocr_result = OCRProcessor.request_ocr(img_bytes)
         if not ocr_result:
-            result['message'] = "OCR 처리 실패"
+            result.message = "OCR 처리 실패"
             return result
         
         # 3. 테이블 파싱 (🆕 fallback_manager 전달)
         table_data, date_info = OCRProcessor.parse_table_from_ocr(ocr_result, fallback_manager)
         
-        result['success'] = True
-        result['data'] = table_data
-        result['date_info'] = date_info
-        result['message'] = f"{len(table_data)}개 균주 데이터 추출 완료"
+        result.success = True
+        result.data = table_data
+        result.date_info = date_info
+        result.message = f"{len(table_data)}개 균주 데이터 추출 완료"
         
         return result
         
     except Exception as e:
         logger.error(f"처리 오류: {e}")
-        result['message'] = str(e)
-        return result
\ No newline at end of file
+        result.message = str(e)
+        return result
+
+
+def _process_pdf_page_with_retry(pdf_bytes: Union[bytes, str], page_index: int, max_retries: int) -> PageResult:
+    """페이지 처리 (실패 시 지수 백오프 재시도: 1초, 2초, 4초...)"""
+    result = None
+    for attempt in range(max_retries):
+        # 병렬 처리 시 페이지별로 독립된 FallbackManager 사용 (스레드 간 공유 금지)
+        result = process_pdf_page(pdf_bytes, page_index, FallbackManager())
+        if result.success:
+            return result
+        
+        if attempt < max_retries - 1:
+            delay = 2 ** attempt
+            logger.warning(f"⚠️ 페이지 {page_index + 1} OCR 실패, {delay}초 후 재시도: {result.message}")
+            time.sleep(delay)
+    
+    return result
+
+
+def process_pdf_pages(pdf_bytes: Union[bytes, str], page_indices: List[int],
+                      max_workers: int = 8, max_retries: int = 1):
+    """
+    🆕 여러 페이지 병렬 처리 (렌더링/OCR 요청/파싱을 페이지 간에 겹쳐 실행)
+    
+    DRM 처리는 한 번만 수행하고, 페이지별 결과는 완료되는 순서대로 반환
+    
+    Yields:
+        Tuple[int, PageResult]: (page_index, 페이지 처리 결과)
+    """
+    if not page_indices:
+        return
+    
+    drm_success, processed_pdf_bytes, drm_message = PDFProcessor.process_drm_if_needed(pdf_bytes)
+    if not drm_success:
+        for page_index in page_indices:
+            yield page_index, PageResult(message=drm_message)
+        return
+    
+    # 이미 처리된 내용은 spool 파일로 넘겨 페이지마다 DRM 판별이 반복되지 않게 함
+    spooled_path = None
+    if not isinstance(processed_pdf_bytes, str):
+        processed_pdf_bytes, _ = PDFProcessor.spool_to_disk(processed_pdf_bytes)
+        spooled_path = processed_pdf_bytes
+    
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(page_indices))) as ex:
+            futures = {
+                ex.submit(_process_pdf_page_with_retry, processed_pdf_bytes, page_index, max_retries): page_index
+                for page_index in page_indices
+            }
+            for future in as_completed(futures):
+                page_index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = PageResult(message=str(e))
+                yield page_index, result
+    finally:
+        # 🆕 이 함수가 만든 임시 파일은 처리 후 바로 삭제
+        if spooled_path is not None:
+            PDFProcessor.discard_spooled(spooled_path)
@@ -3,58 +3,73 @@
 스킨케어 팀 구조를 참고하여 보존력 시험에 맞게 커스터마이징
 """
 
+import atexit
+import copy
 import io
+import itertools
 import logging
+import logging.handlers
+import multiprocessing
+import queue
 import os
 import tempfile
 import re
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timedelta
 import math
+from functools import lru_cache
+from importlib.util import find_spec
 
 # Azure OCR
 from azure.ai.formrecognizer import DocumentAnalysisClient
 from azure.core.credentials import AzureKeyCredential
 
-# 기존 backend에서 PDFProcessor만 import
-from backend import PDFProcessor
+# 기존 backend에서 PDFProcessor만 import (🆕 읽기 전용 시트 순회 헬퍼 포함)
+from backend import PDFProcessor, iter_sheet_rows, _read_sheet_names
 
-# Excel 처리
-try:
-    import openpyxl
-    from openpyxl import load_workbook
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
+# Excel 처리 (🆕 설치 여부만 확인, 실제 import는 사용하는 함수 안에서 - 모듈 로드 시간 절감)
+OPENPYXL_AVAILABLE = find_spec("openpyxl") is not None
+if not OPENPYXL_AVAILABLE:
     print("⚠️ openpyxl 라이브러리를 찾을 수 없습니다. pip install openpyxl로 설치하세요.")
 
+# 🆕 openpyxl은 lxml이 있으면 C 기반 XML 파서/직렬화를 사용 (없으면 xlsx 읽기/저장이 크게 느려짐)
+LXML_AVAILABLE = find_spec("lxml") is not None
+if OPENPYXL_AVAILABLE and not LXML_AVAILABLE:
+    print("⚠️ lxml 라이브러리를 찾을 수 없습니다. Excel 읽기/저장이 느려집니다. pip install lxml로 설치하세요.")
+
 # ========================================
 # 로그 설정 (파일 + 콘솔 동시 출력)
 # ========================================
 def setup_logging():
-    """로그 파일 및 콘솔 출력 설정"""
-    
-    # 로그 디렉토리 생성
-    log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    """
+    로그 파일 및 콘솔 출력 설정
     
-    # 로그 파일명 (타임스탬프 포함)
-    log_filename = os.path.join(
-        log_dir, 
-        f"preservation_ocr_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    )
+    🆕 OCR_NO_FILE_LOG=1 이면 로그 파일 없이 콘솔만 출력 (디렉토리 생성/파일 열기 생략)
+    🆕 이미 설정된 로거는 그대로 반환 (모듈 재로드 시 핸들러/리스너 중복 생성 방지)
+    🆕 OCR 워커 프로세스에서는 파일/리스너를 만들지 않음 (init_worker_logging이 부모 큐로 연결)
+    """
     
     # 로거 설정
     logger = logging.getLogger(__name__)
-    logger.setLevel(logging.DEBUG)  # 모든 레벨 기록
+    if getattr(logger, '_preservation_configured', False):
+        return logger
+    
+    # 모든 레벨 기록 (🆕 PRESERVATION_LOG_LEVEL=INFO 등으로 올리면 DEBUG 메시지는 포맷팅 없이 버려짐)
+    log_level = logging.getLevelName(os.getenv('PRESERVATION_LOG_LEVEL', 'DEBUG').upper())
+    logger.setLevel(log_level if isinstance(log_level, int) else logging.DEBUG)
     
     # 🔧 중복 출력 방지: 상위 로거로 전파 차단
     logger.propagate = False
     
-    # 기존 핸들러 제거 (중복 방지)
-    if logger.hasHandlers():
-        logger.handlers.clear()
+    # 🆕 spawn으로 시작된 워커 프로세스: 자체 로그 파일 없이 부모 프로세스 로그로 전달
+    #    (워커에서 이 모듈은 initializer 역직렬화 중 import되므로 부트스트랩 전에도 설정되는 프로세스 이름으로 판별)
+    if multiprocessing.current_process().name != 'MainProcess':
+        logger._preservation_configured = True
+        return logger
     
     # 포맷 설정
     formatter = logging.Formatter(
@@ -62,22 +77,48 @@ def setup_logging():
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
+    handlers = []
+    log_filename = None
+    
     # 1. 파일 핸들러 (모든 로그를 파일에 저장)
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    if os.getenv('OCR_NO_FILE_LOG') != '1':
+        # 로그 디렉토리 생성
+        log_dir = "logs"
+        if not os.path.exists(log_dir):
+            os.makedirs(log_dir)
+        
+        # 로그 파일명 (타임스탬프 포함)
+        log_filename = os.path.join(
+            log_dir, 
+            f"preservation_ocr_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        )
+        
+        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
     
     # 2. 콘솔 핸들러 (INFO 이상만 콘솔 출력)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers.append(console_handler)
+    
+    # 🆕 로거에는 큐 핸들러만 연결: 로그 호출은 큐에 넣고 즉시 반환,
+    #    파일/콘솔 쓰기는 백그라운드 스레드(QueueListener)에서 수행 (OCR 처리 경로에서 I/O 대기 없음)
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)  # 종료 시 남은 로그 기록
+    logger._preservation_configured = True
     
     # 초기 메시지
     logger.info("="*80)
     logger.info("🚀 보존력 시험 OCR 시스템 시작")
-    logger.info(f"📁 로그 파일: {log_filename}")
+    logger.info(f"📁 로그 파일: {log_filename or '사용 안 함 (OCR_NO_FILE_LOG=1)'}")
     logger.info("="*80)
     
     return logger
@@ -85,6 +126,33 @@ def setup_logging():
 # 로거 초기화
 logger = setup_logging()
 
+# 🆕 워커 프로세스 로그 수신 큐 (부모 프로세스에서 최초 요청 시 1회 생성)
+_worker_log_queue = None
+_worker_log_lock = threading.Lock()
+
+
+def get_worker_log_queue():
+    """
+    🆕 OCR 워커 프로세스 로그를 받을 큐 (부모 프로세스용)
+    
+    받은 레코드는 이 프로세스의 로거 핸들러로 넘겨 같은 로그 파일/콘솔에 기록
+    """
+    global _worker_log_queue
+    with _worker_log_lock:
+        if _worker_log_queue is None:
+            log_queue = multiprocessing.get_context("spawn").Queue(-1)
+            listener = logging.handlers.QueueListener(log_queue, *logger.handlers)
+            listener.start()
+            atexit.register(listener.stop)  # 파일 리스너보다 먼저 멈춰 남은 워커 로그까지 기록
+            _worker_log_queue = log_queue
+    return _worker_log_queue
+
+
+def init_worker_logging(log_queue):
+    """🆕 OCR 워커 프로세스 초기화 (ProcessPoolExecutor initializer): 로그를 부모 프로세스 큐로 전달"""
+    logger.handlers.clear()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
 # 환경 변수
 AZURE_KEY = os.getenv('AZURE_KEY', '')
 AZURE_ENDPOINT = os.getenv('AZURE_ENDPOINT', '')
@@ -119,29 +187,53 @@ def load_progress_excel(excel_path: str) -> Dict[str, Dict[str, str]]:
         logger.warning(f"⚠️ 진행서 파일을 찾을 수 없습니다: {excel_path}")
         return {}
     
+    # 🆕 (경로, 수정 시각, 크기)로 캐시: 배치 처리 중 반복 호출은 재파싱 없음, 파일이 바뀌면 자동 무효화
+    stat = os.stat(excel_path)
+    return _load_progress_excel_cached(excel_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_progress_excel_cached(excel_path: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, str]]:
+    """진행서 파싱 (mtime_ns/size는 캐시 키 용도) - 반환 딕셔너리는 공유되므로 호출 측에서 수정 금지"""
+    wb = None
     try:
         logger.info(f"\n📖 진행서 파일 읽기: {excel_path}")
         
-        wb = load_workbook(excel_path, data_only=True)
+        # 읽기 전용(스트리밍) 모드: 셀 전체를 메모리에 올리지 않고 행 단위로 순회
+        from openpyxl import load_workbook
+        wb = load_workbook(excel_path, read_only=True, data_only=True)
         ws = wb.active
+        rows = iter_sheet_rows(ws)
         
         # 데이터 딕셔너리 초기화
         data_dict = {}
         
-        # 헤더 행 찾기 (첫 번째 행 또는 "제품명" 포함 행)
+        # 헤더 행 찾기 (첫 번째 행 또는 "제품명" 포함 행, 최대 9행)
+        first_rows = []
         header_row = 1
-        for row_idx in range(1, min(10, ws.max_row + 1)):
-            cell_value = ws.cell(row_idx, 1).value
+        header_values = None
+        for row_idx, row in enumerate(rows, start=1):
+            first_rows.append(row)
+            cell_value = row[0] if row else None
             if cell_value and '제품명' in str(cell_value):
                 header_row = row_idx
+                header_values = row
+                break
+            if row_idx >= 9:
                 break
         
+        if header_values is None:
+            # "제품명" 행이 없으면 첫 행을 헤더로 사용하고 나머지는 데이터로 처리
+            header_values = first_rows[0] if first_rows else ()
+            pending_rows = first_rows[1:]
+        else:
+            pending_rows = []
+        
         logger.info(f"  📍 헤더 행: {header_row}")
         
-        # 컬럼 인덱스 찾기
+        # 컬럼 인덱스 찾기 (0-based)
         col_map = {}
-        for col_idx in range(1, ws.max_column + 1):
-            cell_value = ws.cell(header_row, col_idx).value
+        for col_idx, cell_value in enumerate(header_values):
             if cell_value:
                 cell_value_str = str(cell_value).strip()
                 if '제품명' in cell_value_str:
@@ -162,11 +254,15 @@ def load_progress_excel(excel_path: str) -> Dict[str, Dict[str, str]]:
             logger.warning(f"  ⚠️ 필수 컬럼 누락: {missing_cols}")
             return {}
         
-        # 데이터 행 읽기
+        def _get(row, key):
+            idx = col_map[key]
+            return row[idx] if idx < len(row) else None
+        
+        # 데이터 행 읽기 (헤더 이후 행을 한 번만 순회)
         data_count = 0
-        for row_idx in range(header_row + 1, ws.max_row + 1):
+        for row in itertools.chain(pending_rows, rows):
             # 처방번호 읽기
-            prescription = ws.cell(row_idx, col_map['prescription']).value
+            prescription = _get(row, 'prescription')
             if not prescription:
                 continue
             
@@ -175,9 +271,9 @@ def load_progress_excel(excel_path: str) -> Dict[str, Dict[str, str]]:
                 continue
             
             # 추가 정보 읽기
-            product_name = ws.cell(row_idx, col_map['product_name']).value
-            formulation = ws.cell(row_idx, col_map['formulation']).value
-            preservative = ws.cell(row_idx, col_map['preservative']).value
+            product_name = _get(row, 'product_name')
+            formulation = _get(row, 'formulation')
+            preservative = _get(row, 'preservative')
             
             # 딕셔너리에 저장
             data_dict[prescription_str] = {
@@ -189,18 +285,290 @@ def load_progress_excel(excel_path: str) -> Dict[str, Dict[str, str]]:
             data_count += 1
         
         logger.info(f"  ✅ 진행서 데이터 로드 완료: {data_count}개")
-        wb.close()
         
         return data_dict
         
     except Exception as e:
         logger.error(f"  ❌ 진행서 읽기 실패: {e}")
         return {}
+    
+    finally:
+        # 읽기 전용 워크북은 파일 핸들을 유지하므로 예외 시에도 닫기
+        if wb is not None:
+            wb.close()
+
+
+# ========================================
+# 🆕 정규식 사전 컴파일 (모듈 로드 시 1회)
+# ========================================
+_DATE_DOT_FIX_RE = re.compile(r'^(\d)\.(\d)\s+(\d{1,2})$')       # '0.5 15' → '05 15'
+_DATE_SEP_RE = re.compile(r'^(\d{1,2})[/\-.](\d{1,2})$')          # MM/DD, MM-DD, MM.DD
+_DATE_SPACE_RE = re.compile(r'^(\d{1,2})\s+(\d{1,2})$')          # MM DD
+_TEST_NUM_RE = re.compile(r'\b(\d{2}[A-Z]\d{2}[A-Z]\d{2,3})\b')
+# 처방번호 (두 형식을 하나의 정규식으로 결합, 같은 위치에서는 a 형식 우선)
+_PRESC_RE = re.compile(r'\b(?:(?P<a>[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,4}\d?)|(?P<b>[A-Z]{2,4}\d{4}-[A-Z]{1,5}))\b')
+# 🆕 시험번호/처방번호 추출 (_extract_test_info, _extract_test_info_from_row 공용)
+# 전처리: OCR 오류 보정 (!, | → I) / 대시 주변 공백/연속 대시/연속 공백 정리
+_CODE_OCR_TRANSLATE = str.maketrans({'!': 'I', '|': 'I'})
+_DASH_RUN_RE = re.compile(r'[\s-]*-[\s-]*')  # 대시가 섞인 공백/대시 구간 ('- ', ' -', '--', ' - - ') → '-'
+_MULTI_DASH_RE = re.compile(r'-+')            # '--', '---' → '-'
+_MULTI_SPACE_RE = re.compile(r'\s+')          # 연속 공백 → 단일
+# 시험번호 (행 단위 추출, 우선순위 순)
+_ROW_TEST_NUM_RES = (
+    re.compile(r'\b(2[0-9][A-Z]\d{2}[I!|1]\d{2})\b'),  # 25A15I14, 25A15|14
+    re.compile(r'\b(2[0-9][E]\d{2}1\d{2})\b'),         # 25E15114 (I → 1)
+)
+_TEST_NUM_I_FIX_RE = re.compile(r'([A-Z])(\d{2})1(\d{2})')  # 1 → I 보정
+# 시험번호 (전체 행 스캔)
+_TEST_NUM_PREFIX_RE = re.compile(r'\d{2}[A-L]')                               # 아래 모든 형태의 공통 부분 (사전 필터)
+# 정상 형태 / I를 1로 인식 / I 누락 - 한 번의 스캔, 단어 단위로 위 순서대로 먼저 일치한 형태로 분류
+_TEST_NUM_FORMS_RE = re.compile(
+    r'\b(?:(?P<correct>\d{2}[A-L]\d{2}I\d{2,3})'
+    r'|(?P<ocr_error>\d{2}[A-L]\d{2}1\d{2,3})'
+    r'|(?P<missing_i>\d{2}[A-L]\d{5,6}))\b'
+)
+_TEST_NUM_SPACED_RE = re.compile(r'(\d{2})([A-L])(\d)\s+(\d)(\d{2,3})')       # 공백 포함
+_TEST_NUM_TRUNCATED_RE = re.compile(r'(\d{2}[A-L]\d{2}[A-Z1I|]?\d{0,3})\s*$')  # 줄 끝 잘림
+# 처방번호 (우선순위 순, 그룹 1 = 전체 일치)
+_PRESCRIPTION_RES = tuple(re.compile(pattern) for pattern in (
+    # 기본 패턴
+    r'\b([A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d?)\b',
+    r'\b([A-Z]{3}\d{5}-[A-Z]{2,4})\b',
+    r'\b(M-[A-Z]{2,4}\d{4,5}-[A-Z]{1,4}\d?)\b',
+    
+    # 확장 패턴
+    r'\b([A-Z]{2,4}\d{3,6}-[A-Z]{1,5})\b',
+    r'\b([A-Z]{2,5}\d{4}-[A-Z]{1,3}\d{0,2})\b',
+    r'\b([A-Z]{1,3}\d{4,5}-[A-Z]{2,4}[A-Z]?)\b',
+    r'\b([A-Z]{2,4}\d{4}-[A-Z]\d[A-Z]{1,3})\b',
+    r'\b([A-Z]{2,4}\d{3,4}[A-Z]?-[A-Z]{1,4}\d*)\b',
+    
+    # 숫자+문자 조합 (11F, 01GC 등)
+    r'\b([A-Z]{2,4}\d{4}-\d{1,2}[A-Z]{1,2})\b',  # WC1820-11F
+    
+    # 공백 허용
+    r'\b([A-Z]{2,4}\d{4,5}[A-Z]?-\s*[A-Z]{1,5}\d?)\b',
+    
+    # 복잡한 접미사 (RZ9A, OZ2A 등 - 중간 숫자)
+    r'\b([A-Z]{2,4}\d{4,5}[A-Z]?-\s*[A-Z]+\d+[A-Z]+)\b',  # RZ9A
+    r'\b([A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d[A-Z]+)\b',  # OZ2A
+    
+    # AZLY1 타입
+    r'\b([A-Z]{2,4}\d{3,5}-[A-Z]{1,4}\d{1,2})\b',
+    
+    # 포괄적 패턴
+    r'\b([A-Z]{2,5}\d{3,5}-[A-Z]{2,5}[A-Z\d]*)\b',
+))
+_CFU_SCI_RE = re.compile(r'\d+\.?\d*\s*[×xX]\s*10[\^]?\d+')
+_MERGED_SCI_RE = re.compile(r'(\d+\.?\d*[×xX]10[\^]?\d+)')          # 합쳐진 셀: 과학적 표기법
+_MERGED_LT_RE = re.compile(r'<\s*\d+')                               # 합쳐진 셀: < 값
+_CFU_NOISE_TRANSLATE = str.maketrans({'"': None, "'": None, '°': None, '€': None, '\n': ' '})
+_CFU_TIMES_TRANSLATE = str.maketrans({'X': '×', 'x': '×'})           # X/x → × (한 번의 문자 치환)
+_CFU_SCI_SPACED_RE = re.compile(r'(\d+\.?\d*)\s*[×]\s*10\s*(\d*)')     # 6.0 × 10 5, 6.8×105
+_LOG_LT_EXP_RE = re.compile(r'<10\^(\d+)')                        # <10^2 → <2.0
+_LOG_EXP_RE = re.compile(r'([0-9.]+)×10\^(\d+)')                   # 1.2×10^5 → 5.1
+_LOG_NUMBER_PREFIX_RE = re.compile(r'\s*[+-]?(?:\d|\.\d|inf|nan)', re.IGNORECASE)  # float()로 읽힐 수 있는 시작
+_LONG_NUM_RE = re.compile(r'^\d{4,}$')
+_SPEC_VALUE_RE = re.compile(r'^(≤[0-9]+[°cC]?|[0-9]{1,2}[°cC]?|SI)$')  # ≤3, ≤0°, 53, 50c 등
+
+# 🆕 CFU <10 / <10^2 보정 (_fix_less_than_10, _fix_7day_ambiguous)
+# 명확한 <10 오인식 패턴 (숫자가 틀린 경우) - 기존 + 추가
+_LT10_PATTERNS = frozenset({
+    '40', '40°', '40€',  # 기존
+    'CIO', 'CIÒ', 'C10', '410', '90',  # 기존
+    # 🆕 추가 패턴
+    'Lio', 'LIO', 'Clo', 'CLO',  # <10 → Lio/Clo
+    'CO', 'cio', 'clo',  # 소문자 버전
+    'L10', 'L 10', 'L10"', 'L 10"',  # < → L
+    '€10', '€ 10',  # < → €
+    '010', '(10)', '(10', '10)',  # < → 0/(
+    '(1)', '(1', '1)',  # <10 → (1)
+    '2 <10',  # 노이즈 + <10
+    # 🆕 2차 추가 (LION, zion 계열)
+    'LION', 'LION,', 'Lion', 'lion',  # < → L, 0 → O
+    'zion', 'Zion', 'ZION',  # < → z, 0 → o
+    # 🆕 숫자 뒤에 L
+    '40L', '10L',
+    # 🆕 뒤에 0 추가
+    '400', '4100',
+    # 🆕 6 → <
+    '610',
+    # 🆕 3차 추가 (새로 발견)
+    'Cle', 'CLE', 'Cia', 'CIA',  # <10 → Cle/Cia
+    'CCO', 'cco',  # <10 → CCO
+    '00',  # <10 → 00
+    'COL', 'Col',  # <10 → COL
+    'clo"', 'clo\'',  # 따옴표 포함
+})
+# 단순 치환 (값 전체 일치 → 보정 값), 정규식보다 먼저 한 번의 딕셔너리 조회로 처리
+_LT10_LITERAL_FIXES = {
+    value: fixed
+    for values, fixed in (
+        (('...', '....', '…'), ''),                            # 0. 의미 없는 값 → 빈 문자열
+        (_LT10_PATTERNS, '<10'),                               # 1. 명확한 <10 오인식
+        (('4102', '5102', '6102', '512'), '<10^2'),            # 2-3. < → 4/5 오인식 (7일차에서 빈번)
+        (('<12', '<62', '<1.2'), '<10^2'),                     # 2-4. 0 누락
+        (('GIO2', 'GI02', 'CIS2', 'C12', 'C102'), '<10^2'),    # 2-5. < → G/C 오인식
+        (('CIO2', 'Clo2', 'CI02', 'ClO2'), '<10^2'),           # 2-6. < → C, 1 → I/l 오인식
+        (('110', '210', '2103', '510'), '<10'),                # 3-1. < 누락 (14일차에서 빈번)
+        (('<1>', 'LU', '/10'), '<10'),                         # 3-2. 심각한 오인식
+        (('103',), '<10^3'),                                   # 4. <10^3
+        (('<10', '< 10'), '<10'),                              # 6. 이미 올바른 형태
+    )
+    for value in values
+}
+# 보정이 필요 없는 값 (정규식 검사 생략): 지수 형태 / 과학적 표기법
+_LT10_ALREADY_CLEAN = frozenset({'<10^2', '<10^3', '<10^4', '<10^5'})
+_CFU_SCI_VALUE_RE = re.compile(r'^\d+(?:\.\d+)?\s*[×xX]\s*10\^?\d+$')
+# 정규식 보정 (위에서부터 순서대로 검사, 처음 일치한 결과 사용)
+_LT10_REGEX_FIXES = (
+    (re.compile(r'^<\s*10[\?\-\)]+$'), '<10'),                 # 1-1. <10?, <10-, <10)
+    (re.compile(r'^<\s*[czsCZS]ion', re.IGNORECASE), '<10'),   # 1-2. < cion
+    (re.compile(r'^\d$'), '<10'),                              # 1-3. 단일 숫자 (손글씨에서 < 누락)
+    (re.compile(r'^<\s*10[\^]?2,?$'), '<10^2'),                # 2-1. <102, < 102, <10^2, <102,
+    (re.compile(r'^<\s*10\s+2$'), '<10^2'),                    # 2-2. < 10 2 (공백 분리)
+    (re.compile(r'^[SC]I0?2,?$', re.IGNORECASE), '<10^2'),     # 2-6-1. SI02,
+    (re.compile(r'^[5C6]/0?2$'), '<10^2'),                     # 2-7. 5/02, 5/2, C/02
+    (re.compile(r'^\(\s*10?2,?$'), '<10^2'),                   # 2-8. ( 102, (102, (12
+    (re.compile(r'^[SC]I0?2\s+2$', re.IGNORECASE), '<10^2'),   # 2-9. SI02 2 (뒤에 노이즈)
+    (re.compile(r'^\d+[45]102$'), '<10^2'),                    # 2-10. 45102, 34102 (앞에 노이즈)
+    (re.compile(r'^\d+\s*<\s*10'), '<10'),                     # 3-3. 2 <10 (앞에 노이즈)
+    (re.compile(r'^<\s*10\s*["\'\s\?\-\)]*$'), '<10'),         # 5. <10 + 따옴표/특수문자만
+)
+# 7일차: 명확한 <10 원본 (공백 제거 형태 포함) / 애매한 오인식 원본 (부분 문자열)
+_LT10_CLEAR = frozenset(
+    form
+    for pattern in ('< 10', '<10', '< 10"', '<10"', '< 10\'')
+    for form in (pattern, pattern.replace(' ', ''))
+)
+_LT10_AMBIGUOUS = ('40', '40°', '40€', 'CIO', 'CIÒ', 'C10', '410', '90')
+
+# 🆕 헤더 행 판별 키워드 (대문자 행 텍스트에서 부분 문자열 검색)
+_HEADER_KEYWORDS = ('CHALLENGED ORGANISM', 'BULK NAME', 'SPECIFICATION')
+_STRAIN_KEYWORDS = ('E.COLI', 'ESCHERICHIA', 'P.AERUGINOSA', 'PSEUDOMONAS',
+                    'S.AUREUS', 'STAPHYLOCOCCUS', 'C.ALBICANS', 'CANDIDA',
+                    'A.BRASILIENSIS', 'ASPERGILLUS', '균주', 'STRAIN')
+
+# 🆕 컬럼 매핑용 헤더 키워드 (대문자 셀 텍스트 기준) / 0일 외 CFU 컬럼 (검사 순서 유지)
+_STRAIN_HEADER_KEYWORDS = ('균주', 'STRAIN', 'E.COLI', 'ORGANISM')
+_CFU_DAY_HEADER_KEYS = (('7', 'cfu_7_col'), ('14', 'cfu_14_col'), ('28', 'cfu_28_col'))
+
+
+# 🆕 균주명 정규화 매핑 (별칭 → 표준 균주명, 위에서부터 우선 적용)
+_STRAIN_ALIASES = {
+    'E.coli': 'E.coli',
+    'Escherichia coli': 'E.coli',
+    'E. coli': 'E.coli',
+    'Escherichia': 'E.coli',
+    
+    'P.aeruginosa': 'P.aeruginosa',
+    'Pseudomonas aeruginosa': 'P.aeruginosa',
+    'P. aeruginosa': 'P.aeruginosa',
+    'Pseudomonas': 'P.aeruginosa',
+    
+    'S.aureus': 'S.aureus',
+    'Staphylococcus aureus': 'S.aureus',
+    'S. aureus': 'S.aureus',
+    'Staphylococcus': 'S.aureus',
+    
+    'C.albicans': 'C.albicans',
+    'Candida albicans': 'C.albicans',
+    'C. albicans': 'C.albicans',
+    'Candida': 'C.albicans',
+    
+    'A.brasiliensis': 'A.brasiliensis',
+    'Aspergillus brasiliensis': 'A.brasiliensis',
+    'A. brasiliensis': 'A.brasiliensis',
+    'Aspergillus': 'A.brasiliensis'
+}
+# 소문자 별칭 (행마다 .lower() 반복 방지)
+_STRAIN_ALIASES_LOWER = tuple((alias.lower(), short_name) for alias, short_name in _STRAIN_ALIASES.items())
+
+
+@lru_cache(maxsize=256)
+def _lookup_strain_name(strain: str) -> str:
+    """🆕 별칭 우선순위대로 표준 균주명 조회 (표마다 같은 균주명이 반복되므로 결과 캐시)"""
+    strain_lower = strain.lower()
+    for alias_lower, short_name in _STRAIN_ALIASES_LOWER:
+        if alias_lower in strain_lower:
+            return short_name
+    
+    return ''
+
+
+def _cell(row: List[Optional[str]], col_idx: int) -> str:
+    """🆕 테이블 행의 셀 값 (셀 없음/범위 밖/음수 인덱스는 빈 문자열)"""
+    return (row[col_idx] or '') if 0 <= col_idx < len(row) else ''
+
+
+def _row_text(row: List[Optional[str]]) -> str:
+    """🆕 테이블 행의 셀 값을 공백으로 연결 (셀이 없는 위치는 제외)"""
+    return ' '.join(value for value in row if value is not None)
+
+
+def _filled_row_count(table_matrix: List[List[Optional[str]]]) -> int:
+    """
+    🆕 셀이 하나라도 있는 행 수 (행 번호 스캔 상한)
+    
+    기존 dict 매트릭스는 셀이 없는 행을 키로 갖지 않아 len()이 row_count보다 작았고,
+    range(len(table_matrix)) 스캔은 그만큼 일찍 끝났음 → 같은 상한을 유지해 추출 결과 동일
+    """
+    return sum(1 for row in table_matrix if any(value is not None for value in row))
+
+
+def _normalize_code_text(text: str) -> str:
+    """🆕 시험번호/처방번호 검색용 전처리 (대문자 + OCR 오류 보정 + 대시/공백 정리)"""
+    text = text.upper().translate(_CODE_OCR_TRANSLATE)  # OCR 오류 보정 (!, | → I)
+    if '-' in text:
+        text = _DASH_RUN_RE.sub('-', text)  # 대시 주변 공백 + 연속 대시 정리 (한 번에)
+    return _MULTI_SPACE_RE.sub(' ', text)   # 연속 공백 → 단일
+
+
+@lru_cache(maxsize=4096)
+def _convert_str_to_log(cfu_value: str):
+    """🆕 CFU 문자열 → Log 변환 (입력 문자열에만 의존하므로 결과 캐시)"""
+    if '<' in cfu_value:
+        if '10^' in cfu_value:
+            exp_match = _LOG_LT_EXP_RE.search(cfu_value)
+            if exp_match:
+                return f"<{exp_match.group(1)}.0"
+        return "<1.0"
+    
+    exp_match = _LOG_EXP_RE.match(cfu_value)
+    if exp_match:
+        try:
+            base = float(exp_match.group(1))
+            exp = int(exp_match.group(2))
+            log_value = exp + math.log10(base)
+            return round(log_value, 1)
+        except ValueError as e:  # '1.2.3' 같은 밑, 밑이 0인 경우
+            logger.warning(f"Log 변환 실패: {cfu_value}, 오류: {e}")
+            return cfu_value
+    
+    # 🆕 숫자로 시작하지 않는 값은 float 변환(예외) 시도 생략
+    if _LOG_NUMBER_PREFIX_RE.match(cfu_value):
+        try:
+            num = float(cfu_value)
+            return round(math.log10(num), 1)
+        except ValueError:
+            pass
+    
+    return cfu_value
 
 
 class PreservationTestOCR:
     """보존력 시험 OCR 전용 클래스"""
     
+    # 🆕 컬럼 매핑 캐시 (헤더 행 내용 → column_map, 최근 32개): 같은 양식의 페이지는 매핑 재계산 생략
+    _COLUMN_MAP_CACHE_SIZE = 32
+    _column_map_cache = OrderedDict()
+    _column_map_lock = threading.Lock()
+    
+    # 🆕 CFU 보정 결과 캐시 ((원본 값, 날짜 컬럼) → 보정 값, 최근 2048개): <10 등 반복 값은 파이프라인 재실행 생략
+    _CFU_CACHE_SIZE = 2048
+    _cfu_cache = OrderedDict()
+    _cfu_cache_lock = threading.Lock()
+    
     def __init__(self, debug_mode=False):
         """
         Azure Document Intelligence 클라이언트 초기화
@@ -252,33 +620,65 @@ class PreservationTestOCR:
         """
         logger.info(f"\n🔍 이미지 분석 시작: {os.path.basename(image_path)}")
         
+        logger.info("📊 테이블 구조 분석 중...")
+        # 🆕 파일 핸들을 그대로 전달 (bytes 사본 없이 업로드), 업로드가 끝나도록 with 안에서 결과 대기
         with open(image_path, 'rb') as f:
-            image_data = f.read()
+            poller = self.client.begin_analyze_document("prebuilt-layout", document=f)
+            result = poller.result()
         
-        logger.info("📊 테이블 구조 분석 중...")
-        poller = self.client.begin_analyze_document("prebuilt-layout", document=image_data)
+        return self._extract_from_tables(result.tables)
+    
+    def extract_preservation_test_tables_batch(self, document_data: bytes, page_count: int) -> List[Dict]:
+        """
+        여러 페이지를 한 번의 Azure 분석 요청으로 처리
+        
+        Args:
+            document_data: 다중 페이지 문서 (TIFF/PDF) 바이트
+            page_count: 문서 페이지 수
+            
+        Returns:
+            페이지 순서대로 extract_preservation_test_table과 같은 형식의 리스트
+        """
+        logger.info(f"\n🔍 일괄 분석 시작: {page_count}페이지")
+        
+        poller = self.client.begin_analyze_document("prebuilt-layout", document=document_data)
         result = poller.result()
         
-        logger.info(f"📋 감지된 테이블 수: {len(result.tables)}")
-        for idx, tbl in enumerate(result.tables):
-            logger.info(f"  테이블 {idx}: {tbl.row_count}행 x {tbl.column_count}열")
+        # 테이블을 페이지 번호(1부터)별로 분류
+        tables_by_page = {page_number: [] for page_number in range(1, page_count + 1)}
+        for tbl in result.tables:
+            page_number = tbl.bounding_regions[0].page_number if tbl.bounding_regions else 1
+            tables_by_page.setdefault(page_number, []).append(tbl)
         
-        if not result.tables:
+        return [
+            self._extract_from_tables(tables_by_page[page_number])
+            for page_number in range(1, page_count + 1)
+        ]
+    
+    def _extract_from_tables(self, tables) -> Dict:
+        """한 페이지의 Azure 테이블 목록에서 가장 큰 테이블을 골라 데이터 추출"""
+        logger.info(f"📋 감지된 테이블 수: {len(tables)}")
+        
+        # 🆕 가장 큰 테이블 선택 (로그 출력 루프에서 함께 계산, 동일 크기면 앞쪽 테이블)
+        table = None
+        best_area = -1
+        for idx, tbl in enumerate(tables):
+            logger.info("  테이블 %d: %d행 x %d열", idx, tbl.row_count, tbl.column_count)
+            area = tbl.row_count * tbl.column_count
+            if area > best_area:
+                best_area = area
+                table = tbl
+        
+        if table is None:
             logger.error("❌ 테이블을 찾을 수 없습니다.")
             return {'data': [], 'date_info': {}}
         
-        # 가장 큰 테이블 선택
-        table = max(result.tables, key=lambda t: t.row_count * t.column_count)
         logger.info(f"✅ 선택된 테이블: {table.row_count}행 x {table.column_count}열")
         
-        # 테이블 매트릭스 생성
-        table_matrix = {}
+        # 테이블 매트릭스 생성 (🆕 행 x 열 2차원 리스트, 셀이 없는 위치(병합 영역)는 None)
+        table_matrix = [[None] * table.column_count for _ in range(table.row_count)]
         for cell in table.cells:
-            row_idx = cell.row_index
-            col_idx = cell.column_index
-            if row_idx not in table_matrix:
-                table_matrix[row_idx] = {}
-            table_matrix[row_idx][col_idx] = cell.content.strip()
+            table_matrix[cell.row_index][cell.column_index] = cell.content.strip()
         
         # 날짜 정보 추출
         date_info = self._extract_date_info(table_matrix)
@@ -291,7 +691,7 @@ class PreservationTestOCR:
             'date_info': date_info
         }
     
-    def _extract_date_info(self, table_matrix: Dict) -> Dict:
+    def _extract_date_info(self, table_matrix: List[List[Optional[str]]]) -> Dict:
         """
         날짜 정보 추출
         
@@ -308,41 +708,49 @@ class PreservationTestOCR:
         
         date_info = {}
         
+        # 🆕 단일 날짜 기반 계산용 후보 (첫 번째 유효 날짜) - 같은 루프에서 함께 기록
+        fallback = None  # (시작 날짜, 원본 값, 공백 분리 여부)
+        
         # 처음 5행 확인
-        for row_idx in range(min(5, len(table_matrix))):
-            if row_idx not in table_matrix:
-                continue
-            
-            row_data = table_matrix[row_idx]
-            
+        for row_idx, row_data in enumerate(table_matrix[:min(5, _filled_row_count(table_matrix))]):
             # 🔧 각 셀을 개별적으로 확인 (공백 분리된 날짜 처리)
             dates = []
-            for col_idx in sorted(row_data.keys()):
-                value = str(row_data[col_idx]).strip()
+            for col_idx, value in enumerate(row_data):
+                if value is None:
+                    continue
+                value = value.strip()
                 
                 # 🔧 OCR 오인식 보정: '0.5 15' → '05 15'
                 # 패턴: 숫자.숫자 공백 숫자 → 숫자숫자 공백 숫자
-                value_corrected = re.sub(r'^(\d)\.(\d)\s+(\d{1,2})$', r'\1\2 \3', value)
+                value_corrected = _DATE_DOT_FIX_RE.sub(r'\1\2 \3', value)
                 if value_corrected != value:
-                    logger.info(f"  🔧 날짜 보정 (Col_{col_idx}): '{value}' → '{value_corrected}'")
+                    logger.debug("  🔧 날짜 보정 (Col_%d): '%s' → '%s'", col_idx, value, value_corrected)
                     value = value_corrected
                 
                 # 패턴 1: MM/DD 또는 MM-DD
-                match1 = re.match(r'^(\d{1,2})[/\-.](\d{1,2})$', value)
-                if match1:
-                    dates.append((match1.group(1), match1.group(2)))
+                match = _DATE_SEP_RE.match(value)
+                is_space_separated = False
+                if not match:
+                    # 패턴 2: MM DD (공백으로 분리) - OCR이 자주 이렇게 인식
+                    match = _DATE_SPACE_RE.match(value)
+                    is_space_separated = match is not None
+                if not match:
                     continue
                 
-                # 패턴 2: MM DD (공백으로 분리) - OCR이 자주 이렇게 인식
-                match2 = re.match(r'^(\d{1,2})\s+(\d{1,2})$', value)
-                if match2:
-                    dates.append((match2.group(1), match2.group(2)))
-                    logger.info(f"  📍 공백 분리 날짜 발견 (Col_{col_idx}): '{value}' → {match2.group(1)}/{match2.group(2)}")
-                    continue
+                dates.append((match.group(1), match.group(2)))
+                if is_space_separated:
+                    logger.debug("  📍 공백 분리 날짜 발견 (Col_%d): '%s' → %s/%s", col_idx, value, match.group(1), match.group(2))
+                
+                if fallback is None:
+                    try:
+                        fallback = (datetime(2024, int(match.group(1)), int(match.group(2))), value, is_space_separated)
+                    except ValueError:
+                        pass
             
-            logger.info(f"  행 {row_idx}: 발견된 날짜 {len(dates)}개")
-            for i, (m, d) in enumerate(dates[:4]):
-                logger.info(f"    날짜 {i}: {m}/{d}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("  행 %d: 발견된 날짜 %d개", row_idx, len(dates))
+                for i, (m, d) in enumerate(dates[:4]):
+                    logger.debug("    날짜 %d: %s/%s", i, m, d)
             
             if len(dates) >= 4:
                 # 4개 이상 날짜가 있으면 처음 4개 사용
@@ -357,63 +765,24 @@ class PreservationTestOCR:
         
         # 날짜를 찾지 못한 경우 단일 날짜 기반 계산
         logger.info("  ⚠️ 4개 날짜를 찾지 못함. 단일 날짜 기반 계산 시도")
-        for row_idx in range(min(5, len(table_matrix))):
-            if row_idx not in table_matrix:
-                continue
-            
-            row_data = table_matrix[row_idx]
-            
-            for col_idx, value in row_data.items():
-                value_str = str(value).strip()
-                
-                # 🔧 OCR 오인식 보정: '0.5 15' → '05 15'
-                value_corrected = re.sub(r'^(\d)\.(\d)\s+(\d{1,2})$', r'\1\2 \3', value_str)
-                if value_corrected != value_str:
-                    logger.info(f"  🔧 날짜 보정: '{value_str}' → '{value_corrected}'")
-                    value_str = value_corrected
-                
-                # 패턴 1: MM/DD 또는 MM-DD
-                match1 = re.match(r'^(\d{1,2})[/\-.](\d{1,2})$', value_str)
-                if match1:
-                    try:
-                        month = int(match1.group(1))
-                        day = int(match1.group(2))
-                        start_date = datetime(2024, month, day)
-                        
-                        date_info = {
-                            'date_0': start_date.strftime("%m/%d"),
-                            'date_7': (start_date + timedelta(days=7)).strftime("%m/%d"),
-                            'date_14': (start_date + timedelta(days=14)).strftime("%m/%d"),
-                            'date_28': (start_date + timedelta(days=28)).strftime("%m/%d")
-                        }
-                        logger.info(f"✅ 시작 날짜 기반 계산: {date_info}")
-                        return date_info
-                    except:
-                        continue
-                
-                # 패턴 2: MM DD (공백 분리)
-                match2 = re.match(r'^(\d{1,2})\s+(\d{1,2})$', value_str)
-                if match2:
-                    try:
-                        month = int(match2.group(1))
-                        day = int(match2.group(2))
-                        start_date = datetime(2024, month, day)
-                        
-                        date_info = {
-                            'date_0': start_date.strftime("%m/%d"),
-                            'date_7': (start_date + timedelta(days=7)).strftime("%m/%d"),
-                            'date_14': (start_date + timedelta(days=14)).strftime("%m/%d"),
-                            'date_28': (start_date + timedelta(days=28)).strftime("%m/%d")
-                        }
-                        logger.info(f"✅ 공백 분리 날짜 기반 계산: {value_str} → {date_info}")
-                        return date_info
-                    except:
-                        continue
+        if fallback is not None:
+            start_date, value_str, is_space_separated = fallback
+            date_info = {
+                'date_0': start_date.strftime("%m/%d"),
+                'date_7': (start_date + timedelta(days=7)).strftime("%m/%d"),
+                'date_14': (start_date + timedelta(days=14)).strftime("%m/%d"),
+                'date_28': (start_date + timedelta(days=28)).strftime("%m/%d")
+            }
+            if is_space_separated:
+                logger.info(f"✅ 공백 분리 날짜 기반 계산: {value_str} → {date_info}")
+            else:
+                logger.info(f"✅ 시작 날짜 기반 계산: {date_info}")
+            return date_info
         
         logger.warning("⚠️ 날짜 정보 없음")
         return {}
     
-    def _extract_strain_data(self, table_matrix: Dict, date_info: Dict) -> List[Dict]:
+    def _extract_strain_data(self, table_matrix: List[List[Optional[str]]], date_info: Dict) -> List[Dict]:
         """
         균주 데이터 추출
         
@@ -471,14 +840,20 @@ class PreservationTestOCR:
         # 🆕 Bulk Name 컬럼 찾기 (Col_0)
         bulk_name_col = 0  # 일반적으로 첫 번째 컬럼
         
-        for row_idx in range(data_start_row, len(table_matrix)):
-            if row_idx not in table_matrix:
-                continue
-            
+        # 🆕 컬럼 인덱스는 행마다 조회하지 않고 루프 전에 한 번만 꺼내둠
+        strain_col = column_map.get('strain_col')
+        cfu_0_col = column_map.get('cfu_0_col', -1)
+        cfu_7_col = column_map.get('cfu_7_col', -1)
+        cfu_14_col = column_map.get('cfu_14_col', -1)
+        cfu_28_col = column_map.get('cfu_28_col', -1)
+        judgment_col = column_map.get('judgment_col', -1)
+        final_judgment_col = column_map.get('final_judgment_col', -1)
+        
+        for row_idx in range(data_start_row, _filled_row_count(table_matrix)):
             row_data = table_matrix[row_idx]
             
             # 🆕 1. Bulk Name 확인 (새 제품인지?)
-            bulk_name = row_data.get(bulk_name_col, '').strip()
+            bulk_name = _cell(row_data, bulk_name_col).strip()
             if bulk_name:
                 # Bulk Name이 있으면 → 새 제품 시작!
                 # 이 행에서 직접 시험번호/처방번호 추출
@@ -491,33 +866,31 @@ class PreservationTestOCR:
                     logger.info(f"  📦 새 제품 시작 (행{row_idx}): 처방번호={presc_num}")
             
             # 2. 균주명 추출
-            strain_col = column_map.get('strain_col')
-            if strain_col is None or strain_col not in row_data:
+            if strain_col is None:
                 continue
             
-            strain = row_data[strain_col].strip()
+            strain = _cell(row_data, strain_col).strip()
             
             # 균주 정규화
             strain_normalized = self._normalize_strain_name(strain)
             if not strain_normalized:
                 continue
             
-            # 3. CFU 값 추출
-            cfu_0 = self._clean_cfu_value(row_data.get(column_map.get('cfu_0_col', -1), ''), strain_normalized, '0일')
-            cfu_7 = self._clean_cfu_value(row_data.get(column_map.get('cfu_7_col', -1), ''), strain_normalized, '7일')
-            cfu_14 = self._clean_cfu_value(row_data.get(column_map.get('cfu_14_col', -1), ''), strain_normalized, '14일')
-            cfu_28 = self._clean_cfu_value(row_data.get(column_map.get('cfu_28_col', -1), ''), strain_normalized, '28일')
+            # 3. CFU 값 추출 (🆕 원본 값만 모아두고 보정은 루프 후 컬럼 단위로)
+            cfu_0 = _cell(row_data, cfu_0_col)
+            cfu_7 = _cell(row_data, cfu_7_col)
+            cfu_14 = _cell(row_data, cfu_14_col)
+            cfu_28 = _cell(row_data, cfu_28_col)
             
             # 4. 판정 추출
-            judgment = self._extract_judgment(row_data.get(column_map.get('judgment_col', -1), ''))
+            judgment = self._extract_judgment(_cell(row_data, judgment_col))
             
             # 🔧 최종판정: 컬럼이 없거나 값이 없으면 빈 문자열
-            final_judgment_col = column_map.get('final_judgment_col', -1)
             if final_judgment_col == -1:
                 # 최종판정 컬럼이 없으면 빈 문자열
                 final_judgment = ''
             else:
-                final_judgment_value = row_data.get(final_judgment_col, '')
+                final_judgment_value = _cell(row_data, final_judgment_col)
                 if final_judgment_value:
                     final_judgment = self._extract_judgment(final_judgment_value)
                 else:
@@ -536,6 +909,12 @@ class PreservationTestOCR:
                 'final_judgment': final_judgment
             })
         
+        # 🆕 CFU 값 보정 (컬럼 단위, 같은 값은 한 번만 보정)
+        for cfu_key, day_column in (('cfu_0day', '0일'), ('cfu_7day', '7일'), ('cfu_14day', '14일'), ('cfu_28day', '28일')):
+            cleaned_values = self._clean_cfu_column([item[cfu_key] for item in test_data], day_column)
+            for item, cleaned in zip(test_data, cleaned_values):
+                item[cfu_key] = cleaned
+        
         logger.info(f"✅ 추출된 균주 데이터: {len(test_data)}개")
         
         # 보정 요약 (간단히)
@@ -579,7 +958,7 @@ class PreservationTestOCR:
         
         return sorted_data
     
-    def _debug_table_structure(self, table_matrix: Dict, header_row: int, column_map: Dict):
+    def _debug_table_structure(self, table_matrix: List[List[Optional[str]]], header_row: int, column_map: Dict):
         """
         테이블 구조 상세 디버깅 정보 출력
         
@@ -588,6 +967,10 @@ class PreservationTestOCR:
             header_row: 헤더 행 인덱스
             column_map: 컬럼 매핑 정보
         """
+        # 🆕 호출 측 조건과 별개로 디버그 모드가 아니면 아무 작업도 하지 않음
+        if not self.debug_mode:
+            return
+        
         logger.info("\n" + "="*80)
         logger.info("🐛 디버그: 테이블 구조 상세 분석")
         logger.info("="*80)
@@ -596,15 +979,17 @@ class PreservationTestOCR:
         logger.info("\n📋 1. 테이블 매트릭스 (전체)")
         logger.info("-"*80)
         
-        for row_idx in range(len(table_matrix)):
-            if row_idx in table_matrix:
-                logger.info(f"\n행 {row_idx}:")
-                row_data = table_matrix[row_idx]
-                
-                for col_idx in sorted(row_data.keys()):
-                    value = row_data[col_idx]
-                    display_value = value[:40] if len(value) > 40 else value
-                    logger.info(f"  Col_{col_idx}: '{display_value}'")
+        for row_idx, row_data in enumerate(table_matrix[:_filled_row_count(table_matrix)]):
+            if all(value is None for value in row_data):
+                continue
+            
+            logger.info(f"\n행 {row_idx}:")
+            
+            for col_idx, value in enumerate(row_data):
+                if value is None:
+                    continue
+                display_value = value[:40] if len(value) > 40 else value
+                logger.info(f"  Col_{col_idx}: '{display_value}'")
         
         # 2. 컬럼 매핑 상세
         logger.info("\n" + "="*80)
@@ -622,9 +1007,12 @@ class PreservationTestOCR:
         bulk_name_col = None
         
         # 헤더에서 찾기
-        if header_row in table_matrix:
-            for col_idx, value in table_matrix[header_row].items():
-                if 'BULK' in value.upper() or 'NAME' in value.upper():
+        if 0 <= header_row < len(table_matrix):
+            for col_idx, value in enumerate(table_matrix[header_row]):
+                if value is None:
+                    continue
+                value_upper = value.upper()
+                if 'BULK' in value_upper or 'NAME' in value_upper:
                     bulk_name_col = col_idx
                     logger.info(f"✅ Bulk Name 컬럼 발견: Col_{col_idx}")
                     logger.info(f"   헤더 값: '{value}'")
@@ -639,71 +1027,61 @@ class PreservationTestOCR:
         logger.info(f"📝 4. Bulk Name 컬럼(Col_{bulk_name_col}) 전체 내용")
         logger.info("-"*80)
         
-        for row_idx in sorted(table_matrix.keys()):
-            if bulk_name_col in table_matrix[row_idx]:
-                value = table_matrix[row_idx][bulk_name_col]
-                if value:  # 빈 값 제외
-                    logger.info(f"행 {row_idx:2d}: '{value}'")
+        for row_idx, row_data in enumerate(table_matrix):
+            value = _cell(row_data, bulk_name_col)
+            if value:  # 빈 값 제외
+                logger.info(f"행 {row_idx:2d}: '{value}'")
         
         # 5. 시험번호/처방번호 패턴 찾기
         logger.info("\n" + "="*80)
         logger.info("🔬 5. 시험번호/처방번호 패턴 매칭")
         logger.info("-"*80)
         
-        # 시험번호 패턴
-        test_pattern = r'\b(\d{2}[A-Z]\d{2}[A-Z]\d{2,3})\b'
-        
-        # 처방번호 패턴
-        presc_patterns = [
-            r'\b([A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,4}\d?)\b',
-            r'\b([A-Z]{2,4}\d{4}-[A-Z]{1,5})\b'
-        ]
-        
         # Bulk Name 컬럼에서 패턴 찾기
         found_tests = []
         found_prescriptions = []
         
-        for row_idx in sorted(table_matrix.keys()):
-            if bulk_name_col in table_matrix[row_idx]:
-                value = table_matrix[row_idx][bulk_name_col]
-                
-                # 시험번호 찾기
-                test_match = re.search(test_pattern, value.upper())
-                if test_match:
-                    test_num = test_match.group(1)
-                    found_tests.append((row_idx, test_num))
-                    logger.info(f"✅ 행 {row_idx}: 시험번호 '{test_num}'")
-                
-                # 처방번호 찾기
-                for pattern in presc_patterns:
-                    presc_match = re.search(pattern, value.upper())
-                    if presc_match:
-                        presc_num = presc_match.group(1)
-                        found_prescriptions.append((row_idx, presc_num))
-                        logger.info(f"✅ 행 {row_idx}: 처방번호 '{presc_num}'")
-                        break
+        for row_idx, row_data in enumerate(table_matrix):
+            value = _cell(row_data, bulk_name_col)
+            if not value:
+                continue
+            
+            # 시험번호 찾기
+            value_upper = value.upper()
+            test_match = _TEST_NUM_RE.search(value_upper)
+            if test_match:
+                test_num = test_match.group(1)
+                found_tests.append((row_idx, test_num))
+                logger.info(f"✅ 행 {row_idx}: 시험번호 '{test_num}'")
+            
+            # 처방번호 찾기
+            presc_match = _PRESC_RE.search(value_upper)
+            if presc_match:
+                presc_num = presc_match.group('a') or presc_match.group('b')
+                found_prescriptions.append((row_idx, presc_num))
+                logger.info(f"✅ 행 {row_idx}: 처방번호 '{presc_num}'")
         
         # 6. 전체 테이블에서도 검색
         logger.info("\n" + "="*80)
         logger.info("🔍 6. 전체 테이블에서 패턴 검색")
         logger.info("-"*80)
         
-        all_text = ' '.join([
-            ' '.join(str(v) for v in row.values())
-            for row in table_matrix.values()
-        ])
+        # 🆕 전체 텍스트를 이어 붙이지 않고 셀 단위로 검색 (패턴에 공백이 없어 결과 동일)
+        test_matches = []
+        presc_matches = []
+        for row in table_matrix:
+            for value in row:
+                if not value:
+                    continue
+                value_upper = value.upper()
+                test_matches.extend(_TEST_NUM_RE.findall(value_upper))
+                presc_matches.extend(m.group('a') or m.group('b') for m in _PRESC_RE.finditer(value_upper))
         
-        test_matches = re.findall(test_pattern, all_text.upper())
         if test_matches:
             logger.info(f"✅ 전체 테이블에서 시험번호 발견: {test_matches}")
         else:
             logger.info("❌ 시험번호 패턴 매칭 실패")
         
-        presc_matches = []
-        for pattern in presc_patterns:
-            matches = re.findall(pattern, all_text.upper())
-            presc_matches.extend(matches)
-        
         if presc_matches:
             logger.info(f"✅ 전체 테이블에서 처방번호 발견: {presc_matches}")
         else:
@@ -734,7 +1112,7 @@ class PreservationTestOCR:
         
         logger.info("\n" + "="*80)
     
-    def _find_header_row(self, table_matrix: Dict) -> Optional[int]:
+    def _find_header_row(self, table_matrix: List[List[Optional[str]]]) -> Optional[int]:
         """
         헤더 행 찾기
         
@@ -742,53 +1120,45 @@ class PreservationTestOCR:
         1. 'Challenged Organism' 또는 'Bulk Name' 텍스트가 있는 행
         2. 균주명 키워드가 있는 행
         """
-        # 1순위: 명확한 헤더 키워드로 찾기
-        header_keywords = ['CHALLENGED ORGANISM', 'BULK NAME', 'SPECIFICATION']
+        # 🆕 한 번의 순회로 두 기준 확인 (행 텍스트는 행마다 1회만 생성)
+        # 1순위: 처음 5행 중 명확한 헤더 키워드가 있는 행
+        # 2순위: 처음 15행 중 균주명 키워드가 처음 나오는 행 (데이터 행과 구분 필요!)
+        candidate_row = None
         
-        for row_idx in range(min(5, len(table_matrix))):
-            if row_idx not in table_matrix:
-                continue
-            
-            row_text = ' '.join(str(v) for v in table_matrix[row_idx].values()).upper()
+        for row_idx, row_data in enumerate(table_matrix[:min(15, _filled_row_count(table_matrix))]):
+            row_text = _row_text(row_data).upper()
             
             # 헤더 키워드가 있으면 진짜 헤더
-            if any(keyword in row_text for keyword in header_keywords):
+            if row_idx < 5 and any(keyword in row_text for keyword in _HEADER_KEYWORDS):
                 logger.info(f"  ✅ 헤더 행 발견 (명확한 키워드): 행 {row_idx}")
                 return row_idx
-        
-        # 2순위: 균주명 키워드로 찾기 (데이터 행과 구분 필요!)
-        strain_keywords = ['E.COLI', 'ESCHERICHIA', 'P.AERUGINOSA', 'PSEUDOMONAS', 
-                          'S.AUREUS', 'STAPHYLOCOCCUS', 'C.ALBICANS', 'CANDIDA',
-                          'A.BRASILIENSIS', 'ASPERGILLUS', '균주', 'STRAIN']
-        
-        candidate_rows = []
-        
-        for row_idx in range(min(15, len(table_matrix))):
-            if row_idx not in table_matrix:
-                continue
             
-            row_text = ' '.join(str(v) for v in table_matrix[row_idx].values()).upper()
+            if candidate_row is None and any(keyword in row_text for keyword in _STRAIN_KEYWORDS):
+                candidate_row = row_idx
             
-            if any(keyword in row_text for keyword in strain_keywords):
-                candidate_rows.append(row_idx)
+            # 후보가 정해졌고 1순위를 더 볼 행이 없으면 종료
+            if candidate_row is not None and row_idx >= 4:
+                break
         
         # 후보 행이 있으면 진짜 헤더인지 데이터 행인지 판별
-        for row_idx in candidate_rows:
-            row_data = table_matrix[row_idx]
+        if candidate_row is not None:
+            row_idx = candidate_row
             
             # 🔍 헤더 행 판별: CFU 값 패턴이 없어야 함
             has_cfu_pattern = False
             
-            for col_idx, value in row_data.items():
-                value_str = str(value).strip()
+            for value in table_matrix[row_idx]:
+                if value is None:
+                    continue
+                value_str = value.strip()
                 
                 # CFU 값 패턴 (과학적 표기법)
-                if re.search(r'\d+\.?\d*\s*[×xX]\s*10[\^]?\d+', value_str):
+                if _CFU_SCI_RE.search(value_str):
                     has_cfu_pattern = True
                     break
                 
                 # 숫자 패턴 (≤3 같은 Specification 제외)
-                if re.match(r'^\d{4,}$', value_str):  # 4자리 이상 숫자
+                if _LONG_NUM_RE.match(value_str):  # 4자리 이상 숫자
                     has_cfu_pattern = True
                     break
             
@@ -805,7 +1175,7 @@ class PreservationTestOCR:
         logger.warning("  ❌ 헤더 행을 찾을 수 없습니다")
         return None
     
-    def _identify_columns(self, table_matrix: Dict, header_row: int) -> Dict:
+    def _identify_columns(self, table_matrix: List[List[Optional[str]]], header_row: int) -> Dict:
         """
         컬럼 매핑 생성
         
@@ -823,34 +1193,45 @@ class PreservationTestOCR:
         """
         column_map = {}
         
-        if header_row not in table_matrix:
+        if not 0 <= header_row < len(table_matrix):
             return column_map
         
         header_data = table_matrix[header_row]
         
+        # 🆕 같은 헤더(같은 양식)는 이전에 계산한 매핑 재사용
+        cache_key = tuple(header_data)
+        with PreservationTestOCR._column_map_lock:
+            cached = PreservationTestOCR._column_map_cache.get(cache_key)
+            if cached is not None:
+                PreservationTestOCR._column_map_cache.move_to_end(cache_key)
+                logger.info("  ♻️ 컬럼 매핑 캐시 사용")
+                return dict(cached)
+        
         # 균주명 컬럼 찾기
-        for col_idx, value in header_data.items():
+        for col_idx, value in enumerate(header_data):
+            if value is None:
+                continue
             value_upper = value.upper().strip()
             
             # 균주 컬럼
-            if '균주' in value or 'STRAIN' in value_upper or 'E.COLI' in value_upper or 'ORGANISM' in value_upper:
+            if any(keyword in value_upper for keyword in _STRAIN_HEADER_KEYWORDS):
                 column_map['strain_col'] = col_idx
                 logger.info(f"  ✅ 균주 컬럼 감지: Col_{col_idx}")
             
-            # ⭐ Specification 컬럼 (건너뛰어야 함) - 개선된 감지
-            if 'SPECIFICATION' in value_upper or 'SPEC' in value_upper:
+            # ⭐ Specification 컬럼 (건너뛰어야 함) - 개선된 감지 ('SPECIFICATION' 포함)
+            if 'SPEC' in value_upper:
                 column_map['specification_col'] = col_idx
                 logger.info(f"  ⚠️ Specification 컬럼 감지: Col_{col_idx} (건너뜀)")
             
-            # CFU 컬럼 (0, 7, 14, 28 숫자 찾기)
-            if '0' in value and ('일' in value or 'DAY' in value_upper or 'CFU' in value_upper or '접종' in value):
+            # CFU 컬럼 (0, 7, 14, 28 숫자 찾기) - 🆕 일/DAY/CFU 표기 여부는 셀당 1회만 확인
+            is_day_header = '일' in value or 'DAY' in value_upper or 'CFU' in value_upper
+            if '0' in value and (is_day_header or '접종' in value):
                 column_map['cfu_0_col'] = col_idx
-            elif '7' in value and ('일' in value or 'DAY' in value_upper or 'CFU' in value_upper):
-                column_map['cfu_7_col'] = col_idx
-            elif '14' in value and ('일' in value or 'DAY' in value_upper or 'CFU' in value_upper):
-                column_map['cfu_14_col'] = col_idx
-            elif '28' in value and ('일' in value or 'DAY' in value_upper or 'CFU' in value_upper):
-                column_map['cfu_28_col'] = col_idx
+            elif is_day_header:
+                for day, key in _CFU_DAY_HEADER_KEYS:
+                    if day in value:
+                        column_map[key] = col_idx
+                        break
             
             # 판정 컬럼
             if '판정' in value or 'JUDGMENT' in value_upper:
@@ -859,6 +1240,9 @@ class PreservationTestOCR:
                 elif 'judgment_col' not in column_map:
                     column_map['judgment_col'] = col_idx
         
+        # 🆕 Specification 컬럼을 데이터 행 값으로 추론해야 하는 경우는 헤더만으로 결정되지 않으므로 캐시하지 않음
+        header_determined = 'strain_col' not in column_map or 'specification_col' in column_map
+        
         # ⭐ 추론: CFU 컬럼이 없으면 균주 컬럼 다음부터 순서대로 할당
         # 단, Specification 컬럼은 건너뛰기!
         if 'strain_col' in column_map:
@@ -874,19 +1258,18 @@ class PreservationTestOCR:
                 spec_pattern_count = 0
                 checked_rows = 0
                 
-                for row_idx in sorted(table_matrix.keys()):
-                    if row_idx <= header_row:
-                        continue  # 헤더 행은 건너뛰기
-                    
+                # 🆕 슬라이스 복사 없이 헤더 다음 행부터 순회, 셀은 한 번만 인덱싱
+                for row_data in itertools.islice(table_matrix, header_row + 1, None):  # 헤더 행은 건너뛰기
                     if checked_rows >= 5:  # 5개 행만 확인
                         break
                     
-                    if next_col in table_matrix[row_idx]:
-                        value = str(table_matrix[row_idx][next_col]).strip()
+                    value = row_data[next_col] if next_col < len(row_data) else None
+                    if value is not None:
+                        value = value.strip()
                         
                         # Specification 값 패턴
                         # ≤3, ≤1, ≤0, ≤0°, 53, 51, 50, 50c 등
-                        if re.match(r'^(≤[0-9]+[°cC]?|[0-9]{1,2}[°cC]?|SI)$', value):
+                        if _SPEC_VALUE_RE.match(value):
                             spec_pattern_count += 1
                         
                         checked_rows += 1
@@ -920,6 +1303,12 @@ class PreservationTestOCR:
             if 'final_judgment_col' not in column_map:
                 column_map['final_judgment_col'] = cfu_start_col + 5
         
+        if header_determined:
+            with PreservationTestOCR._column_map_lock:
+                PreservationTestOCR._column_map_cache[cache_key] = dict(column_map)
+                while len(PreservationTestOCR._column_map_cache) > PreservationTestOCR._COLUMN_MAP_CACHE_SIZE:
+                    PreservationTestOCR._column_map_cache.popitem(last=False)
+        
         return column_map
     
     def _extract_test_info_from_row(self, row_text: str) -> Tuple[str, str]:
@@ -932,8 +1321,6 @@ class PreservationTestOCR:
         Returns:
             (시험번호, 처방번호) 튜플
         """
-        import re
-        
         test_number = ''
         prescription_number = ''
         
@@ -941,72 +1328,30 @@ class PreservationTestOCR:
             return '', ''
         
         # 전처리
-        row_text_upper = row_text.upper()
-        row_text_upper = row_text_upper.replace('!', 'I')  # OCR 오류 보정
-        row_text_upper = row_text_upper.replace('|', 'I')  # | → I 보정
-        row_text_upper = re.sub(r'-\s+', '-', row_text_upper)  # '- ' → '-'
-        row_text_upper = re.sub(r'\s+-', '-', row_text_upper)  # ' -' → '-'
-        row_text_upper = re.sub(r'-+', '-', row_text_upper)   # '--', '---' → '-'
-        row_text_upper = re.sub(r'\s+', ' ', row_text_upper)   # 연속 공백 → 단일
+        row_text_upper = _normalize_code_text(row_text)
         
         # 1. 시험번호 패턴 (25A15I14, 25E15114 등)
-        test_patterns = [
-            r'\b(2[0-9][A-Z]\d{2}[I!|1]\d{2})\b',  # 25A15I14, 25A15|14
-            r'\b(2[0-9][E]\d{2}1\d{2})\b',         # 25E15114 (I → 1)
-        ]
-        
-        for pattern in test_patterns:
-            match = re.search(pattern, row_text_upper)
+        for test_re in _ROW_TEST_NUM_RES:
+            match = test_re.search(row_text_upper)
             if match:
                 test_number = match.group(1)
                 # 보정: 1 → I
-                test_number = re.sub(r'([A-Z])(\d{2})1(\d{2})', r'\g<1>\g<2>I\g<3>', test_number)
-                # 보정: | → I
-                test_number = test_number.replace('|', 'I')
-                # 보정: ! → I
-                test_number = test_number.replace('!', 'I')
+                test_number = _TEST_NUM_I_FIX_RE.sub(r'\g<1>\g<2>I\g<3>', test_number)
+                # 보정: |, ! → I (🆕 replace 체인 대신 translate 한 번)
+                test_number = test_number.translate(_CODE_OCR_TRANSLATE)
                 break
         
-        # 2. 처방번호 패턴
-        prescription_patterns = [
-            # 기본 패턴
-            r'\b([A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d?)\b',
-            r'\b([A-Z]{3}\d{5}-[A-Z]{2,4})\b',
-            r'\b(M-[A-Z]{2,4}\d{4,5}-[A-Z]{1,4}\d?)\b',
-            
-            # 확장 패턴
-            r'\b([A-Z]{2,4}\d{3,6}-[A-Z]{1,5})\b',
-            r'\b([A-Z]{2,5}\d{4}-[A-Z]{1,3}\d{0,2})\b',
-            r'\b([A-Z]{1,3}\d{4,5}-[A-Z]{2,4}[A-Z]?)\b',
-            r'\b([A-Z]{2,4}\d{4}-[A-Z]\d[A-Z]{1,3})\b',
-            r'\b([A-Z]{2,4}\d{3,4}[A-Z]?-[A-Z]{1,4}\d*)\b',
-            
-            # 🆕 숫자+문자 조합 (11F, 01GC 등)
-            r'\b([A-Z]{2,4}\d{4}-\d{1,2}[A-Z]{1,2})\b',
-            
-            # 공백 허용
-            r'\b([A-Z]{2,4}\d{4,5}[A-Z]?-\s*[A-Z]{1,5}\d?)\b',
-            
-            # 복잡한 접미사
-            r'\b([A-Z]{2,4}\d{4,5}[A-Z]?-\s*[A-Z]+\d+[A-Z]+)\b',
-            r'\b([A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d[A-Z]+)\b',
-            
-            # AZLY1 타입
-            r'\b([A-Z]{2,4}\d{3,5}-[A-Z]{1,4}\d{1,2})\b',
-            
-            # 포괄적 패턴
-            r'\b([A-Z]{2,5}\d{3,5}-[A-Z]{2,5}[A-Z\d]*)\b',
-        ]
-        
-        for pattern in prescription_patterns:
-            match = re.search(pattern, row_text_upper)
-            if match:
-                prescription_number = match.group(1).strip()
-                break
+        # 2. 처방번호 패턴 (🆕 모든 패턴에 '-'가 있으므로 '-'가 없는 행은 정규식 검사 생략)
+        if '-' in row_text_upper:
+            for presc_re in _PRESCRIPTION_RES:
+                match = presc_re.search(row_text_upper)
+                if match:
+                    prescription_number = match.group(1).strip()
+                    break
         
         return test_number, prescription_number
     
-    def _extract_test_info(self, table_matrix: Dict, header_row: int) -> Tuple[List[str], List[str]]:
+    def _extract_test_info(self, table_matrix: List[List[Optional[str]]], header_row: int) -> Tuple[List[str], List[str]]:
         """
         시험번호와 처방번호 추출
         
@@ -1016,79 +1361,49 @@ class PreservationTestOCR:
         test_numbers = []
         prescription_numbers = []
         
+        # 🆕 행 텍스트 전처리는 스캔 전에 한 번에 (행 단위 추출과 같은 _normalize_code_text 사용)
+        row_texts_upper = [_normalize_code_text(_row_text(row_data)) for row_data in table_matrix[:_filled_row_count(table_matrix)]]
+        
         # 🔧 전체 행 스캔
-        for row_idx in range(len(table_matrix)):
-            if row_idx not in table_matrix:
-                continue
-            
-            row_data = table_matrix[row_idx]
-            row_text = ' '.join(str(v) for v in row_data.values())
-            
-            # 전처리
-            row_text_upper = row_text.upper()
-            row_text_upper = row_text_upper.replace('!', 'I')  # OCR 오류 보정
-            row_text_upper = row_text_upper.replace('|', 'I')  # | → I 보정
-            row_text_upper = re.sub(r'-\s+', '-', row_text_upper)  # '- ' → '-'
-            row_text_upper = re.sub(r'\s+-', '-', row_text_upper)  # ' -' → '-'
-            row_text_upper = re.sub(r'-+', '-', row_text_upper)   # '--', '---' → '-'
-            row_text_upper = re.sub(r'\s+', ' ', row_text_upper)   # 연속 공백 → 단일
-            
+        for row_idx, row_text_upper in enumerate(row_texts_upper):
             # ========================================
             # 1. 처방번호 추출 (고도화된 패턴)
             # ========================================
-            prescription_patterns = [
-                # 기본 패턴
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d?\b',
-                r'\b[A-Z]{3}\d{5}-[A-Z]{2,4}\b',
-                r'\bM-[A-Z]{2,4}\d{4,5}-[A-Z]{1,4}\d?\b',
-                
-                # 확장 패턴
-                r'\b[A-Z]{2,4}\d{3,6}-[A-Z]{1,5}\b',
-                r'\b[A-Z]{2,5}\d{4}-[A-Z]{1,3}\d{0,2}\b',
-                r'\b[A-Z]{1,3}\d{4,5}-[A-Z]{2,4}[A-Z]?\b',
-                r'\b[A-Z]{2,4}\d{4}-[A-Z]\d[A-Z]{1,3}\b',
-                r'\b[A-Z]{2,4}\d{3,4}[A-Z]?-[A-Z]{1,4}\d*\b',
-                
-                # 🆕 숫자+문자 조합 (11F, 01GC 등)
-                r'\b[A-Z]{2,4}\d{4}-\d{1,2}[A-Z]{1,2}\b',  # WC1820-11F
-                
-                # 공백 허용
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-\s*[A-Z]{1,5}\d?\b',
-                
-                # 🆕 복잡한 접미사 (RZ9A, OZ2A 등 - 중간 숫자)
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-\s*[A-Z]+\d+[A-Z]+\b',  # RZ9A
-                r'\b[A-Z]{2,4}\d{4,5}[A-Z]?-[A-Z]{1,5}\d[A-Z]+\b',  # OZ2A
-                
-                # AZLY1 타입
-                r'\b[A-Z]{2,4}\d{3,5}-[A-Z]{1,4}\d{1,2}\b',
-                
-                # 포괄적 패턴
-                r'\b[A-Z]{2,5}\d{3,5}-[A-Z]{2,5}[A-Z\d]*\b',
-            ]
-            
-            for pattern in prescription_patterns:
-                matches = re.findall(pattern, row_text_upper)
-                for match in matches:
-                    # 공백 제거 정규화
-                    normalized = match.replace(' ', '')
-                    normalized = re.sub(r'-+', '-', normalized)  # 여러 대시 → 1개
-                    
-                    if normalized not in prescription_numbers:
-                        prescription_numbers.append(normalized)
-                        if match != normalized:
-                            logger.info(f"  ✅ 처방번호 발견 (행{row_idx}): {match} → {normalized} (정규화)")
-                        else:
-                            logger.info(f"  ✅ 처방번호 발견 (행{row_idx}): {match}")
+            # 🆕 모든 패턴에 '-'가 있으므로 '-'가 없는 행은 정규식 검사 생략
+            if '-' in row_text_upper:
+                for presc_re in _PRESCRIPTION_RES:
+                    matches = presc_re.findall(row_text_upper)
+                    for match in matches:
+                        # 공백 제거 정규화
+                        normalized = match.replace(' ', '')
+                        normalized = _MULTI_DASH_RE.sub('-', normalized)  # 여러 대시 → 1개
+                        
+                        if normalized not in prescription_numbers:
+                            prescription_numbers.append(normalized)
+                            if match != normalized:
+                                logger.info(f"  ✅ 처방번호 발견 (행{row_idx}): {match} → {normalized} (정규화)")
+                            else:
+                                logger.info(f"  ✅ 처방번호 발견 (행{row_idx}): {match}")
             
             # ========================================
             # 2. 시험번호 추출 (고도화된 패턴)
             # ========================================
             
+            # 🆕 모든 시험번호 형태가 '숫자 2개 + A~L'을 포함 → 없으면 이 행의 시험번호 검사 생략
+            if not _TEST_NUM_PREFIX_RE.search(row_text_upper):
+                continue
+            
             # 🔧 중복 방지를 위한 임시 리스트
             found_in_this_row = []
             
+            # 🆕 정상/OCR 오류/I 누락 형태를 한 번에 스캔해서 형태별로 분류
+            #    (각 일치는 단어 전체이고, I 누락 형태는 I/1 오류 형태가 없는 행에서만 사용되므로 개별 스캔과 결과 동일)
+            form_matches = {'correct': [], 'ocr_error': [], 'missing_i': []}
+            for form_match in _TEST_NUM_FORMS_RE.finditer(row_text_upper):
+                form_matches[form_match.lastgroup].append(form_match.group(form_match.lastgroup))
+            
             # 2-1. 정상 형태 (I가 정확히 인식된 경우)
-            correct_matches = re.findall(r'\b(\d{2}[A-L]\d{2}I\d{2,3})\b', row_text_upper)
+            correct_matches = form_matches['correct']
             for match in correct_matches:
                 if match not in test_numbers and match not in found_in_this_row:
                     test_numbers.append(match)
@@ -1097,7 +1412,7 @@ class PreservationTestOCR:
             
             # 2-2. OCR 오류 형태 (I를 1로 잘못 인식) - 정상 형태가 없을 때만
             if not correct_matches:
-                ocr_error_matches = re.findall(r'\b(\d{2}[A-L]\d{2}1\d{2,3})\b', row_text_upper)
+                ocr_error_matches = form_matches['ocr_error']
                 for match in ocr_error_matches:
                     # I/1 보정: 25A15114 → 25A15I14
                     corrected = match[:5] + 'I' + match[6:]
@@ -1108,7 +1423,7 @@ class PreservationTestOCR:
             
             # 2-3. I가 누락된 형태 (숫자만 연속) - 정상 형태와 I/1 보정이 없을 때만
             if not correct_matches and not ocr_error_matches:
-                missing_i_matches = re.findall(r'\b(\d{2}[A-L]\d{5,6})\b', row_text_upper)
+                missing_i_matches = form_matches['missing_i']
                 for match in missing_i_matches:
                     # I 삽입: 25A15102 → 25A15I02
                     if len(match) == 7:  # 25A2012
@@ -1124,7 +1439,7 @@ class PreservationTestOCR:
                         logger.info(f"  ✅ 시험번호 발견 (행{row_idx}): {match} → {corrected} (I 삽입)")
             
             # 2-4. 공백이 있는 형태
-            space_matches = re.findall(r'(\d{2})([A-L])(\d)\s+(\d)(\d{2,3})', row_text_upper)
+            space_matches = _TEST_NUM_SPACED_RE.findall(row_text_upper)
             for year_prefix, letter, d1, d2, last_digits in space_matches:
                 converted = f"{year_prefix}{letter}{d1}{d2}I{last_digits[:2]}"
                 if converted not in test_numbers and converted not in found_in_this_row:
@@ -1134,7 +1449,7 @@ class PreservationTestOCR:
             
             # 2-5. 잘린 형태 (줄 끝) - 다른 형태가 없을 때만
             if not found_in_this_row:
-                truncated_matches = re.findall(r'(\d{2}[A-L]\d{2}[A-Z1I|]?\d{0,3})\s*$', row_text_upper)
+                truncated_matches = _TEST_NUM_TRUNCATED_RE.findall(row_text_upper)
                 for match in truncated_matches:
                     # 길이 체크
                     if len(match) < 6:
@@ -1169,38 +1484,7 @@ class PreservationTestOCR:
     
     def _normalize_strain_name(self, strain: str) -> str:
         """균주명 정규화"""
-        strain_mapping = {
-            'E.coli': 'E.coli',
-            'Escherichia coli': 'E.coli',
-            'E. coli': 'E.coli',
-            'Escherichia': 'E.coli',
-            
-            'P.aeruginosa': 'P.aeruginosa',
-            'Pseudomonas aeruginosa': 'P.aeruginosa',
-            'P. aeruginosa': 'P.aeruginosa',
-            'Pseudomonas': 'P.aeruginosa',
-            
-            'S.aureus': 'S.aureus',
-            'Staphylococcus aureus': 'S.aureus',
-            'S. aureus': 'S.aureus',
-            'Staphylococcus': 'S.aureus',
-            
-            'C.albicans': 'C.albicans',
-            'Candida albicans': 'C.albicans',
-            'C. albicans': 'C.albicans',
-            'Candida': 'C.albicans',
-            
-            'A.brasiliensis': 'A.brasiliensis',
-            'Aspergillus brasiliensis': 'A.brasiliensis',
-            'A. brasiliensis': 'A.brasiliensis',
-            'Aspergillus': 'A.brasiliensis'
-        }
-        
-        for full_name, short_name in strain_mapping.items():
-            if full_name.lower() in strain.lower():
-                return short_name
-        
-        return ''
+        return _lookup_strain_name(strain)
     
     def _split_merged_cells(self, value: str) -> str:
         """
@@ -1220,21 +1504,21 @@ class PreservationTestOCR:
         if not value:
             return value
         
-        import re
-        
         # 패턴 1: 과학적 표기법이 2개 이상 (공백으로 구분)
-        # '7.0X102 1.0 ×103' 같은 패턴
-        scientific_pattern = r'(\d+\.?\d*[×xX]10[\^]?\d+)'
-        matches = re.findall(scientific_pattern, value)
-        
-        if len(matches) >= 2:
-            logger.warning(f"  ⚠️ 합쳐진 셀 감지: '{value}' → 첫 번째 값만 사용: '{matches[0]}'")
-            return matches[0]
+        # '7.0X102 1.0 ×103' 같은 패턴 (🆕 ×/x/X가 없으면 검사 생략)
+        if '×' in value or 'x' in value or 'X' in value:
+            matches = _MERGED_SCI_RE.findall(value)
+            
+            if len(matches) >= 2:
+                logger.warning(f"  ⚠️ 합쳐진 셀 감지: '{value}' → 첫 번째 값만 사용: '{matches[0]}'")
+                return matches[0]
         
         # 패턴 2: < 기호가 2개 이상
-        # '<10 < 10"' 같은 패턴
-        less_than_pattern = r'<\s*\d+'
-        less_matches = re.findall(less_than_pattern, value)
+        # '<10 < 10"' 같은 패턴 (🆕 '<'가 2개 미만이면 검사 생략)
+        if value.count('<') < 2:
+            return value
+        
+        less_matches = _MERGED_LT_RE.findall(value)
         
         if len(less_matches) >= 2:
             logger.warning(f"  ⚠️ 합쳐진 셀 감지: '{value}' → 첫 번째 값만 사용: '{less_matches[0]}'")
@@ -1255,20 +1539,12 @@ class PreservationTestOCR:
         if not value:
             return value
         
-        # :selected:, :unselected: 제거
-        value = value.replace(':selected:', '').replace(':unselected:', '')
+        # :selected:, :unselected: 제거 (🆕 ':'가 없으면 생략)
+        if ':' in value:
+            value = value.replace(':selected:', '').replace(':unselected:', '')
         
-        # 따옴표 제거
-        value = value.replace('"', '').replace("'", '')
-        
-        # 도 기호 제거
-        value = value.replace('°', '')
-        
-        # 유로 기호 제거
-        value = value.replace('€', '')
-        
-        # 줄바꿈 제거
-        value = value.replace('\n', ' ')
+        # 🆕 따옴표/도 기호/유로 기호 제거 + 줄바꿈 → 공백 (한 번의 문자 치환)
+        value = value.translate(_CFU_NOISE_TRANSLATE)
         
         # 앞뒤 공백 제거
         value = value.strip()
@@ -1304,138 +1580,19 @@ class PreservationTestOCR:
         
         value = value.strip()
         
-        # 🆕 0. 의미 없는 값 → 빈 문자열
-        if value in ['...', '....', '…']:
-            return ''
-        
-        # 1. 명확한 <10 오인식 패턴 (숫자가 틀린 경우)
-        # 기존 + 추가
-        less_than_10_patterns = [
-            '40', '40°', '40€',  # 기존
-            'CIO', 'CIÒ', 'C10', '410', '90',  # 기존
-            # 🆕 추가 패턴
-            'Lio', 'LIO', 'Clo', 'CLO',  # <10 → Lio/Clo
-            'CO', 'cio', 'clo',  # 소문자 버전
-            'L10', 'L 10', 'L10"', 'L 10"',  # < → L
-            '€10', '€ 10',  # < → €
-            '010', '(10)', '(10', '10)',  # < → 0/(
-            '(1)', '(1', '1)',  # <10 → (1)
-            '2 <10',  # 노이즈 + <10
-            # 🆕 2차 추가 (LION, zion 계열)
-            'LION', 'LION,', 'Lion', 'lion',  # < → L, 0 → O
-            'zion', 'Zion', 'ZION',  # < → z, 0 → o
-            # 🆕 숫자 뒤에 L
-            '40L', '10L',
-            # 🆕 뒤에 0 추가
-            '400', '4100',
-            # 🆕 6 → <
-            '610',
-            # 🆕 3차 추가 (새로 발견)
-            'Cle', 'CLE', 'Cia', 'CIA',  # <10 → Cle/Cia
-            'CCO', 'cco',  # <10 → CCO
-            '00',  # <10 → 00
-            'COL', 'Col',  # <10 → COL
-            'clo"', 'clo\'',  # 따옴표 포함
-        ]
-        
-        if value in less_than_10_patterns:
-            return '<10'
-        
-        import re
-        
-        # 🆕 1-1. 특수문자 포함 패턴
-        # <10?, <10-, <10) 등
-        if re.match(r'^<\s*10[\?\-\)]+$', value):
-            return '<10'
-        
-        # 🆕 1-2. < cion 같은 복잡한 패턴
-        if re.match(r'^<\s*[czsCZS]ion', value, re.IGNORECASE):
-            return '<10'
-        
-        # 🆕 1-3. 단일 숫자 (1, 2) → <10 (손글씨에서 < 완전 누락)
-        if re.match(r'^\d$', value):  # 한 자리 숫자
-            return '<10'
-        
-        # 🆕 1-4. 두 자리 숫자 (00) → <10
-        if value == '00':
-            return '<10'
-        
-        # 2. <10^2 패턴들
-        
-        # 2-1. 정상 패턴: <102, < 102, <10^2
-        if re.match(r'^<\s*10[\^]?2$', value):
-            return '<10^2'
-        
-        # 🆕 2-1-1. 쉼표 포함: <102,
-        if re.match(r'^<\s*10[\^]?2,?$', value):
-            return '<10^2'
-        
-        # 2-2. < 10 2 (공백으로 분리)
-        if re.match(r'^<\s*10\s+2$', value):
-            return '<10^2'
-        
-        # 2-3. 4102, 5102 (< → 4/5 오인식, 7일차에서 빈번)
-        if value in ['4102', '5102', '6102', '512']:
-            return '<10^2'
-        
-        # 2-4. <12, <62 (0 누락)
-        if value in ['<12', '<62', '<1.2']:
-            return '<10^2'
-        
-        # 🆕 2-5. GIO2, CIS2, C12 (< → G/C 오인식)
-        if value in ['GIO2', 'GI02', 'CIS2', 'C12', 'C102']:
-            return '<10^2'
-        
-        # 🆕 2-6. CIO2, Clo2 (< → C 오인식, 1 → I/l)
-        if value in ['CIO2', 'Clo2', 'CI02', 'ClO2']:
-            return '<10^2'
-        
-        # 🆕 2-6-1. 쉼표 포함: SI02,
-        if re.match(r'^[SC]I0?2,?$', value, re.IGNORECASE):
-            return '<10^2'
-        
-        # 🆕 2-7. 5/02, C/02 (< → 숫자/문자/ 오인식)
-        if re.match(r'^[5C6]/0?2$', value):  # 5/02, 5/2, C/02
-            return '<10^2'
-        
-        # 🆕 2-8. ( 102, (12 (< → ( 오인식)
-        if re.match(r'^\(\s*10?2,?$', value):  # ( 102, (102, (12
-            return '<10^2'
-        
-        # 🆕 2-9. SI02 2, (102 2 (뒤에 노이즈 2)
-        if re.match(r'^[SC]I0?2\s+2$', value, re.IGNORECASE):  # SI02 2, (102 2
-            return '<10^2'
+        # 🆕 1. 단순 치환 패턴 (의미 없는 값, <10 / <10^2 오인식 등) - 딕셔너리 조회 한 번
+        fixed = _LT10_LITERAL_FIXES.get(value)
+        if fixed is not None:
+            return fixed
         
-        # 🆕 2-10. 45102 (앞에 노이즈)
-        if re.match(r'^\d+[45]102$', value):  # 45102, 34102
-            return '<10^2'
-        
-        # 3. 특수 <10 패턴들
-        
-        # 3-1. 110, 210, 2103 (< 누락, 14일차에서 빈번)
-        if value in ['110', '210', '2103', '510']:
-            return '<10'
-        
-        # 3-2. <1>, LU, /10 (심각한 오인식)
-        if value in ['<1>', 'LU', '/10']:
-            return '<10'
-        
-        # 🆕 3-3. 2 <10 같은 노이즈 제거
-        if re.match(r'^\d+\s*<\s*10', value):
-            return '<10'
-        
-        # 🆕 4. <10^3 패턴 (새로 추가!)
-        # 103 → <10^3
-        if value == '103':
-            return '<10^3'
-        
-        # 5. <10 + 따옴표/특수문자만 (숫자 없음)
-        if re.match(r'^<\s*10\s*["\'\s\?\-\)]*$', value):
-            return '<10'
+        # 🆕 2. 이미 올바른 형태 (지수 / 과학적 표기법) → 정규식 검사 없이 반환
+        if value in _LT10_ALREADY_CLEAN or _CFU_SCI_VALUE_RE.match(value):
+            return value
         
-        # 6. 이미 올바른 형태
-        if value == '<10' or value == '< 10':
-            return '<10'
+        # 🆕 3. 정규식 패턴 (순서대로 검사)
+        for pattern_re, fixed in _LT10_REGEX_FIXES:
+            if pattern_re.match(value):
+                return fixed
         
         return value
     
@@ -1461,40 +1618,21 @@ class PreservationTestOCR:
         value = value.strip()
         
         # X를 ×로 통일
-        value = value.replace('X', '×').replace('x', '×')
+        value = value.translate(_CFU_TIMES_TRANSLATE)
         
-        import re
-        
-        # 패턴 1: 숫자.숫자 × 10 숫자 (띄어쓰기 있음)
-        pattern1 = r'(\d+\.?\d*)\s*[×]\s*10\s*(\d*)'
-        match1 = re.search(pattern1, value)
-        
-        if match1:
-            base = match1.group(1)
-            exponent = match1.group(2) if match1.group(2) else '0'
-            
-            # 부등호 유지
-            prefix = ''
-            if value.startswith('<'):
-                prefix = '<'
-            elif value.startswith('≤'):
-                prefix = '≤'
-            
-            return f'{prefix}{base}×10^{exponent}'
+        # 🆕 두 패턴 모두 ×가 필요 → 없으면 바로 반환
+        if '×' not in value:
+            return value
         
-        # 패턴 2: 숫자.숫자×10숫자 (띄어쓰기 없음)
-        pattern2 = r'(\d+\.?\d*)[×]10(\d+)'
-        match2 = re.search(pattern2, value)
+        # 패턴: 숫자.숫자 × 10 숫자 (띄어쓰기 유무 모두 - 띄어쓰기 없는 6.8×105 형태도 포함)
+        match = _CFU_SCI_SPACED_RE.search(value)
         
-        if match2:
-            base = match2.group(1)
-            exponent = match2.group(2)
+        if match:
+            base = match.group(1)
+            exponent = match.group(2) if match.group(2) else '0'
             
-            prefix = ''
-            if value.startswith('<'):
-                prefix = '<'
-            elif value.startswith('≤'):
-                prefix = '≤'
+            # 부등호 유지 (🆕 첫 글자 한 번만 확인)
+            prefix = value[0] if value[0] in '<≤' else ''
             
             return f'{prefix}{base}×10^{exponent}'
         
@@ -1515,6 +1653,42 @@ class PreservationTestOCR:
         if not value:
             return ""
         
+        # 🆕 같은 (값, 날짜 컬럼)은 캐시된 결과 사용 (단계별 상세 로그는 처음 보정할 때만 출력)
+        cache_key = (value, day_column)
+        with PreservationTestOCR._cfu_cache_lock:
+            cleaned = PreservationTestOCR._cfu_cache.get(cache_key)
+            if cleaned is not None:
+                PreservationTestOCR._cfu_cache.move_to_end(cache_key)
+        
+        if cleaned is None:
+            cleaned = self._clean_cfu_pipeline(value, day_column)
+            with PreservationTestOCR._cfu_cache_lock:
+                PreservationTestOCR._cfu_cache[cache_key] = cleaned
+                while len(PreservationTestOCR._cfu_cache) > PreservationTestOCR._CFU_CACHE_SIZE:
+                    PreservationTestOCR._cfu_cache.popitem(last=False)
+        
+        # 3단계: 보정 로그 (변경된 경우만)
+        if cleaned != value and cleaned != '':
+            logger.info("  🔧 보정 [%s]: '%s' → '%s'", day_column, value, cleaned)
+        
+        return cleaned
+    
+    def _clean_cfu_column(self, values: List[str], day_column: str) -> List[str]:
+        """
+        🆕 한 날짜 컬럼의 CFU 값들을 한 번에 보정 (중복 값은 한 번만 보정 후 재사용)
+        
+        Args:
+            values: 원본 값 리스트 (행 순서)
+            day_column: 날짜 컬럼 ('0일', '7일', '14일', '28일')
+            
+        Returns:
+            보정된 값 리스트 (입력과 같은 순서)
+        """
+        cleaned_by_value = {value: self._clean_cfu_value(value, '', day_column) for value in dict.fromkeys(values)}
+        return [cleaned_by_value[value] for value in values]
+    
+    def _clean_cfu_pipeline(self, value: str, day_column: str) -> str:
+        """🆕 CFU 값 보정 단계 실행 (분리 → 노이즈 제거 → 컬럼별 보정), 캐시 미적중 시에만 호출"""
         original_value = value
         
         # 0단계: 합쳐진 셀 분리 (가장 먼저!)
@@ -1536,10 +1710,6 @@ class PreservationTestOCR:
             if day_column == '7일':
                 value = self._fix_7day_ambiguous(value, original_value)
         
-        # 3단계: 보정 로그 (변경된 경우만)
-        if value != original_value and value != '':
-            logger.info(f"  🔧 보정 [{day_column}]: '{original_value}' → '{value}'")
-        
         return value
     
     def _fix_7day_ambiguous(self, value: str, original: str) -> str:
@@ -1570,30 +1740,19 @@ class PreservationTestOCR:
             return value
         
         # 원본이 명확한 <10 패턴이면 그대로 유지
-        clear_less_10_patterns = [
-            '< 10',   # 공백 포함
-            '<10',    # 공백 없음
-            '< 10"',  # 따옴표 포함
-            '<10"',
-            '< 10\''  # 작은따옴표
-        ]
-        
         original_clean = original.strip()
         
-        for pattern in clear_less_10_patterns:
-            if original_clean == pattern or original_clean == pattern.replace(' ', ''):
-                # 명확한 <10 → 유지
-                return '<10'
+        if original_clean in _LT10_CLEAR:
+            # 명확한 <10 → 유지
+            return '<10'
         
         # 애매한 오인식 패턴
         # (40, CIO 등 - 원본 의도가 <10인지 <10^2인지 불명확)
         # → 실무에서는 7일차 <10^2가 더 일반적이므로 <10^2로 보정
-        ambiguous_patterns = ['40', '40°', '40€', 'CIO', 'CIÒ', 'C10', '410', '90']
-        
-        for pattern in ambiguous_patterns:
+        for pattern in _LT10_AMBIGUOUS:
             if pattern in original_clean:
                 # 애매한 패턴 → <10^2 (실무 기준)
-                logger.info(f"  ℹ️ 7일차 실무 보정: '{original}' → '<10^2' (일반 기준)")
+                logger.info("  ℹ️ 7일차 실무 보정: '%s' → '<10^2' (일반 기준)", original)
                 return '<10^2'
         
         # 기타 알 수 없는 패턴 → <10 유지 (보수적)
@@ -1618,40 +1777,44 @@ class PreservationTestOCR:
         if not cfu_value:
             return ""
         
-        try:
-            if '<' in cfu_value:
-                if '10^' in cfu_value:
-                    exp_match = re.search(r'<10\^(\d+)', cfu_value)
-                    if exp_match:
-                        return f"<{exp_match.group(1)}.0"
-                return "<1.0"
-            
-            exp_match = re.match(r'([0-9.]+)×10\^(\d+)', cfu_value)
-            if exp_match:
-                base = float(exp_match.group(1))
-                exp = int(exp_match.group(2))
-                log_value = exp + math.log10(base)
-                return round(log_value, 1)
-            
-            try:
-                num = float(cfu_value)
-                return round(math.log10(num), 1)
-            except ValueError:
-                pass
-            
-            return cfu_value
-            
-        except Exception as e:
-            logger.warning(f"Log 변환 실패: {cfu_value}, 오류: {e}")
+        # 🆕 문자열이 아닌 값은 변환하지 않음
+        if not isinstance(cfu_value, str):
             return cfu_value
+        
+        # 🆕 '<10', '0' 등 반복되는 CFU 문자열은 캐시된 결과 재사용
+        return _convert_str_to_log(cfu_value)
 
 
-def process_preservation_page(pdf_bytes: bytes, page_index: int, excel_path: str = None) -> dict:
+def _merge_progress_data(items: List[Dict], progress_data: Dict[str, Dict[str, str]]):
+    """진행서 데이터(처방번호 기준)를 OCR 결과 항목에 병합"""
+    logger.info(f"\n🔗 진행서 데이터 매칭 시작")
+    matched_count = 0
+    for item in items:
+        prescription = item.get('prescription_number', '')
+        if prescription and prescription in progress_data:
+            # 추가 정보 병합
+            item['product_name'] = progress_data[prescription]['product_name']
+            item['formulation'] = progress_data[prescription]['formulation']
+            item['preservative_info'] = progress_data[prescription]['preservative_info']
+            matched_count += 1
+            logger.info(f"  ✅ 매칭 성공: {prescription} → {item['product_name']}")
+        else:
+            # 매칭 실패 시 빈 값
+            item['product_name'] = ''
+            item['formulation'] = ''
+            item['preservative_info'] = ''
+            if prescription:
+                logger.warning(f"  ⚠️ 매칭 실패: {prescription}")
+    
+    logger.info(f"  📊 매칭 결과: {matched_count}/{len(items)}")
+
+
+def process_preservation_page(pdf_bytes, page_index: int, excel_path: str = None) -> dict:
     """
     보존력 시험 페이지 처리 (Azure OCR 기반)
     
     Args:
-        pdf_bytes: PDF 바이트 데이터
+        pdf_bytes: PDF 바이트 데이터 또는 PDFProcessor.spool_to_disk 파일 경로
         page_index: 페이지 인덱스
         excel_path: TestResult_PROGRESS.xlsx 파일 경로 (선택사항)
     
@@ -1706,26 +1869,7 @@ def process_preservation_page(pdf_bytes: bytes, page_index: int, excel_path: str
         
         # 5. Excel 데이터와 매칭 (진행서 데이터가 있는 경우)
         if progress_data:
-            logger.info(f"\n🔗 진행서 데이터 매칭 시작")
-            matched_count = 0
-            for item in test_data['data']:
-                prescription = item.get('prescription_number', '')
-                if prescription and prescription in progress_data:
-                    # 추가 정보 병합
-                    item['product_name'] = progress_data[prescription]['product_name']
-                    item['formulation'] = progress_data[prescription]['formulation']
-                    item['preservative_info'] = progress_data[prescription]['preservative_info']
-                    matched_count += 1
-                    logger.info(f"  ✅ 매칭 성공: {prescription} → {item['product_name']}")
-                else:
-                    # 매칭 실패 시 빈 값
-                    item['product_name'] = ''
-                    item['formulation'] = ''
-                    item['preservative_info'] = ''
-                    if prescription:
-                        logger.warning(f"  ⚠️ 매칭 실패: {prescription}")
-            
-            logger.info(f"  📊 매칭 결과: {matched_count}/{len(test_data['data'])}")
+            _merge_progress_data(test_data['data'], progress_data)
         
         # 6. 결과 포맷팅
         result['success'] = True
@@ -1754,17 +1898,399 @@ def process_preservation_page(pdf_bytes: bytes, page_index: int, excel_path: str
                 logger.warning(f"⚠️ 임시 파일 삭제 실패: {e}")
 
 
+def process_preservation_pages_batch(pdf_bytes, page_indices: List[int], excel_path: str = None) -> Dict[int, dict]:
+    """
+    여러 페이지 일괄 처리 (Azure 분석 요청 1회)
+    
+    페이지 이미지를 병렬 렌더링한 뒤 다중 페이지 TIFF 하나로 묶어 분석하고,
+    결과를 페이지별로 분리하여 process_preservation_page와 같은 형식으로 반환
+    
+    Args:
+        pdf_bytes: PDF 바이트 데이터 또는 PDFProcessor.spool_to_disk 파일 경로
+        page_indices: 처리할 페이지 인덱스 목록
+        excel_path: TestResult_PROGRESS.xlsx 파일 경로 (선택사항)
+        
+    Returns:
+        {page_index: {'success', 'data', 'date_info', 'message'}}
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from PIL import Image
+    
+    results = {
+        page_index: {'success': False, 'data': [], 'date_info': {}, 'message': ''}
+        for page_index in page_indices
+    }
+    
+    if not page_indices:
+        return results
+    
+    debug_mode = os.getenv('DEBUG_MODE', '0') == '1'
+    
+    try:
+        # 0. Excel 진행서 데이터 로드 (선택사항)
+        progress_data = {}
+        if excel_path:
+            progress_data = load_progress_excel(excel_path)
+        
+        # 1. DRM 처리
+        drm_success, processed_bytes, drm_message = PDFProcessor.process_drm_if_needed(pdf_bytes)
+        if not drm_success:
+            for page_result in results.values():
+                page_result['message'] = drm_message
+            return results
+        
+        # 2. 이미지 병렬 렌더링 (단건 처리와 같은 zoom=2.0, PNG 인코딩 없이 RGB 픽셀 그대로)
+        with ThreadPoolExecutor(max_workers=min(8, len(page_indices))) as ex:
+            rasters = list(ex.map(
+                lambda i: PDFProcessor.render_page_rgb(processed_bytes, i, zoom=2.0),
+                page_indices
+            ))
+        
+        batch_pages = []
+        batch_images = []
+        for page_index, raster in zip(page_indices, rasters):
+            if not raster:
+                results[page_index]['message'] = "이미지 렌더링 실패"
+                continue
+            width, height, samples = raster
+            batch_pages.append(page_index)
+            batch_images.append(Image.frombytes('RGB', (width, height), samples))
+        
+        if not batch_pages:
+            return results
+        
+        # 3. 다중 페이지 TIFF로 결합 (이미지 해상도 그대로 전달)
+        buffer = io.BytesIO()
+        batch_images[0].save(
+            buffer,
+            format='TIFF',
+            save_all=True,
+            append_images=batch_images[1:],
+            compression='tiff_lzw'
+        )
+        logger.info(f"📦 일괄 문서 생성: {len(batch_pages)}페이지 ({buffer.tell():,} bytes)")
+        
+        # 4. Azure OCR (요청 1회)
+        ocr = PreservationTestOCR(debug_mode=debug_mode)
+        page_tables = ocr.extract_preservation_test_tables_batch(buffer.getvalue(), len(batch_pages))
+        
+        # 5. 페이지별 결과 포맷팅
+        for page_index, test_data in zip(batch_pages, page_tables):
+            page_result = results[page_index]
+            
+            if not test_data or not test_data.get('data'):
+                page_result['message'] = "데이터 추출 실패"
+                continue
+            
+            if progress_data:
+                _merge_progress_data(test_data['data'], progress_data)
+            
+            page_result['success'] = True
+            page_result['data'] = test_data['data']
+            page_result['date_info'] = test_data['date_info']
+            page_result['message'] = f"{len(test_data['data'])}개 균주 데이터 추출 완료"
+        
+        logger.info(f"✅ 일괄 OCR 완료: {sum(r['success'] for r in results.values())}/{len(page_indices)} 페이지")
+        return results
+        
+    except Exception as e:
+        logger.error(f"❌ 일괄 처리 오류: {e}")
+        import traceback
+        traceback.print_exc()
+        for page_result in results.values():
+            if not page_result['success'] and not page_result['message']:
+                page_result['message'] = str(e)
+        return results
+
+
+@lru_cache(maxsize=8)
+def _load_product_info_cached(progress_file: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, str]]:
+    """
+    TestResult_PROGRESS.xlsx에서 제품 정보 로드 (mtime_ns/size는 캐시 키 용도)
+    
+    반환 딕셔너리는 저장기 인스턴스 간에 공유되므로 호출 측에서 수정 금지
+    
+    컬럼 구조:
+    - 제품명 (A열, 1번째)
+    - 처방번호 (B열, 2번째)
+    - 제형 (C열, 3번째)
+    - 고시미등록방부보조성분함량 (E열, 5번째)
+    
+    Returns:
+        dict: {처방번호: {'제품명': ..., '제형': ..., '고시미등록방부보조성분함량': ...}}
+    """
+    product_dict = {}
+    
+    try:
+        from openpyxl import load_workbook
+        
+        logger.info(f"📖 TestResult_PROGRESS.xlsx 파일 읽기 시작: {progress_file}")
+        
+        workbook = load_workbook(progress_file, read_only=True, data_only=True)
+        
+        # 첫 번째 시트 사용
+        if len(workbook.sheetnames) == 0:
+            logger.warning("⚠️ 시트가 없습니다")
+            workbook.close()
+            return product_dict
+        
+        sheet = workbook[workbook.sheetnames[0]]
+        logger.info(f"📄 시트 이름: {sheet.title}")
+        
+        # 데이터 읽기 (헤더 스킵, 2번째 행부터)
+        row_count = 0
+        for row_idx, row in enumerate(iter_sheet_rows(sheet, min_row=2), start=2):
+            if not row or len(row) < 5:
+                continue
+            
+            # 컬럼 인덱스: 0부터 시작
+            product_name = str(row[0]).strip() if row[0] else ''
+            prescription_number = str(row[1]).strip() if row[1] else ''
+            formulation_type = str(row[2]).strip() if row[2] else ''
+            # row[3]은 소속 (사용 안 함)
+            unregistered_preservatives = str(row[4]).strip() if row[4] else ''
+            
+            # 처방번호가 있어야 매칭 가능
+            if not prescription_number:
+                continue
+            
+            # 딕셔너리에 저장
+            product_dict[prescription_number] = {
+                '제품명': product_name,
+                '제형': formulation_type,
+                '고시미등록방부보조성분함량': unregistered_preservatives
+            }
+            
+            row_count += 1
+        
+        workbook.close()
+        
+        logger.info(f"✅ 제품 정보 로드 완료: {row_count}개 제품")
+        logger.info(f"📋 처방번호 목록 (일부): {list(product_dict.keys())[:5]}...")
+        
+        return product_dict
+        
+    except Exception as e:
+        logger.error(f"❌ 제품 정보 로드 실패: {e}")
+        import traceback
+        traceback.print_exc()
+        return product_dict
+
+
+def _cell_position(coordinate: str) -> Tuple[int, int]:
+    """셀 좌표 문자열 → (행, 열) 변환 ('AA3' → (3, 27)), openpyxl import 없이 클래스 상수 생성용"""
+    letters = coordinate.rstrip('0123456789')
+    column = 0
+    for letter in letters:
+        column = column * 26 + ord(letter) - 64
+    return int(coordinate[len(letters):]), column
+
+
+class _BufferedCell:
+    """_SheetCellBuffer의 셀 (openpyxl Cell처럼 .value만 제공)"""
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = None
+
+
+class _SheetCellBuffer:
+    """
+    🆕 write_only 시트용 셀 버퍼
+    
+    worksheet['AA3'] = v / worksheet.cell(row=, column=).value = v 형태의 기록을 모아두었다가
+    행 단위 튜플로 내보냄 (write_only 시트는 append만 가능하므로 좌표 기록을 여기서 받아줌)
+    """
+    
+    def __init__(self):
+        self.cells = {}
+    
+    def __setitem__(self, coordinate, value):
+        self.cell(*_cell_position(coordinate)).value = value
+    
+    def cell(self, row, column, value=None):
+        cell = self.cells.get((row, column))
+        if cell is None:
+            cell = self.cells[(row, column)] = _BufferedCell()
+        if value is not None:
+            cell.value = value
+        return cell
+    
+    def iter_rows(self):
+        """1행부터 마지막 기록 행까지 행 튜플 반환 (빈 칸은 None)"""
+        if not self.cells:
+            return
+        
+        by_row = {}
+        for (row, column), cell in self.cells.items():
+            by_row.setdefault(row, {})[column] = cell.value
+        
+        for row in range(1, max(by_row) + 1):
+            columns = by_row.get(row)
+            if not columns:
+                yield ()
+                continue
+            yield tuple(columns.get(column) for column in range(1, max(columns) + 1))
+
+
+# ========================================
+# 🆕 템플릿 시트 XML 합성 (copy_worksheet 대체)
+# ========================================
+_SHEET_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_SHEET_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PACKAGE_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_SHEET_TAG = f'{{{_SHEET_MAIN_NS}}}'
+
+
+def _sheet_parts_by_name(zf: zipfile.ZipFile) -> Dict[str, str]:
+    """xlsx(zip)의 시트명 → 워크시트 XML 경로 (xl/workbook.xml + 관계 파일 기준)"""
+    workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    targets = {
+        rel.get('Id'): rel.get('Target')
+        for rel in rels.iter(f'{{{_PACKAGE_REL_NS}}}Relationship')
+    }
+    
+    parts = {}
+    for sheet in workbook.iter(f'{_SHEET_TAG}sheet'):
+        target = targets.get(sheet.get(f'{{{_SHEET_REL_NS}}}id'), '')
+        parts[sheet.get('name')] = target[1:] if target.startswith('/') else f'xl/{target}'
+    return parts
+
+
+def _merge_sheet_cells(template_root, values_root) -> bytes:
+    """
+    템플릿 시트 XML에 값 시트의 셀(<c>)을 덮어써서 새 시트 XML 생성
+    
+    값 셀의 타입/값은 그대로 쓰고 서식(s)은 템플릿 셀 것을 유지
+    (openpyxl의 XML 함수 사용 - lxml이 있으면 lxml, 없으면 ElementTree)
+    """
+    from openpyxl.xml.functions import Element, tostring
+    
+    root = copy.deepcopy(template_root)
+    
+    # 템플릿 시트의 선택 상태는 복사하지 않음 (여러 시트가 그룹 선택된 채 열리는 것 방지)
+    for view in root.iter(f'{_SHEET_TAG}sheetView'):
+        view.attrib.pop('tabSelected', None)
+    
+    sheet_data = root.find(f'{_SHEET_TAG}sheetData')
+    rows = {int(row.get('r')): row for row in sheet_data.findall(f'{_SHEET_TAG}row')}
+    
+    for value_row in values_root.find(f'{_SHEET_TAG}sheetData').findall(f'{_SHEET_TAG}row'):
+        row_idx = int(value_row.get('r'))
+        row = rows.get(row_idx)
+        if row is None:
+            row = Element(f'{_SHEET_TAG}row', r=str(row_idx))
+            sheet_data.insert(sum(1 for existing in rows if existing < row_idx), row)
+            rows[row_idx] = row
+        
+        cells = {cell.get('r'): cell for cell in row.findall(f'{_SHEET_TAG}c')}
+        
+        for value_cell in value_row.findall(f'{_SHEET_TAG}c'):
+            coordinate = value_cell.get('r')
+            cell = cells.get(coordinate)
+            
+            if cell is None:
+                # 템플릿에 없는 셀: 열 순서에 맞춰 삽입
+                column = _cell_position(coordinate)[1]
+                position = sum(1 for other in cells if _cell_position(other)[1] < column)
+                row.insert(position, copy.deepcopy(value_cell))
+                cells[coordinate] = value_cell
+                continue
+            
+            style = cell.get('s') or value_cell.get('s')
+            cell.clear()
+            cell.attrib.update(value_cell.attrib)
+            if style is not None:
+                cell.set('s', style)
+            cell.extend(copy.deepcopy(child) for child in value_cell)
+    
+    return tostring(root)
+
+
+def _compose_template_sheets(excel_bytes: bytes, template_name: str, sheet_names) -> bytes:
+    """
+    openpyxl이 저장한 xlsx에서 sheet_names 시트를 '템플릿 시트 XML + 해당 시트 셀'로 교체
+    
+    copy_worksheet는 병합 셀마다 테두리를 다시 계산해서 시트당 수십 ms가 걸리므로,
+    빈 시트에 값만 기록해 저장한 뒤 직렬화된 템플릿 XML을 복제해 값 셀만 덮어씀
+    (같은 파일 안의 템플릿이므로 서식/공유 문자열 인덱스가 그대로 유효)
+    """
+    from openpyxl.xml.functions import fromstring
+    
+    with zipfile.ZipFile(io.BytesIO(excel_bytes)) as source:
+        parts = _sheet_parts_by_name(source)
+        template_root = fromstring(source.read(parts[template_name]))
+        
+        replaced = {}
+        for name in sheet_names:
+            part = parts.get(name)
+            if part is not None:
+                replaced[part] = _merge_sheet_cells(template_root, fromstring(source.read(part)))
+        
+        output = io.BytesIO()
+        with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as target:
+            for info in source.infolist():
+                data = replaced.get(info.filename)
+                target.writestr(info, data if data is not None else source.read(info.filename))
+    
+    return output.getvalue()
+
+
 class PreservationExcelSaver:
     """보존력 시험 Excel 저장 (템플릿 기반)"""
     
     DEFAULT_TEMPLATE = "TestResult_OCR_v1.xlsx"
     DEFAULT_PROGRESS_FILE = "TestResult_PROGRESS.xlsx"
     
+    # 🆕 셀 위치표 (클래스 로드 시 (행, 열)로 1회 변환 - 기록할 때마다 좌표 문자열 파싱 없음)
+    # 항목 → (원본 위치, 로그 위치)
+    _FIELD_CELL_POSITIONS = {
+        field: (_cell_position(original), _cell_position(log))
+        for field, original, log in (
+            ('test_number', 'AA3', 'AA33'),
+            ('prescription_number', 'E4', 'E34'),
+            ('product_name', 'E3', 'E33'),
+            ('formulation', 'Y5', 'Y35'),
+            ('preservative_info', 'E6', 'E36'),
+            ('final_judgment', 'D30', 'D60'),
+        )
+    }
+    # 0/7/14/28일 날짜 → (원본 위치, 로그 위치)
+    _DATE_CELL_POSITIONS = tuple(
+        (_cell_position(original), _cell_position(log))
+        for original, log in (('I19', 'I49'), ('L19', 'L49'), ('O19', 'O49'), ('R19', 'R49'))
+    )
+    # 균주 → (원본 0/7/14/28일+판정, 로그 0/7/14/28일)
+    _STRAIN_CELL_POSITIONS = {
+        strain: (
+            tuple(_cell_position(f'{column}{row}') for column in ('J', 'M', 'P', 'S', 'U')),
+            tuple(_cell_position(f'{column}{row + 30}') for column in ('J', 'M', 'P', 'S')),
+        )
+        for strain, row in (
+            ('E.coli', 20),
+            ('P.aeruginosa', 21),
+            ('S.aureus', 22),
+            ('C.albicans', 23),
+            ('A.brasiliensis', 24),
+        )
+    }
+    # 균주 행에서 읽는 컬럼 (균주, CFU 0/7/14/28일, 판정)
+    _STRAIN_ROW_FIELDS = ('strain', 'cfu_0day', 'cfu_7day', 'cfu_14day', 'cfu_28day', 'judgment')
+    
     def __init__(self, output_path: str, template_file: str = None, progress_file: str = None):
         self.output_path = output_path
         self.template_file = template_file or self.DEFAULT_TEMPLATE
         self.progress_file = progress_file or self.DEFAULT_PROGRESS_FILE
         
+        # 워크북은 직렬화 시에만 로드하고 기록 후 해제 (저장 데이터는 대기열로 보관)
+        self._workbook = None
+        self._dirty = False
+        self._cached_bytes = None
+        self.pending = []  # 🆕 (DataFrame, date_info, 시험번호 목록) 대기열
+        self._template_sheets = set()  # 🆕 저장 후 템플릿 XML과 합성할 시트명
+        self._keep_workbook = False  # 🆕 with 블록(세션) 동안 워크북 상주 여부
+        
         # 템플릿 파일 확인
         if not os.path.exists(self.template_file):
             logger.warning(f"⚠️ 템플릿 파일을 찾을 수 없습니다: {self.template_file}")
@@ -1788,28 +2314,21 @@ class PreservationExcelSaver:
         """Excel 파일 초기화"""
         try:
             if self.template_file and os.path.exists(self.template_file):
-                import shutil
                 from openpyxl import load_workbook
                 
-                shutil.copy2(self.template_file, self.output_path)
-                
-                workbook = load_workbook(self.output_path)
+                # 🆕 템플릿을 메모리로 1회 로드 후 이름 변경/저장 (파일 복사 후 재로드 없음)
+                workbook = load_workbook(self.template_file)
                 if len(workbook.sheetnames) > 0:
                     first_sheet = workbook[workbook.sheetnames[0]]
                     first_sheet.title = "TEMPLATE_BASE"
                 
                 workbook.save(self.output_path)
-                workbook.close()
+                self._workbook = workbook
                 
                 logger.info(f"✅ 템플릿 기반 Excel 초기화 완료")
             else:
-                from openpyxl import Workbook
-                wb = Workbook()
-                wb.remove(wb.active)
-                wb.save(self.output_path)
-                wb.close()
-                
-                logger.warning(f"⚠️ 템플릿 없이 빈 Excel 파일 생성")
+                # 🆕 시트 없는 워크북은 저장할 수 없으므로 파일은 첫 저장(write_only) 시 생성
+                logger.warning(f"⚠️ 템플릿 없이 빈 Excel로 시작 (첫 저장 시 파일 생성)")
             
             return True
         except Exception as e:
@@ -1820,75 +2339,83 @@ class PreservationExcelSaver:
         """
         TestResult_PROGRESS.xlsx에서 제품 정보 로드
         
-        컬럼 구조:
-        - 제품명 (A열, 1번째)
-        - 처방번호 (B열, 2번째)
-        - 제형 (C열, 3번째)
-        - 고시미등록방부보조성분함량 (E열, 5번째)
+        🆕 (경로, 수정 시각, 크기)로 캐시: 저장기를 새로 만들어도 같은 파일은 재파싱 없음
         
         Returns:
             dict: {처방번호: {'제품명': ..., '제형': ..., '고시미등록방부보조성분함량': ...}}
         """
-        product_dict = {}
+        if not os.path.exists(self.progress_file):
+            logger.warning(f"⚠️ TestResult_PROGRESS.xlsx 파일 없음: {self.progress_file}")
+            return {}
         
-        try:
+        stat = os.stat(self.progress_file)
+        return _load_product_info_cached(self.progress_file, stat.st_mtime_ns, stat.st_size)
+    
+    def _get_workbook(self):
+        """메모리 상주 워크북 반환 (없으면 파일에서 1회 로드)"""
+        if self._workbook is None:
             from openpyxl import load_workbook
-            
-            if not os.path.exists(self.progress_file):
-                logger.warning(f"⚠️ TestResult_PROGRESS.xlsx 파일 없음: {self.progress_file}")
-                return product_dict
-            
-            logger.info(f"📖 TestResult_PROGRESS.xlsx 파일 읽기 시작: {self.progress_file}")
-            
-            workbook = load_workbook(self.progress_file, read_only=True, data_only=True)
-            
-            # 첫 번째 시트 사용
-            if len(workbook.sheetnames) == 0:
-                logger.warning("⚠️ 시트가 없습니다")
-                workbook.close()
-                return product_dict
-            
-            sheet = workbook[workbook.sheetnames[0]]
-            logger.info(f"📄 시트 이름: {sheet.title}")
-            
-            # 데이터 읽기 (헤더 스킵, 2번째 행부터)
-            row_count = 0
-            for row_idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=2):
-                if not row or len(row) < 5:
-                    continue
-                
-                # 컬럼 인덱스: 0부터 시작
-                product_name = str(row[0]).strip() if row[0] else ''
-                prescription_number = str(row[1]).strip() if row[1] else ''
-                formulation_type = str(row[2]).strip() if row[2] else ''
-                # row[3]은 소속 (사용 안 함)
-                unregistered_preservatives = str(row[4]).strip() if row[4] else ''
-                
-                # 처방번호가 있어야 매칭 가능
-                if not prescription_number:
-                    continue
-                
-                # 딕셔너리에 저장
-                product_dict[prescription_number] = {
-                    '제품명': product_name,
-                    '제형': formulation_type,
-                    '고시미등록방부보조성분함량': unregistered_preservatives
-                }
-                
-                row_count += 1
-            
-            workbook.close()
-            
-            logger.info(f"✅ 제품 정보 로드 완료: {row_count}개 제품")
-            logger.info(f"📋 처방번호 목록 (일부): {list(product_dict.keys())[:5]}...")
-            
-            return product_dict
-            
-        except Exception as e:
-            logger.error(f"❌ 제품 정보 로드 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            return product_dict
+            self._workbook = load_workbook(self.output_path)
+        return self._workbook
+    
+    def __enter__(self):
+        """
+        🆕 저장 세션 시작: with 블록 동안 워크북을 메모리에 유지
+        
+        블록 안에서 get_excel_bytes()를 여러 번 호출해도 출력 xlsx를 매번 다시 로드하지 않음
+        """
+        self._keep_workbook = True
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """🆕 저장 세션 종료: 정상 종료 시 대기열을 1회 기록하고 워크북 해제"""
+        try:
+            if exc_type is None:
+                self._flush()
+        finally:
+            self._keep_workbook = False
+            self._workbook = None
+            self._template_sheets = set()
+        return False
+    
+    def _flush(self):
+        """
+        대기열을 워크북에 반영하고 한 번 직렬화하여 파일에 기록
+        
+        기록 후 워크북을 해제하여 다음 저장까지 셀 객체를 메모리에 두지 않음
+        (with 세션 중에는 워크북과 합성 대상 시트를 유지하여 다음 저장 시 재로드 없음)
+        
+        Returns:
+            bytes: 직렬화된 Excel 바이트 (변경 없으면 None)
+        """
+        if not self._dirty:
+            return None
+        
+        buffer = io.BytesIO()
+        if self.template_file is None:
+            # 🆕 템플릿 없음: 복사할 서식이 없으므로 write_only 워크북으로 행을 바로 스트리밍
+            self._save_write_only(buffer)
+        else:
+            # 템플릿 시트 서식이 필요하므로 일반 워크북 사용
+            self._apply_pending()
+            self._get_workbook().save(buffer)
+        excel_bytes = buffer.getvalue()
+        
+        if self._template_sheets:
+            # 🆕 값만 기록된 시트를 템플릿 시트 XML과 합성
+            excel_bytes = _compose_template_sheets(excel_bytes, "TEMPLATE_BASE", self._template_sheets)
+        
+        with open(self.output_path, 'wb') as f:
+            f.write(excel_bytes)
+        
+        if not self._keep_workbook:
+            # 상주 워크북의 합성 대상 시트는 값만 있는 빈 시트이므로 세션 밖에서는 함께 해제
+            self._workbook = None
+            self._template_sheets = set()
+        self._dirty = False
+        self._cached_bytes = excel_bytes
+        logger.info(f"💾 Excel 파일 기록 완료: {len(excel_bytes)} bytes")
+        return excel_bytes
     
     def add_test_data(self, test_data, date_info=None):
         """
@@ -1899,7 +2426,6 @@ class PreservationExcelSaver:
             date_info: 날짜 정보 딕셔너리
         """
         try:
-            from openpyxl import load_workbook
             import pandas as pd
             
             # DataFrame으로 변환
@@ -1927,54 +2453,21 @@ class PreservationExcelSaver:
                 logger.warning("⚠️ 유효한 시험번호가 없습니다")
                 return False
             
-            logger.info(f"📋 {len(test_numbers)}개 시험번호 발견: {list(test_numbers)}")
+            # 빈 시험번호 제외
+            test_numbers = [t for t in test_numbers if t and str(t).strip() != '']
             
-            # Excel 파일 로드
-            workbook = load_workbook(self.output_path)
-            
-            success_count = 0
+            if len(test_numbers) == 0:
+                logger.warning("⚠️ 유효한 시험번호가 없습니다")
+                return False
             
-            # 각 시험번호별로 처리
-            for test_number in test_numbers:
-                if not test_number or str(test_number).strip() == '':
-                    continue
-                
-                # 해당 시험번호의 데이터만 추출
-                df_subset = df[df['test_number'] == test_number].copy()
-                
-                if df_subset.empty:
-                    continue
-                
-                logger.info(f"🔄 {test_number} 처리 중... ({len(df_subset)}개 행)")
-                
-                # 시트명 설정
-                sheet_name = str(test_number)
-                
-                # 🔧 기존 시트가 있으면 삭제 (업데이트를 위해)
-                if sheet_name in workbook.sheetnames:
-                    del workbook[sheet_name]
-                    logger.info(f"🔄 기존 시트 삭제 (업데이트): {sheet_name}")
-                
-                # 템플릿 시트 복사하여 새 시트 생성
-                if "TEMPLATE_BASE" in workbook.sheetnames:
-                    template_sheet = workbook["TEMPLATE_BASE"]
-                    new_sheet = workbook.copy_worksheet(template_sheet)
-                    new_sheet.title = sheet_name
-                    logger.info(f"✅ 시트 생성 완료: {sheet_name}")
-                else:
-                    new_sheet = workbook.create_sheet(title=sheet_name)
-                    logger.warning(f"⚠️ 템플릿 없이 빈 시트 생성: {sheet_name}")
-                
-                # 데이터 매핑
-                self._map_data_to_sheet(new_sheet, df_subset, date_info)
-                
-                success_count += 1
+            logger.info(f"📋 {len(test_numbers)}개 시험번호 발견: {test_numbers}")
             
-            # 즉시 저장
-            workbook.save(self.output_path)
-            workbook.close()
+            # 🆕 대기열에 추가 (시트 생성/직렬화는 다운로드 시 일괄 처리)
+            self.pending.append((df.copy(), date_info, test_numbers))
+            self._dirty = True
+            self._cached_bytes = None
             
-            logger.info(f"💾 Excel 저장 완료: {success_count}개 시트")
+            logger.info(f"📥 Excel 대기열 추가: {len(test_numbers)}개 시험 (대기 {len(self.pending)}건)")
             return True
             
         except Exception as e:
@@ -1983,6 +2476,106 @@ class PreservationExcelSaver:
             traceback.print_exc()
             return False
     
+    def _iter_pending_sheets(self):
+        """
+        🆕 대기열을 시험번호별 (시험번호, 데이터, date_info)로 순회
+        
+        시험번호마다 df[df['test_number'] == t]로 전체를 다시 훑지 않고 groupby 1회로 분할
+        """
+        for df, date_info, test_numbers in self.pending:
+            groups = dict(tuple(df.groupby('test_number', sort=False)))
+            
+            for test_number in test_numbers:
+                df_subset = groups.get(test_number)
+                if df_subset is None or df_subset.empty:
+                    continue
+                yield test_number, df_subset, date_info
+    
+    def _apply_pending(self):
+        """🆕 대기열의 페이지 데이터를 워크북 시트로 반영"""
+        if not self.pending:
+            return
+        
+        workbook = self._get_workbook()
+        success_count = 0
+        
+        # 각 시험번호별로 처리
+        for test_number, df_subset, date_info in self._iter_pending_sheets():
+            logger.info(f"🔄 {test_number} 처리 중... ({len(df_subset)}개 행)")
+            
+            # 시트명 설정
+            sheet_name = str(test_number)
+            
+            # 🔧 기존 시트가 있으면 삭제 (업데이트를 위해)
+            if sheet_name in workbook.sheetnames:
+                del workbook[sheet_name]
+                self._template_sheets.discard(sheet_name)
+                logger.info(f"🔄 기존 시트 삭제 (업데이트): {sheet_name}")
+            
+            # 템플릿 시트 복사하여 새 시트 생성
+            # 🆕 copy_worksheet 대신 빈 시트에 값만 기록 → 저장 시 템플릿 시트 XML과 합성 (_compose_template_sheets)
+            if "TEMPLATE_BASE" in workbook.sheetnames:
+                new_sheet = workbook.create_sheet(title=sheet_name)
+                self._template_sheets.add(sheet_name)
+                logger.info(f"✅ 시트 생성 완료: {sheet_name}")
+            else:
+                new_sheet = workbook.create_sheet(title=sheet_name)
+                logger.warning(f"⚠️ 템플릿 없이 빈 시트 생성: {sheet_name}")
+            
+            # 데이터 매핑
+            self._map_data_to_sheet(new_sheet, df_subset, date_info)
+            
+            success_count += 1
+        
+        self.pending = []
+        logger.info(f"💾 Excel 반영 완료: {success_count}개 시트")
+    
+    def _save_write_only(self, buffer):
+        """
+        🆕 템플릿 없는 경우 write_only 워크북으로 직렬화
+        
+        기존 시트는 read_only로 값만 읽어 그대로 append하고, 대기열 시트는 셀 버퍼에
+        매핑한 뒤 행 단위로 append (셀 객체 그래프를 메모리에 만들지 않음)
+        """
+        from openpyxl import Workbook, load_workbook
+        
+        # 시트명 → 행 iterator 생성 함수 (dict 삽입 순서 = 시트 순서, 재기록 시트는 맨 뒤로)
+        sheets = {}
+        
+        existing = None
+        if self._workbook is None and os.path.exists(self.output_path):
+            existing = load_workbook(self.output_path, read_only=True)
+            for name in existing.sheetnames:
+                sheets[name] = lambda ws=existing[name]: ws.iter_rows(values_only=True)
+        elif self._workbook is not None:
+            for name in self._workbook.sheetnames:
+                sheets[name] = lambda ws=self._workbook[name]: ws.iter_rows(values_only=True)
+        
+        success_count = 0
+        for test_number, df_subset, date_info in self._iter_pending_sheets():
+            sheet_name = str(test_number)
+            if sheets.pop(sheet_name, None) is not None:
+                logger.info(f"🔄 기존 시트 삭제 (업데이트): {sheet_name}")
+            
+            cell_buffer = _SheetCellBuffer()
+            self._map_data_to_sheet(cell_buffer, df_subset, date_info)
+            sheets[sheet_name] = cell_buffer.iter_rows
+            success_count += 1
+        
+        try:
+            workbook = Workbook(write_only=True)
+            for name, iter_rows in sheets.items():
+                worksheet = workbook.create_sheet(title=name)
+                for row in iter_rows():
+                    worksheet.append(row)
+            workbook.save(buffer)
+        finally:
+            if existing is not None:
+                existing.close()
+        
+        self.pending = []
+        logger.info(f"💾 Excel 반영 완료 (write_only): {success_count}개 시트")
+    
     def _map_data_to_sheet(self, worksheet, df, date_info):
         """
         데이터를 템플릿 시트에 매핑
@@ -2013,25 +2606,32 @@ class PreservationExcelSaver:
             if df.empty:
                 return
             
+            # 🆕 원본/로그 위치에 같은 값 기록 (미리 변환한 (행, 열) 사용)
+            def write_pair(field, value):
+                (row, column), (log_row, log_column) = self._FIELD_CELL_POSITIONS[field]
+                worksheet.cell(row=row, column=column).value = value
+                worksheet.cell(row=log_row, column=log_column).value = value
+            
+            first_row = df.iloc[0]
+            mapped_fields = []  # 🆕 항목별 로그 대신 시트당 요약 1줄로 기록
+            
             # 🔧 사용자 정의 매핑
             # 시험번호 매핑 (AA3: 원본, AA33: 로그)
-            test_number = df.iloc[0].get('test_number', '')
+            test_number = first_row.get('test_number', '')
             if test_number:
-                worksheet['AA3'] = test_number    # 원본
-                worksheet['AA33'] = test_number   # 로그
-                logger.info(f"📝 시험번호 매핑: AA3, AA33 = {test_number}")
+                write_pair('test_number', test_number)
+                mapped_fields.append('시험번호')
             
             # 처방번호 매핑 (E4: 원본, E34: 로그)
-            prescription_number = df.iloc[0].get('prescription_number', '')
+            prescription_number = first_row.get('prescription_number', '')
             if prescription_number:
-                worksheet['E4'] = prescription_number    # 원본
-                worksheet['E34'] = prescription_number   # 로그
-                logger.info(f"📝 처방번호 매핑: E4, E34 = {prescription_number}")
+                write_pair('prescription_number', prescription_number)
+                mapped_fields.append('처방번호')
             
             # 🆕 OCR 결과에서 추가 정보 직접 읽기 (우선순위)
-            product_name_from_ocr = df.iloc[0].get('product_name', '')
-            formulation_from_ocr = df.iloc[0].get('formulation', '')
-            preservative_from_ocr = df.iloc[0].get('preservative_info', '')
+            product_name_from_ocr = first_row.get('product_name', '')
+            formulation_from_ocr = first_row.get('formulation', '')
+            preservative_from_ocr = first_row.get('preservative_info', '')
             
             # 제품명 매핑 (E3: 원본, E33: 로그)
             product_name = product_name_from_ocr or (
@@ -2039,9 +2639,8 @@ class PreservationExcelSaver:
                 if prescription_number in self.product_info_dict else ''
             )
             if product_name:
-                worksheet['E3'] = product_name    # 원본
-                worksheet['E33'] = product_name   # 로그
-                logger.info(f"📝 제품명 매핑: E3, E33 = {product_name}")
+                write_pair('product_name', product_name)
+                mapped_fields.append('제품명')
             
             # 제형 매핑 (Y5: 원본, Y35: 로그)
             formulation = formulation_from_ocr or (
@@ -2049,9 +2648,8 @@ class PreservationExcelSaver:
                 if prescription_number in self.product_info_dict else ''
             )
             if formulation:
-                worksheet['Y5'] = formulation     # 원본
-                worksheet['Y35'] = formulation    # 로그
-                logger.info(f"📝 제형 매핑: Y5, Y35 = {formulation}")
+                write_pair('formulation', formulation)
+                mapped_fields.append('제형')
             
             # 고시미등록방부보조성분함량 매핑 (E6: 원본, E36: 로그)
             preservative_info = preservative_from_ocr or (
@@ -2059,21 +2657,17 @@ class PreservationExcelSaver:
                 if prescription_number in self.product_info_dict else ''
             )
             if preservative_info:
-                worksheet['E6'] = preservative_info    # 원본
-                worksheet['E36'] = preservative_info   # 로그
-                logger.info(f"📝 고시미등록방부보조성분함량 매핑: E6, E36 = {preservative_info}")
+                write_pair('preservative_info', preservative_info)
+                mapped_fields.append('고시미등록방부보조성분함량')
             
             # 최종판정 매핑 (D30: 원본, D60: 로그)
-            final_judgment = df.iloc[0].get('final_judgment', '')
+            final_judgment = first_row.get('final_judgment', '')
             if final_judgment:
-                worksheet['D30'] = final_judgment    # 원본
-                worksheet['D60'] = final_judgment    # 로그
-                logger.info(f"📝 최종판정 매핑: D30, D60 = {final_judgment}")
+                write_pair('final_judgment', final_judgment)
+                mapped_fields.append('최종판정')
             else:
                 # 빈 값이면 공란으로
-                worksheet['D30'] = ''
-                worksheet['D60'] = ''
-                logger.info(f"📝 최종판정 매핑: D30, D60 = (공란)")
+                write_pair('final_judgment', '')
             
             # 날짜 정보 매핑
             if date_info:
@@ -2085,69 +2679,45 @@ class PreservationExcelSaver:
                 ]
                 
                 if len(date_list) >= 4:
-                    date_positions_original = ['I19', 'L19', 'O19', 'R19']
-                    date_positions_log = ['I49', 'L49', 'O49', 'R49']
-                    
-                    for i, date_val in enumerate(date_list[:4]):
+                    for date_val, ((row, column), (log_row, log_column)) in zip(date_list, self._DATE_CELL_POSITIONS):
                         if date_val:
-                            worksheet[date_positions_original[i]] = date_val
-                            worksheet[date_positions_log[i]] = date_val
+                            worksheet.cell(row=row, column=column).value = date_val
+                            worksheet.cell(row=log_row, column=log_column).value = date_val
                     
-                    logger.info(f"📅 날짜 정보 매핑: {date_list}")
+                    mapped_fields.append('날짜')
             
             # 균주별 CFU 데이터 매핑
-            strain_mapping = {
-                'E.coli': 'E.coli',
-                'P.aeruginosa': 'P.aeruginosa',
-                'S.aureus': 'S.aureus',
-                'C.albicans': 'C.albicans',
-                'A.brasiliensis': 'A.brasiliensis'
-            }
-            
-            original_positions = {
-                'E.coli': ['J20', 'M20', 'P20', 'S20', 'U20'],
-                'P.aeruginosa': ['J21', 'M21', 'P21', 'S21', 'U21'],
-                'S.aureus': ['J22', 'M22', 'P22', 'S22', 'U22'],
-                'C.albicans': ['J23', 'M23', 'P23', 'S23', 'U23'],
-                'A.brasiliensis': ['J24', 'M24', 'P24', 'S24', 'U24']
-            }
-            
-            log_positions = {
-                'E.coli': ['J50', 'M50', 'P50', 'S50'],
-                'P.aeruginosa': ['J51', 'M51', 'P51', 'S51'],
-                'S.aureus': ['J52', 'M52', 'P52', 'S52'],
-                'C.albicans': ['J53', 'M53', 'P53', 'S53'],
-                'A.brasiliensis': ['J54', 'M54', 'P54', 'S54']
-            }
+            # 🆕 iterrows 대신 필요한 컬럼만 리스트로 꺼내 zip으로 순회 (행마다 Series 생성 없음)
+            row_count = len(df)
+            columns = [
+                df[name].tolist() if name in df.columns else [''] * row_count
+                for name in self._STRAIN_ROW_FIELDS
+            ]
             
             mapped_count = 0
-            for _, row in df.iterrows():
-                strain = row.get('strain', '')
+            for strain, *cfu_values, judgment in zip(*columns):
                 if not strain:
                     continue
                 
-                mapped_strain = strain_mapping.get(strain, strain)
+                positions = self._STRAIN_CELL_POSITIONS.get(strain)
+                if positions is None:
+                    continue
                 
-                if mapped_strain in original_positions:
-                    # 원본 CFU 값
-                    positions = original_positions[mapped_strain]
-                    worksheet[positions[0]] = row.get('cfu_0day', '')
-                    worksheet[positions[1]] = row.get('cfu_7day', '')
-                    worksheet[positions[2]] = row.get('cfu_14day', '')
-                    worksheet[positions[3]] = row.get('cfu_28day', '')
-                    worksheet[positions[4]] = row.get('judgment', '')
-                    
-                    # Log 값
-                    log_pos = log_positions[mapped_strain]
-                    worksheet[log_pos[0]] = PreservationTestOCR.convert_to_log(row.get('cfu_0day', ''))
-                    worksheet[log_pos[1]] = PreservationTestOCR.convert_to_log(row.get('cfu_7day', ''))
-                    worksheet[log_pos[2]] = PreservationTestOCR.convert_to_log(row.get('cfu_14day', ''))
-                    worksheet[log_pos[3]] = PreservationTestOCR.convert_to_log(row.get('cfu_28day', ''))
-                    
-                    mapped_count += 1
-                    logger.info(f"🦠 {mapped_strain} 데이터 매핑 완료")
+                original_cells, log_cells = positions
+                
+                # 원본 CFU 값 + 판정
+                for (row, column), value in zip(original_cells, (*cfu_values, judgment)):
+                    worksheet.cell(row=row, column=column).value = value
+                
+                # Log 값
+                for (row, column), value in zip(log_cells, cfu_values):
+                    worksheet.cell(row=row, column=column).value = PreservationTestOCR.convert_to_log(value)
+                
+                mapped_count += 1
             
-            logger.info(f"✅ 총 {mapped_count}개 균주 데이터 매핑 완료")
+            logger.info(
+                f"✅ {test_number} 매핑 완료: {', '.join(mapped_fields) or '(항목 없음)'} / 균주 {mapped_count}개"
+            )
             
         except Exception as e:
             logger.error(f"❌ 데이터 매핑 실패: {e}")
@@ -2157,12 +2727,11 @@ class PreservationExcelSaver:
     def get_sheet_list(self):
         """시트 목록 반환"""
         try:
-            from openpyxl import load_workbook
-            
-            if os.path.exists(self.output_path):
-                workbook = load_workbook(self.output_path, read_only=True)
-                sheet_names = workbook.sheetnames
-                workbook.close()
+            if self._workbook is not None:
+                return [name for name in self._workbook.sheetnames if name != "TEMPLATE_BASE"]
+            elif os.path.exists(self.output_path):
+                # 🆕 xl/workbook.xml에서 시트명만 읽기 (공유 문자열/스타일 파싱 없음)
+                sheet_names = _read_sheet_names(self.output_path)
                 
                 filtered_names = [name for name in sheet_names if name != "TEMPLATE_BASE"]
                 return filtered_names
@@ -2173,24 +2742,50 @@ class PreservationExcelSaver:
             return []
     
     def get_excel_bytes(self):
-        """Excel 바이트 반환"""
+        """Excel 바이트 반환 (변경이 없으면 캐시 재사용)"""
         try:
+            if not self._dirty and self._cached_bytes is not None:
+                return self._cached_bytes
+            
+            excel_bytes = self._flush()
+            if excel_bytes is not None:
+                return excel_bytes
+            
             if os.path.exists(self.output_path):
                 with open(self.output_path, 'rb') as f:
-                    return f.read()
+                    self._cached_bytes = f.read()
+                return self._cached_bytes
         except:
             pass
         return None
     
+    def has_data(self):
+        """저장된 시험 시트 존재 여부 (대기열 우선, 없으면 파일 시트 목록 확인)"""
+        if self.pending:
+            return True
+        
+        if self._workbook is not None:
+            sheet_names = self._workbook.sheetnames
+        elif os.path.exists(self.output_path):
+            sheet_names = _read_sheet_names(self.output_path)
+        else:
+            return False
+        return any(name != "TEMPLATE_BASE" for name in sheet_names)
+    
     def get_statistics(self):
         """통계 반환"""
         try:
-            from openpyxl import load_workbook
             if os.path.exists(self.output_path):
-                wb = load_workbook(self.output_path, read_only=True)
-                total_sheets = len(wb.sheetnames)
-                test_sheets = len([name for name in wb.sheetnames if name != "TEMPLATE_BASE"])
-                wb.close()
+                if self._workbook is not None:
+                    sheet_names = self._workbook.sheetnames
+                else:
+                    sheet_names = _read_sheet_names(self.output_path)
+                
+                # 🆕 대기열은 시험번호당 1개 시트로 집계 (반영 없이 계산)
+                pending_sheets = sum(len(test_numbers) for _, _, test_numbers in self.pending)
+                
+                total_sheets = len(sheet_names) + pending_sheets
+                test_sheets = len([name for name in sheet_names if name != "TEMPLATE_BASE"]) + pending_sheets
                 
                 file_size = os.path.getsize(self.output_path)
                 return {
@@ -5,7 +5,10 @@ PDF 파일의 DRM 판별 및 해제 기능 제공
 
 import os
 import io
+import mmap
 import requests
+import threading
+from urllib3.util.retry import Retry
 from typing import Dict, Union, Tuple, Optional
 from pathlib import Path
 import logging
@@ -16,6 +19,42 @@ logger = logging.getLogger(__name__)
 # ========================================
 # DRM 판별 함수
 # ========================================
+def _scan_pdf_bytes(content) -> Optional[Dict[str, any]]:
+    """
+    바이트 검색으로 DRM 확정 가능 여부 판별 (bytes 또는 mmap)
+    
+    Returns:
+        확정되면 판별 결과 항목 dict, 파서 확인이 필요하면 None
+    """
+    # 🆕 앞 1KB 안에 PDF 헤더가 전혀 없으면 PDF가 아님 (DRM 암호화 파일) → PyPDF2/PyMuPDF 파싱 생략
+    #    (PDF 규격상 헤더는 첫 1024바이트 안에 있으면 됨 - 그 경우는 파서 확인 계속)
+    header = content[:1024]
+    if b'%PDF' not in header:
+        logger.warning("🔒 PDF 헤더 없음 - DRM으로 처리 (파서 확인 생략)")
+        return {
+            "is_drm": True,
+            "method": "PDF 헤더 없음 (DRM 가능)",
+            "confidence": "medium",
+            "details": {"is_pdf": False}
+        }
+    
+    # PDF 헤더 확인 (앞에 다른 바이트가 있으면 계속 진행)
+    if not header.startswith(b'%PDF'):
+        logger.warning("⚠️ PDF 헤더 없음 - DRM 가능성 높음")
+        return None
+    
+    # /Encrypt 플래그 확인 (find는 C 수준 바이트 검색)
+    if content.find(b'/Encrypt') != -1:
+        logger.info("🔒 DRM 확정: /Encrypt 플래그")
+        return {
+            "is_drm": True,
+            "method": "바이너리 /Encrypt",
+            "confidence": "high"
+        }
+    
+    return None
+
+
 def detect_drm(file_input: Union[str, io.BytesIO]) -> Dict[str, any]:
     """
     DRM 판별 - 확실한 방법만 사용 (개선)
@@ -28,8 +67,37 @@ def detect_drm(file_input: Union[str, io.BytesIO]) -> Dict[str, any]:
     }
     
     # ========================================
-    # 방법 1: PyPDF2 암호화 플래그 (100% 확실)
+    # 방법 1: 바이너리 /Encrypt 플래그 (거의 확실)
+    # 🆕 바이트 검색이 가장 저렴하므로 먼저 확인 - /Encrypt가 있으면 PyPDF2 파싱 없이 확정
+    #    (/Encrypt는 보통 파일 끝 trailer에 있으므로 앞부분만이 아니라 전체를 검색)
     # ========================================
+    try:
+        if isinstance(file_input, str):
+            # 🆕 경로 입력은 mmap으로 검색 (파일 전체를 bytes로 복사하지 않음)
+            with open(file_input, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    verdict = _scan_pdf_bytes(b'')  # 빈 파일은 mmap 불가
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        verdict = _scan_pdf_bytes(content)
+        else:
+            # bytes로 만든 BytesIO는 처음부터 전체를 읽으면 원본 bytes를 복사 없이 반환
+            file_input.seek(0)
+            content = file_input.read()
+            file_input.seek(0)
+            verdict = _scan_pdf_bytes(content)
+        
+        if verdict is not None:
+            result.update(verdict)
+            return result
+    
+    except Exception as e:
+        logger.debug(f"바이너리 확인 실패: {e}")
+    
+    # ========================================
+    # 방법 2: PyPDF2 암호화 플래그 (100% 확실)
+    # ========================================
+    f = None
     try:
         import PyPDF2
         
@@ -52,39 +120,26 @@ def detect_drm(file_input: Union[str, io.BytesIO]) -> Dict[str, any]:
             logger.info("🔒 DRM 확정: PyPDF2 암호화 플래그")
             return result
         
+        # 🆕 PyPDF2가 페이지까지 정상으로 읽었고 암호화도 없으면 확정 (PyMuPDF 재확인은 PyPDF2 실패 시에만)
+        page_count = len(reader.pages)
+        
         if isinstance(file_input, str):
             f.close()
-    
-    except Exception as e:
-        logger.debug(f"PyPDF2 확인 실패: {e}")
-    
-    # ========================================
-    # 방법 2: 바이너리 /Encrypt 플래그 (거의 확실)
-    # ========================================
-    try:
-        if isinstance(file_input, str):
-            with open(file_input, 'rb') as f:
-                content = f.read()
         else:
             file_input.seek(0)
-            content = file_input.read()
-            file_input.seek(0)
         
-        # PDF 헤더 확인 (없어도 계속 진행)
-        if not content.startswith(b'%PDF'):
-            logger.warning("⚠️ PDF 헤더 없음 - DRM 가능성 높음")
-        else:
-            # /Encrypt 플래그 확인
-            if b'/Encrypt' in content:
-                result["is_drm"] = True
-                result["method"] = "바이너리 /Encrypt"
-                result["confidence"] = "high"
-                
-                logger.info("🔒 DRM 확정: /Encrypt 플래그")
-                return result
+        result["is_drm"] = False
+        result["method"] = "PyPDF2 정상 (암호화 없음)"
+        result["confidence"] = "high"
+        result["details"]["page_count"] = page_count
+        
+        logger.info(f"✅ DRM 없음: PyPDF2 정상 ({page_count} 페이지)")
+        return result
     
     except Exception as e:
-        logger.debug(f"바이너리 확인 실패: {e}")
+        if isinstance(file_input, str) and f is not None:
+            f.close()
+        logger.debug(f"PyPDF2 확인 실패: {e}")
     
     # ========================================
     # 방법 3: PyMuPDF로 파일 열기 시도 (최종 확인)
@@ -137,6 +192,52 @@ def detect_drm(file_input: Union[str, io.BytesIO]) -> Dict[str, any]:
 # DRM 해제 함수
 # ========================================
 
+# 🆕 DRM API 연결 재사용 (keep-alive로 파일마다 TCP/TLS 핸드셰이크 반복 없음)
+DRM_HTTP_POOL_SIZE = 8
+# 🆕 연결 실패/일시적 서버 오류만 재시도 (응답 대기 타임아웃은 재시도하지 않음 - 30초 제한 유지)
+DRM_HTTP_RETRY = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"POST"}),  # 해제 요청은 재전송해도 안전
+    raise_on_status=False  # 재시도 소진 시 마지막 응답을 그대로 반환 (기존 상태 코드 처리 유지)
+)
+_drm_session = None
+_drm_session_lock = threading.Lock()
+
+
+def _get_drm_session() -> requests.Session:
+    """DRM API 공용 requests.Session (최초 1회 생성)"""
+    global _drm_session
+    if _drm_session is None:
+        with _drm_session_lock:
+            if _drm_session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=DRM_HTTP_POOL_SIZE,
+                    max_retries=DRM_HTTP_RETRY
+                )
+                session.mount("https://", adapter)
+                _drm_session = session
+    return _drm_session
+
+
+def _post_drm_file(api_url: str, file_name: str, file_obj, headers: Dict[str, str]) -> requests.Response:
+    """DRM 해제 API 호출 (멀티파트 폼 데이터, 파일 객체 전달)"""
+    files = {
+        'formFile': (file_name, file_obj, 'application/pdf')
+    }
+    
+    return _get_drm_session().post(
+        api_url,
+        files=files,
+        headers=headers,
+        timeout=30
+    )
+
+
 def decrypt_drm_file(
     file_input: Union[str, io.BytesIO],
     api_url: str = "https://cnr.kolmar.co.kr/api/services/app/Crypt/FileThirdPartyDecryption",
@@ -154,36 +255,28 @@ def decrypt_drm_file(
         Tuple[bool, Union[bytes, str]]: (성공여부, 해제된파일bytes or 오류메시지)
     """
     try:
-        # 파일 데이터 준비
+        # 헤더 설정
+        headers = {}
+        if api_key:
+            headers["Authorization"] = f"Bearer {api_key}"
+        
+        # 🆕 파일 데이터를 미리 bytes로 읽지 않고 파일 객체를 그대로 전달 (requests가 멀티파트 인코딩 시 읽음)
         if isinstance(file_input, str):
             file_name = os.path.basename(file_input)
+            logger.info(f"DRM 해제 요청: {file_name} ({os.path.getsize(file_input):,} bytes)")
+            
             with open(file_input, 'rb') as f:
-                file_bytes = f.read()
+                response = _post_drm_file(api_url, file_name, f, headers)
         else:
             file_name = "uploaded_file.pdf"
+            file_size = file_input.seek(0, io.SEEK_END)
+            logger.info(f"DRM 해제 요청: {file_name} ({file_size:,} bytes)")
+            
             file_input.seek(0)
-            file_bytes = file_input.read()
-            file_input.seek(0)
-        
-        logger.info(f"DRM 해제 요청: {file_name} ({len(file_bytes):,} bytes)")
-        
-        # 멀티파트 폼 데이터
-        files = {
-            'formFile': (file_name, file_bytes, 'application/pdf')
-        }
-        
-        # 헤더 설정
-        headers = {}
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
-        
-        # API 호출
-        response = requests.post(
-            api_url,
-            files=files,
-            headers=headers,
-            timeout=30
-        )
+            try:
+                response = _post_drm_file(api_url, file_name, file_input, headers)
+            finally:
+                file_input.seek(0)
         
         logger.info(f"DRM 해제 응답: {response.status_code}")
         
@@ -299,15 +392,11 @@ def process_streamlit_uploaded_file(
             (성공여부, 처리된파일BytesIO or 오류메시지)
     """
     try:
-        # UploadedFile을 BytesIO로 변환
+        # 🆕 UploadedFile은 BytesIO 기반이므로 복사본 없이 그대로 전달 (처음 위치로만 되감기)
         uploaded_file.seek(0)
-        file_bytes = uploaded_file.read()
-        uploaded_file.seek(0)
-        
-        file_io = io.BytesIO(file_bytes)
         
         # DRM 처리
-        return process_pdf_with_drm(file_io, api_url, api_key)
+        return process_pdf_with_drm(uploaded_file, api_url, api_key)
     
     except Exception as e:
         error_msg = f"업로드 파일 처리 중 오류: {e}"